@@ -0,0 +1,62 @@
+"""
+ConsoleDialogs text fallbacks, as used when the session is not interactive.
+"""
+import io
+from contextlib import redirect_stdout
+from itertools import repeat
+
+from harness import benchmark, main
+
+from econsole.dialogs import ConsoleDialogs
+from econsole.input_source import ScriptedInput, use_input_source
+from econsole.terminal import ColorDepth, TerminalProfile, get_terminal_profile, set_terminal_profile
+
+_HEADLESS: TerminalProfile = TerminalProfile(is_tty=False, is_interactive=False, color_depth=ColorDepth.NONE)
+# Profiles replaced by _headless, restored by _restore_profile once each benchmark is measured
+_saved_profiles: list[TerminalProfile] = []
+
+
+def _headless(function, answer: str):
+    _saved_profiles.append(get_terminal_profile())
+    set_terminal_profile(_HEADLESS)
+
+    def run():
+        with use_input_source(ScriptedInput(repeat(answer))), redirect_stdout(io.StringIO()):
+            return function()
+
+    return run
+
+
+def _restore_profile(_):
+    set_terminal_profile(_saved_profiles.pop())
+
+
+@benchmark("dialogs.show_message_box", teardown=_restore_profile)
+def show_message_box(_):
+    return _headless(lambda: ConsoleDialogs.show_message_box("Title", "Some message"), "")
+
+
+@benchmark("dialogs.show_input_dialog", teardown=_restore_profile)
+def show_input_dialog(_):
+    return _headless(lambda: ConsoleDialogs.show_input_dialog("Title", "Your name"), "someone")
+
+
+@benchmark("dialogs.confirm_dialog", teardown=_restore_profile)
+def confirm_dialog(_):
+    return _headless(lambda: ConsoleDialogs.confirm_dialog("Title", "Sure?"), "y")
+
+
+@benchmark("dialogs.buttons_dialog", params=(2, 10, 100), teardown=_restore_profile)
+def buttons_dialog(count: int):
+    buttons: list[tuple[str, int]] = [(f"Button {index}", index) for index in range(count)]
+    return _headless(lambda: ConsoleDialogs.buttons_dialog("Title", "Pick one", buttons), "0")
+
+
+@benchmark("dialogs.radio_buttons_dialog", params=(2, 10, 100), teardown=_restore_profile)
+def radio_buttons_dialog(count: int):
+    buttons: list[tuple[str, int]] = [(f"Button {index}", index) for index in range(count)]
+    return _headless(lambda: ConsoleDialogs.radio_buttons_dialog("Title", "Pick one", *buttons), "0")
+
+
+if __name__ == "__main__":
+    main(["dialogs.*"])
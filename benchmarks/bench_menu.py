@@ -0,0 +1,213 @@
+"""
+Menu construction and rendering with 10 to 100k items.
+"""
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from itertools import repeat
+from unittest.mock import patch
+
+from harness import benchmark, main
+
+from econsole.input_source import ScriptedInput, Transcript, use_input_source
+from econsole.menu_builder import AbstractMenu, MenuItem, _cached_menu, build_menu
+from econsole.menu_stream import StreamingMenu
+
+SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000, 100_000)
+
+
+class _Menu(AbstractMenu):
+    def initialise(self):
+        pass
+
+
+def _items(count: int) -> list[MenuItem]:
+    items: list[MenuItem] = [MenuItem(index, f"Item number {index}") for index in range(count)]
+    items[-1].set_as_exit_option()
+    return items
+
+
+def _menu(count: int) -> AbstractMenu:
+    menu: AbstractMenu = _Menu("Benchmark")
+    for item in _items(count):
+        menu.add_menu_item(item)
+    return menu
+
+
+@benchmark("menu.build", params=SIZES)
+def build(count: int):
+    return lambda: _menu(count)
+
+
+@benchmark("menu.display", params=SIZES)
+def display(count: int):
+    menu: AbstractMenu = _menu(count)
+    answer: str = str(count - 1)
+
+    def run():
+        with patch("builtins.input", return_value=answer), redirect_stdout(io.StringIO()):
+            menu.display()
+
+    return run
+
+
+@benchmark("menu.redisplay", params=SIZES)
+def redisplay(count: int):
+    menu: AbstractMenu = _menu(count)
+    # Each invalid answer displays the unchanged menu again
+    answers: list[str] = ["invalid"] * 10 + [str(count - 1)]
+
+    def run():
+        with patch("builtins.input", side_effect=answers), redirect_stdout(io.StringIO()):
+            menu.display()
+
+    return run
+
+
+@benchmark("menu.display_paged", params=SIZES)
+def display_paged(count: int):
+    menu: AbstractMenu = _menu(count)
+    menu.page_size = 20
+    answer: str = str(count - 1)
+
+    def run():
+        with patch("builtins.input", return_value=answer), redirect_stdout(io.StringIO()):
+            menu.display()
+
+    return run
+
+
+@benchmark("menu.search_as_you_type", params=SIZES)
+def search_as_you_type(count: int):
+    menu: AbstractMenu = _menu(count)
+    query: str = f"number {count // 2}"
+    menu.search_menu_items(query)  # builds the index
+
+    def run():
+        # One search per typed character, as with an interactive filter
+        for length in range(1, len(query) + 1):
+            menu.search_menu_items(query[:length])
+
+    return run
+
+
+@benchmark("menu.toggle_visibility", params=SIZES)
+def toggle_visibility(count: int):
+    menu: AbstractMenu = _menu(count)
+    middle: int = count // 2
+
+    def run():
+        menu.hide_menu_item(middle)
+        menu.show_menu_item(middle)
+
+    return run
+
+
+@benchmark("menu.navigate_depth", params=(10, 100, 1_000, 10_000))
+def navigate_depth(depth: int):
+    # A chain of submenus entered through exit options: the last exit leaves every menu
+    menus: list[AbstractMenu] = [_Menu(f"Level {level}") for level in range(depth)]
+    for menu, submenu in zip(menus, menus[1:]):
+        menu.add_menu_item(MenuItem(0, "Deeper", menu=submenu).set_as_exit_option())
+    menus[-1].add_menu_item(MenuItem(0, "Exit").set_as_exit_option())
+
+    def run():
+        with patch("builtins.input", return_value="0"), redirect_stdout(io.StringIO()):
+            menus[0].display()
+
+    return run
+
+
+@benchmark("menu.build_menu", params=(2, 10, 100))
+def build_menu_(count: int):
+    buttons: list[tuple[str, int]] = [(f"Button {index}", index) for index in range(count)]
+
+    def run():
+        with use_input_source(ScriptedInput(repeat("0"))), redirect_stdout(io.StringIO()):
+            return build_menu("Benchmark", "Pick one", buttons)
+
+    return run
+
+
+@benchmark("menu.build_menu_uncached", params=(2, 10, 100))
+def build_menu_uncached(count: int):
+    # build_menu as if every call had new buttons
+    buttons: list[tuple[str, int]] = [(f"Button {index}", index) for index in range(count)]
+
+    def run():
+        _cached_menu.cache_clear()
+        with use_input_source(ScriptedInput(repeat("0"))), redirect_stdout(io.StringIO()):
+            return build_menu("Benchmark", "Pick one", buttons)
+
+    return run
+
+
+@benchmark("menu.stream_first_page", params=SIZES)
+def stream_first_page(count: int):
+    # Displays two pages and exits: only the first pages of the provider are read
+    def rows():
+        yield MenuItem(0, "Exit").set_as_exit_option()
+        for index in range(1, count):
+            yield MenuItem(index, f"Item number {index}")
+
+    def run():
+        with patch("builtins.input", side_effect=["n", "p", "0"]), redirect_stdout(io.StringIO()):
+            menu: StreamingMenu = StreamingMenu("Benchmark", rows, page_size=20)
+            menu.display()
+            menu.close()
+
+    return run
+
+
+def _session(interactions: int) -> tuple[AbstractMenu, list[str]]:
+    # Headless operator workflow: a submenu entered and left, pages and filters
+    submenu: AbstractMenu = _Menu("Details")
+    submenu.add_menu_item(MenuItem(0, "Back").set_as_exit_option())
+    menu: AbstractMenu = _Menu("Benchmark", page_size=20)
+    menu.add_menu_item(MenuItem(0, "Details", menu=submenu))
+    for item in _items(1_000)[1:]:
+        menu.add_menu_item(item)
+    steps: list[str] = (["0", "0", "n", "p", "/number 5", "/"] * interactions)[: interactions - 1] + ["999"]
+    return menu, steps
+
+
+@benchmark("menu.scripted_session", params=(10, 100, 1_000, 10_000))
+def scripted_session(interactions: int):
+    menu, steps = _session(interactions)
+
+    def run():
+        with use_input_source(ScriptedInput(steps, Transcript())), redirect_stdout(io.StringIO()):
+            menu.display()
+
+    return run
+
+
+@benchmark("menu.scripted_session_async", params=(10, 100, 1_000, 10_000))
+def scripted_session_async(interactions: int):
+    menu, steps = _session(interactions)
+
+    def run():
+        with use_input_source(ScriptedInput(steps, Transcript())), redirect_stdout(io.StringIO()):
+            asyncio.run(menu.display_async())
+
+    return run
+
+
+_POOL: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+
+
+@benchmark("menu.run_action", params=("inline", "thread_pool"))
+def run_action(mode: str):
+    # Overhead of running a trivial action on an executor, spinner included
+    menu_item: MenuItem = MenuItem(0, "Action", abs, action_args=(-1,), executor=_POOL if mode == "thread_pool" else None)
+
+    def run():
+        with redirect_stdout(io.StringIO()):
+            return menu_item.run()
+
+    return run
+
+
+if __name__ == "__main__":
+    main(["menu.*"])
@@ -0,0 +1,94 @@
+"""
+Print chains of varying length, compiled templates and bulk output.
+"""
+from __future__ import annotations
+
+import io
+from typing import Any
+
+from harness import benchmark, main
+
+from econsole.colors import Color4Bits
+from econsole.styles import ConsoleCharacters, Print
+from econsole.terminal import ColorDepth, ColorMode, TerminalProfile, set_color_mode, set_terminal_profile
+
+set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=ColorDepth.TRUECOLOR))
+set_color_mode(ColorMode.ALWAYS)
+
+
+def _chain(length: int) -> Print:
+    line: Print = Print()
+    for index in range(length):
+        line.bold().set_fore_red().add("error").reset().set_foreground_24bits(index % 256, 128, 64).add(index)
+    return line
+
+
+class _LegacyPrint:
+    """
+    The Print chain before spans: every call appends its escape sequence as is, and rendering joins them.
+    """
+
+    __slots__ = ("_string",)
+
+    def __init__(self):
+        self._string: list[str] = []
+
+    def add(self, data: Any) -> _LegacyPrint:
+        return self._short(repr(data) if not isinstance(data, str) else data + " ")
+
+    def bold(self) -> _LegacyPrint:
+        return self._short(ConsoleCharacters.set_bold())
+
+    def set_fore_red(self) -> _LegacyPrint:
+        return self._short(ConsoleCharacters.set_foreground_4bits(Color4Bits.RED))
+
+    def reset(self) -> _LegacyPrint:
+        return self._short(ConsoleCharacters.reset())
+
+    def render(self) -> str:
+        return "".join(self._string).strip()
+
+    def _short(self, s: str) -> _LegacyPrint:
+        self._string.append(s)
+        return self
+
+
+@benchmark("print.short_chain", params=("legacy", "spans"))
+def short_chain(variant: str):
+    line_type: type = _LegacyPrint if variant == "legacy" else Print
+    return lambda: line_type().bold().set_fore_red().add("x").reset().render()
+
+
+@benchmark("print.chain", params=(1, 10, 100, 1000))
+def chain(length: int):
+    return lambda: _chain(length).render()
+
+
+@benchmark("print.render_html", params=(1, 10, 100, 1000))
+def render_html(length: int):
+    line: Print = _chain(length)
+    return line.render_html
+
+
+@benchmark("print.template", params=("chain", "compiled"))
+def template(variant: str):
+    if variant == "chain":
+        return lambda: Print().bold().set_fore_red().add("ERROR").reset().add("request").add(42).render()
+    compiled = Print().bold().set_fore_red().placeholder("level").reset().add("request").placeholder("value").compile()
+    return lambda: compiled.render(level="ERROR", value=42)
+
+
+@benchmark("print.print_many", params=(10, 1000))
+def print_many(count: int):
+    records: list[Print] = [_chain(1) for _ in range(count)]
+    return lambda: Print.print_many(records, io.StringIO())
+
+
+@benchmark("print.no_color_chain", params=(1, 10, 100, 1000), teardown=lambda _: set_color_mode(ColorMode.ALWAYS))
+def no_color_chain(length: int):
+    set_color_mode(ColorMode.NEVER)
+    return lambda: _chain(length).render()
+
+
+if __name__ == "__main__":
+    main(["print.*"])
@@ -0,0 +1,68 @@
+"""
+Escape generation: the public ConsoleCharacters methods, as callers use them, vs. the pre-table per-call string building.
+"""
+from harness import benchmark, main
+
+from econsole import sequences
+from econsole.colors import Color4Bits
+from econsole.styles import ConsoleCharacters
+from econsole.terminal import ColorDepth, ColorMode, TerminalProfile, set_color_mode, set_terminal_profile
+
+set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=ColorDepth.TRUECOLOR))
+set_color_mode(ColorMode.ALWAYS)
+
+
+def _legacy_set_foreground_4bits(code: Color4Bits | int | str) -> str:
+    if isinstance(code, Color4Bits):
+        code: str = str(code.value[0])
+
+    return f"\u001b[{code}m"
+
+
+def _legacy_set_foreground_8bits(value: int) -> str:
+    return f"\u001b[38;5;{value}m"
+
+
+def _legacy_set_foreground_32bits(r: int, g: int, b: int) -> str:
+    return f"\u001b[38;2;{r};{g};{b}m"
+
+
+def _legacy_move_cursor_at_absolute(x: int, y: int) -> str:
+    return f"\u001b[{x};{y}H"
+
+
+@benchmark("sequences.set_bold", params=("method", "constant"))
+def set_bold(variant: str):
+    return ConsoleCharacters.set_bold if variant == "method" else lambda: sequences.BOLD
+
+
+@benchmark("sequences.set_foreground_4bits", params=("legacy", "method"))
+def set_foreground_4bits(variant: str):
+    if variant == "legacy":
+        return lambda: _legacy_set_foreground_4bits(Color4Bits.RED)
+    return lambda: ConsoleCharacters.set_foreground_4bits(Color4Bits.RED)
+
+
+@benchmark("sequences.set_foreground_8bits", params=("legacy", "method"))
+def set_foreground_8bits(variant: str):
+    if variant == "legacy":
+        return lambda: _legacy_set_foreground_8bits(208)
+    return lambda: ConsoleCharacters.set_foreground_8bits(208)
+
+
+@benchmark("sequences.set_foreground_32bits", params=("legacy", "method"))
+def set_foreground_32bits(variant: str):
+    if variant == "legacy":
+        return lambda: _legacy_set_foreground_32bits(12, 200, 255)
+    return lambda: ConsoleCharacters.set_foreground_32bits(12, 200, 255)
+
+
+@benchmark("sequences.move_cursor_at_absolute", params=("legacy", "method"))
+def move_cursor_at_absolute(variant: str):
+    if variant == "legacy":
+        return lambda: _legacy_move_cursor_at_absolute(12, 40)
+    return lambda: ConsoleCharacters.move_cursor_at_absolute(12, 40)
+
+
+if __name__ == "__main__":
+    main(["sequences.*"])
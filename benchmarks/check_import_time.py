@@ -0,0 +1,83 @@
+"""
+Import-time regression check: imports each module in a fresh interpreter with ``python -X importtime``,
+reports its cumulative import time and fails when it loads a module it should not
+(e.g. ``econsole.styles`` loading prompt_toolkit). ::
+
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --max-ms 150
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Sequence
+
+_SOURCES: Path = Path(__file__).resolve().parent.parent / "src"
+
+_HEAVY: tuple[str, ...] = ("prompt_toolkit", "empire_commons", "asyncio")
+
+# Module to import -> modules it must not load
+EXPECTATIONS: dict[str, tuple[str, ...]] = {
+    "econsole": _HEAVY + ("econsole.styles", "econsole.dialogs", "econsole.menu_builder"),
+    "econsole.styles": _HEAVY,
+    "econsole.logging_handler": _HEAVY,
+    "econsole.screen": _HEAVY,
+    "econsole.dialogs": _HEAVY,
+    "econsole.input_source": _HEAVY,
+}
+
+
+def import_times(module: str) -> dict[str, int]:
+    """
+    Returns the cumulative import time, in microseconds, of every module loaded by ``import module``.
+    """
+    environment: dict[str, str] = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, (str(_SOURCES), environment.get("PYTHONPATH"))))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, env=environment, check=True
+    )
+
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def check(modules: Sequence[str], max_ms: float | None = None) -> list[str]:
+    """
+    Returns the failures, one line each.
+    """
+    failures: list[str] = []
+    for module in modules:
+        times: dict[str, int] = import_times(module)
+        milliseconds: float = times.get(module, 0) / 1000
+        print(f"{module:<32} {milliseconds:8.1f} ms")
+
+        loaded: list[str] = [name for name in EXPECTATIONS.get(module, ()) if name in times]
+        if loaded:
+            failures.append(f"{module} loads {', '.join(loaded)}")
+        if max_ms is not None and milliseconds > max_ms:
+            failures.append(f"{module} takes {milliseconds:.1f} ms to import (limit: {max_ms} ms)")
+    return failures
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="econsole import-time check")
+    parser.add_argument("modules", nargs="*", default=list(EXPECTATIONS), help="modules to import")
+    parser.add_argument("--max-ms", type=float, help="fail when a module takes longer to import")
+    arguments = parser.parse_args(argv)
+
+    failures: list[str] = check(arguments.modules, arguments.max_ms)
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
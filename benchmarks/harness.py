@@ -0,0 +1,125 @@
+"""
+Minimal benchmark harness: benchmarks register through :func:`benchmark`, results are stored as JSON
+so that runs can be compared across commits.
+
+Run every benchmark with ``python benchmarks/run.py``, see ``--help`` for filtering, saving and comparing.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+from statistics import median
+from timeit import Timer
+from typing import Any, Callable, Sequence
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Callable[[Any], Callable[[], Any]]
+    params: Sequence[Any]
+    teardown: Callable[[Any], None] | None = None
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, params: Sequence[Any] = (None,), teardown: Callable[[Any], None] | None = None) -> Callable:
+    """
+    Registers a benchmark. The decorated function receives a parameter and returns the callable to time;
+    everything it does before returning is setup and is not measured. ``teardown`` is called with the parameter once measured.
+    """
+
+    def decorator(setup: Callable[[Any], Callable[[], Any]]) -> Callable[[Any], Callable[[], Any]]:
+        BENCHMARKS[name] = Benchmark(name, setup, tuple(params), teardown)
+        return setup
+
+    return decorator
+
+
+def measure(function: Callable[[], Any], repeat: int = 5, min_time: float = 0.2) -> dict[str, float]:
+    """
+    Returns the best and median time of one call, in seconds, over ``repeat`` rounds of at least ``min_time`` seconds.
+    """
+    timer: Timer = Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    timings: list[float] = [time / number for time in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(timings), "median": median(timings), "number": number}
+
+
+def run(patterns: Sequence[str] = ("*",), repeat: int = 5, min_time: float = 0.2) -> dict[str, dict[str, dict[str, float]]]:
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for name, registered in BENCHMARKS.items():
+        if not any(fnmatch(name, pattern) for pattern in patterns):
+            continue
+
+        results[name] = {}
+        for param in registered.params:
+            try:
+                results[name][str(param)] = measure(registered.setup(param), repeat, min_time)
+            finally:
+                if registered.teardown is not None:
+                    registered.teardown(param)
+            print(f"{name:<48} {str(param):>10}   {_format_time(results[name][str(param)]['best'])}", file=sys.stderr)
+    return results
+
+
+def compare(previous: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """
+    Returns one line per benchmark present in both runs, with the ratio of the current best time over the previous one.
+    """
+    lines: list[str] = []
+    for name, params in current["results"].items():
+        for param, result in params.items():
+            before: dict[str, float] | None = previous["results"].get(name, {}).get(param)
+            if before is None:
+                continue
+            ratio: float = result["best"] / before["best"]
+            lines.append(f"{name:<48} {param:>10}   {_format_time(before['best'])} -> {_format_time(result['best'])}   x{ratio:.2f}")
+    return lines
+
+
+def main(argv: Sequence[str] | None = None):
+    parser = argparse.ArgumentParser(description="econsole benchmarks")
+    parser.add_argument("patterns", nargs="*", default=["*"], help="glob patterns of the benchmarks to run")
+    parser.add_argument("--output", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="compare the results with this previous JSON file")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum duration of a round, in seconds")
+    arguments = parser.parse_args(argv)
+
+    report: dict[str, Any] = {
+        "commit": _git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": run(arguments.patterns, arguments.repeat, arguments.min_time),
+    }
+
+    if arguments.output is not None:
+        arguments.output.parent.mkdir(parents=True, exist_ok=True)
+        arguments.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if arguments.compare is not None:
+        print("\n".join(compare(json.loads(arguments.compare.read_text(encoding="utf-8")), report)))
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e3), ("us", 1e6)):
+        if seconds * factor >= 1:
+            return f"{seconds * factor:8.3f} {unit}"
+    return f"{seconds * 1e9:8.3f} ns"
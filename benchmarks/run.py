@@ -0,0 +1,17 @@
+"""
+Runs the benchmark suite. Example: ::
+
+    python benchmarks/run.py --output .benchmarks/$(git rev-parse --short HEAD).json
+    python benchmarks/run.py "print.*" --compare .benchmarks/previous.json
+"""
+from importlib import import_module
+from pathlib import Path
+
+from harness import main
+
+for module in sorted(Path(__file__).parent.glob("bench_*.py")):
+    import_module(module.stem)
+
+
+if __name__ == "__main__":
+    main()
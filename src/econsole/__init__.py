@@ -0,0 +1,90 @@
+"""
+Console utility functions.
+
+Submodules and their main classes are imported on first access, so ``import econsole`` stays cheap
+and only the modules actually used are loaded (``dialogs`` pulls in prompt_toolkit for instance).
+"""
+from importlib import import_module
+
+_SUBMODULES: frozenset[str] = frozenset(
+    (
+        "background",
+        "colors",
+        "dialogs",
+        "input_source",
+        "logging_handler",
+        "menu_builder",
+        "menu_stream",
+        "output",
+        "screen",
+        "search",
+        "sequences",
+        "sgr",
+        "spans",
+        "styles",
+        "terminal",
+        "width",
+    )
+)
+
+# Lazy attribute -> module defining it
+_ATTRIBUTES: dict[str, str] = {
+    "ActionCancelledError": "background",
+    "Progress": "background",
+    "run_in_background": "background",
+    "Color4Bits": "colors",
+    "ConsoleDialogs": "dialogs",
+    "ConsoleInput": "input_source",
+    "InputSource": "input_source",
+    "ReplayInput": "input_source",
+    "ScriptedInput": "input_source",
+    "StreamInput": "input_source",
+    "Transcript": "input_source",
+    "use_input_source": "input_source",
+    "ColorHandler": "logging_handler",
+    "AbstractMenu": "menu_builder",
+    "MenuItem": "menu_builder",
+    "MenuItems": "menu_builder",
+    "MenuNavigator": "menu_builder",
+    "build_menu": "menu_builder",
+    "MenuItemStream": "menu_stream",
+    "StreamingMenu": "menu_stream",
+    "FlushPolicy": "output",
+    "OutputBuffer": "output",
+    "ScreenBuffer": "screen",
+    "TrigramIndex": "search",
+    "CellAttributes": "sgr",
+    "ConsoleCharacters": "styles",
+    "Print": "styles",
+    "PrintTemplate": "styles",
+    "timed_print": "styles",
+    "timed_print_async": "styles",
+    "ColorDepth": "terminal",
+    "ColorMode": "terminal",
+    "TerminalProfile": "terminal",
+    "get_terminal_profile": "terminal",
+    "set_color_mode": "terminal",
+    "set_terminal_profile": "terminal",
+    "pad": "width",
+    "strip_ansi": "width",
+    "visible_width": "width",
+}
+
+__all__ = sorted(_SUBMODULES | _ATTRIBUTES.keys())
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+
+    module_name: str | None = _ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: object = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | set(__all__))
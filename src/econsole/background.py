@@ -0,0 +1,153 @@
+"""
+Runs menu actions on an executor (thread or process pool) while a spinner or progress line is displayed.
+
+Only :class:`ActionCancelledError` and :class:`Progress` are needed by the menu builder on import:
+concurrent.futures and the terminal profile are imported on the first run.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from threading import Event
+from typing import TYPE_CHECKING, Any, Callable
+
+from econsole.sequences import CLEAR_LINE
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+SPINNER_FRAMES: str = "|/-\\"
+# Seconds between two updates of the spinner line
+REFRESH_INTERVAL: float = 0.1
+
+
+class ActionCancelledError(Exception):
+    """
+    Raised when the user cancels an action running in the background.
+    """
+
+    def __init__(self, description: str):
+        super().__init__(f"Cancelled: {description}")
+        self.description = description
+
+
+class Progress:
+    """
+    Passed as ``progress`` keyword argument to the actions of items created with ``report_progress=True``.
+    Updated from the action's thread, read by the spinner line; thread executors only, as it cannot be pickled.
+
+    Cancelling cannot stop a running thread: long actions check :attr:`cancelled` and return early.
+    """
+
+    __slots__ = ("fraction", "message", "_cancelled")
+
+    def __init__(self):
+        self.fraction: float | None = None
+        self.message: str = ""
+        self._cancelled: Event = Event()
+
+    def update(self, fraction: float | None = None, message: str | None = None):
+        """
+        :param fraction: the part done, from 0 to 1
+        """
+        if fraction is not None:
+            self.fraction = min(1.0, max(0.0, fraction))
+        if message is not None:
+            self.message = message
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+
+def run_in_background(
+    executor: Executor, description: str, function: Callable, args: tuple = (), kwargs: dict[str, Any] | None = None, progress: Progress | None = None
+) -> Any:
+    """
+    Runs ``function(*args, **kwargs)`` on ``executor`` and returns its result, displaying a spinner line until it is done.
+    Exceptions raised by ``function`` are raised here, once.
+
+    :raises ActionCancelledError: when the user presses Ctrl+C; the function's result is then dropped
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import wait as wait_futures
+
+    from econsole.terminal import get_terminal_profile
+
+    future: Future = executor.submit(function, *args, **(kwargs or {}))
+    started: float = time.monotonic()
+    frame: int = 0
+    try:
+        if not get_terminal_profile().is_tty:
+            _write(f"{description}...\n")
+        while not wait_futures((future,), timeout=REFRESH_INTERVAL).done:
+            if get_terminal_profile().is_tty:
+                _write(f"\r{CLEAR_LINE}{status_line(description, time.monotonic() - started, progress, frame)}")
+                frame += 1
+    except KeyboardInterrupt:
+        _cancel(future, progress)
+        raise ActionCancelledError(description) from None
+    finally:
+        if frame:
+            _write(f"\r{CLEAR_LINE}")
+    return future.result()
+
+
+async def run_in_background_async(
+    executor: Executor, description: str, function: Callable, args: tuple = (), kwargs: dict[str, Any] | None = None, progress: Progress | None = None
+) -> Any:
+    """
+    Same as :func:`run_in_background`, without blocking the event loop. Cancelling the awaiting task (Ctrl+C under
+    :func:`asyncio.run`) cancels the action and propagates.
+    """
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+
+    from econsole.terminal import get_terminal_profile
+
+    future: Future = executor.submit(function, *args, **(kwargs or {}))
+    waited: asyncio.Future = asyncio.wrap_future(future)
+    started: float = time.monotonic()
+    frame: int = 0
+    try:
+        if not get_terminal_profile().is_tty:
+            _write(f"{description}...\n")
+        while not (await asyncio.wait((waited,), timeout=REFRESH_INTERVAL))[0]:
+            if get_terminal_profile().is_tty:
+                _write(f"\r{CLEAR_LINE}{status_line(description, time.monotonic() - started, progress, frame)}")
+                frame += 1
+    except asyncio.CancelledError:
+        _cancel(future, progress)
+        raise
+    finally:
+        if frame:
+            _write(f"\r{CLEAR_LINE}")
+    return waited.result()
+
+
+def status_line(description: str, elapsed: float, progress: Progress | None = None, frame: int = 0) -> str:
+    """
+    Returns the text of the spinner line, e.g. ``| Exporting 42% rows 4200/10000 (3.1s, Ctrl+C to cancel)``.
+    """
+    parts: list[str] = [SPINNER_FRAMES[frame % len(SPINNER_FRAMES)], description]
+    if progress is not None and progress.fraction is not None:
+        parts.append(f"{progress.fraction:.0%}")
+    if progress is not None and progress.message:
+        parts.append(progress.message)
+    parts.append(f"({elapsed:.1f}s, Ctrl+C to cancel)")
+    return " ".join(parts)
+
+
+def _cancel(future: Future, progress: Progress | None):
+    # Only works before the action starts; once started, only actions checking progress.cancelled stop early
+    future.cancel()
+    if progress is not None:
+        progress.cancel()
+
+
+def _write(text: str):
+    sys.stdout.write(text)
+    sys.stdout.flush()
@@ -0,0 +1,159 @@
+"""
+Color definitions and quantisation of truecolor values down to the xterm 256 and 16 colors palettes.
+"""
+from enum import Enum
+from functools import lru_cache
+from itertools import starmap
+from typing import Iterable
+
+from econsole.sequences import validate_byte, validate_rgb
+
+
+class Color4Bits(Enum):
+    BLACK = (30, 40)
+    DARK_RED = (31, 41)
+    GREEN = (32, 42)
+    DARK_YELLOW = (33, 43)
+    DARK_BLUE = (34, 44)
+    PURPLE = (35, 45)
+    TURQUOISE = (36, 46)
+    SILVER = (37, 47)
+    GRAY = (90, 100)
+    RED = (91, 101)
+    LIME = (92, 102)
+    YELLOW = (93, 103)
+    BLUE = (94, 104)
+    PINK = (95, 105)
+    CYAN = (96, 106)
+    WHITE = (97, 107)
+
+
+# xterm default values of the 16 system colors, in Color4Bits (and palette index) order
+SYSTEM_PALETTE: tuple[tuple[int, int, int], ...] = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+COLORS_4BITS: tuple[Color4Bits, ...] = tuple(Color4Bits)
+
+_CUBE_LEVELS: tuple[int, ...] = (0, 95, 135, 175, 215, 255)
+
+XTERM_256_PALETTE: tuple[tuple[int, int, int], ...] = (
+    SYSTEM_PALETTE
+    + tuple((r, g, b) for r in _CUBE_LEVELS for g in _CUBE_LEVELS for b in _CUBE_LEVELS)
+    + tuple((8 + 10 * step,) * 3 for step in range(24))
+)
+
+
+def _nearest_cube_step(value: int) -> int:
+    return min(range(6), key=lambda step: abs(_CUBE_LEVELS[step] - value))
+
+
+def _nearest_gray_step(channels_sum: int) -> int:
+    # The nearest gray is the one nearest to the channels mean, compared on a 3x scale to avoid rounding it
+    return min(range(24), key=lambda step: abs(3 * (8 + 10 * step) - channels_sum))
+
+
+# Lookup tables: channel value -> nearest cube step, sum of the 3 channels -> nearest gray ramp step
+_CUBE_STEPS: tuple[int, ...] = tuple(_nearest_cube_step(value) for value in range(256))
+_GRAY_STEPS: tuple[int, ...] = tuple(_nearest_gray_step(channels_sum) for channels_sum in range(3 * 255 + 1))
+
+
+def _distance(first: tuple[int, int, int], r: int, g: int, b: int) -> int:
+    return (first[0] - r) ** 2 + (first[1] - g) ** 2 + (first[2] - b) ** 2
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_8bits(r: int, g: int, b: int) -> int:
+    """
+    Returns the index of the xterm 256 colors palette entry nearest to (``r``, ``g``, ``b``),
+    picked among the 6x6x6 color cube and the gray ramp (the 16 system colors vary between terminals).
+    """
+    validate_rgb(r, g, b)
+    cube_index: int = 16 + 36 * _CUBE_STEPS[r] + 6 * _CUBE_STEPS[g] + _CUBE_STEPS[b]
+    gray_index: int = 232 + _GRAY_STEPS[r + g + b]
+
+    if _distance(XTERM_256_PALETTE[gray_index], r, g, b) < _distance(XTERM_256_PALETTE[cube_index], r, g, b):
+        return gray_index
+    return cube_index
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_4bits(r: int, g: int, b: int) -> Color4Bits:
+    """
+    Returns the Color4Bits member whose xterm default value is nearest to (``r``, ``g``, ``b``).
+    """
+    validate_rgb(r, g, b)
+    candidates: tuple[int, ...] = _system_candidates()[(r >> 4) << 8 | (g >> 4) << 4 | b >> 4]
+    nearest: int = candidates[0]
+    nearest_distance: int = _distance(SYSTEM_PALETTE[nearest], r, g, b)
+    for candidate in candidates[1:]:
+        distance: int = _distance(SYSTEM_PALETTE[candidate], r, g, b)
+        if distance < nearest_distance:
+            nearest, nearest_distance = candidate, distance
+    return COLORS_4BITS[nearest]
+
+
+@lru_cache(maxsize=1)
+def _system_candidates() -> tuple[tuple[int, ...], ...]:
+    """
+    For each 16x16x16 bucket of the RGB cube, the system colors that are the nearest to at least one color of the bucket,
+    built on first use: those not farther from the bucket than some system color is from any of its colors.
+    """
+    # System color -> channel -> bucket of 16 channel values -> squared distances to the nearest and farthest values
+    channel_distances: list[list[list[tuple[int, int]]]] = [
+        [[_channel_distances(channel, bucket << 4) for bucket in range(16)] for channel in color] for color in SYSTEM_PALETTE
+    ]
+    buckets: list[tuple[int, ...]] = []
+    for index in range(4096):
+        r, g, b = index >> 8, (index >> 4) & 15, index & 15
+        nearest: list[int] = []
+        bound: int = 3 * 255**2
+        for reds, greens, blues in channel_distances:
+            nearest.append(reds[r][0] + greens[g][0] + blues[b][0])
+            bound = min(bound, reds[r][1] + greens[g][1] + blues[b][1])
+        buckets.append(tuple(system_index for system_index, distance in enumerate(nearest) if distance <= bound))
+    return tuple(buckets)
+
+
+def _channel_distances(channel: int, start: int) -> tuple[int, int]:
+    end: int = start + 15
+    nearest: int = start - channel if channel < start else max(0, channel - end)
+    return nearest**2, max(channel - start, end - channel) ** 2
+
+
+def palette_to_4bits(value: int) -> Color4Bits:
+    """
+    Returns the Color4Bits member nearest to the xterm 256 colors palette entry ``value``.
+    """
+    validate_byte("value", value)
+    if value < 16:
+        return COLORS_4BITS[value]
+    return rgb_to_4bits(*XTERM_256_PALETTE[value])
+
+
+def rgbs_to_8bits(colors: Iterable[tuple[int, int, int]]) -> list[int]:
+    """
+    Bulk version of :func:`rgb_to_8bits`.
+    """
+    return list(starmap(rgb_to_8bits, colors))
+
+
+def rgbs_to_4bits(colors: Iterable[tuple[int, int, int]]) -> list[Color4Bits]:
+    """
+    Bulk version of :func:`rgb_to_4bits`.
+    """
+    return list(starmap(rgb_to_4bits, colors))
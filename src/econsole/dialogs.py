@@ -1,29 +1,37 @@
-from asyncio import get_event_loop
-from typing import Any, Callable, Sequence
+"""
+Dialogs built on prompt_toolkit, with text fallbacks when the session is not interactive
+or the answers come from another source than the console (see :mod:`econsole.input_source`).
 
-from prompt_toolkit import Application
-from prompt_toolkit.completion import Completer
-from prompt_toolkit.eventloop import run_in_executor_with_context
-from prompt_toolkit.filters import FilterOrBool
-from prompt_toolkit.layout import D, HSplit
-from prompt_toolkit.shortcuts.dialogs import (_create_app, button_dialog,
-                                              checkboxlist_dialog,
-                                              input_dialog, message_dialog,
-                                              radiolist_dialog, yes_no_dialog)
-from prompt_toolkit.styles import BaseStyle
-from prompt_toolkit.validation import Validator
-from prompt_toolkit.widgets import Box, Dialog, Label, ProgressBar, TextArea
+prompt_toolkit and the menu builder are imported on the first dialog call, not with this module.
+"""
+from __future__ import annotations
 
-from econsole.menu_builder import build_menu
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+from econsole.input_source import get_input_source, read_input
+from econsole.terminal import get_terminal_profile
+
+if TYPE_CHECKING:
+    from prompt_toolkit import Application
+    from prompt_toolkit.completion import Completer
+    from prompt_toolkit.filters import FilterOrBool
+    from prompt_toolkit.styles import BaseStyle
+    from prompt_toolkit.validation import Validator
 
 
 class ConsoleDialogs:
     @staticmethod
     def show_message_box(title: str, text: str, button_text: str = "OK", style: BaseStyle | None = None):
-        try:
-            message_dialog(title=title, text=text, ok_text=button_text, style=style).run()
-        except Exception:
-            print(title.upper() + ":", text)
+        if _use_prompt_toolkit():
+            try:
+                from prompt_toolkit.shortcuts.dialogs import message_dialog  # pylint: disable=import-outside-toplevel
+
+                message_dialog(title=title, text=text, ok_text=button_text, style=style).run()
+                return
+            except Exception:
+                pass
+
+        print(title.upper() + ":", text)
 
     @staticmethod
     def show_input_dialog(
@@ -37,33 +45,43 @@ class ConsoleDialogs:
         style: BaseStyle | None = None,
         default_text: str = "",
     ) -> str:
-        try:
-            return input_dialog(
-                title=title,
-                text=text,
-                ok_text=ok_button_text,
-                cancel_text=cancel_button_text,
-                completer=completer,
-                validator=validator,
-                password=password,
-                style=style,
-                default=default_text,
-            ).run()
-        except Exception:
-            print(title.upper())
-            return input(text + ": ")
+        if _use_prompt_toolkit():
+            try:
+                from prompt_toolkit.shortcuts.dialogs import input_dialog  # pylint: disable=import-outside-toplevel
+
+                return input_dialog(
+                    title=title,
+                    text=text,
+                    ok_text=ok_button_text,
+                    cancel_text=cancel_button_text,
+                    completer=completer,
+                    validator=validator,
+                    password=password,
+                    style=style,
+                    default=default_text,
+                ).run()
+            except Exception:
+                pass
+
+        print(title.upper())
+        return read_input(text + ": ")
 
     @staticmethod
     def confirm_dialog(title: str, text: str, yes_button_text: str = "Yes", no_button_text: str = "No", style: BaseStyle | None = None) -> bool:
-        try:
-            return yes_no_dialog(title=title, text=text, yes_text=yes_button_text, no_text=no_button_text, style=style).run()
-        except Exception:
-            print(title.upper())
-            result: str = input(text + " (Y/n): ")
-            if result.lower() == "n":
-                return False
+        if _use_prompt_toolkit():
+            try:
+                from prompt_toolkit.shortcuts.dialogs import yes_no_dialog  # pylint: disable=import-outside-toplevel
+
+                return yes_no_dialog(title=title, text=text, yes_text=yes_button_text, no_text=no_button_text, style=style).run()
+            except Exception:
+                pass
+
+        print(title.upper())
+        result: str = read_input(text + " (Y/n): ")
+        if result.lower() == "n":
+            return False
 
-            return True
+        return True
 
     @staticmethod
     def buttons_dialog(title: str, text: str, buttons: list[tuple[str, Any]], style: BaseStyle | None = None) -> Any:
@@ -76,10 +94,17 @@ class ConsoleDialogs:
 
         :returns The selected button return value
         """
-        try:
-            return button_dialog(title=title, text=text, buttons=buttons, style=style).run()
-        except Exception:
-            return build_menu(title, text, buttons)
+        if _use_prompt_toolkit():
+            try:
+                from prompt_toolkit.shortcuts.dialogs import button_dialog  # pylint: disable=import-outside-toplevel
+
+                return button_dialog(title=title, text=text, buttons=buttons, style=style).run()
+            except Exception:
+                pass
+
+        from econsole.menu_builder import build_menu  # pylint: disable=import-outside-toplevel
+
+        return build_menu(title, text, buttons)
 
     @staticmethod
     def radio_buttons_dialog(
@@ -91,23 +116,30 @@ class ConsoleDialogs:
         default: Any = None,
         style: BaseStyle | None = None,
     ) -> Any:
-        try:
-            return radiolist_dialog(
-                title=title,
-                text=text,
-                values=[(button[1], button[0]) for button in buttons],
-                ok_text=ok_button_text,
-                cancel_text=cancel_button_text,
-                default=default,
-                style=style,
-            ).run()
-        except Exception:
-            buttons = list(buttons)
-            result = build_menu(title, text, buttons + [("Cancel", "CANCELLED")])
-            if result == "CANCELLED":
-                return None
-
-            return result
+        if _use_prompt_toolkit():
+            try:
+                from prompt_toolkit.shortcuts.dialogs import radiolist_dialog  # pylint: disable=import-outside-toplevel
+
+                return radiolist_dialog(
+                    title=title,
+                    text=text,
+                    values=[(button[1], button[0]) for button in buttons],
+                    ok_text=ok_button_text,
+                    cancel_text=cancel_button_text,
+                    default=default,
+                    style=style,
+                ).run()
+            except Exception:
+                pass
+
+        from econsole.menu_builder import build_menu  # pylint: disable=import-outside-toplevel
+
+        buttons = list(buttons)
+        result = build_menu(title, text, buttons + [("Cancel", "CANCELLED")])
+        if result == "CANCELLED":
+            return None
+
+        return result
 
     @staticmethod
     def checkbox_dialog(
@@ -119,15 +151,29 @@ class ConsoleDialogs:
         default_values: Sequence[Any] | None = None,
         style: BaseStyle | None = None,
     ) -> list[Any]:
-        return checkboxlist_dialog(
-            title=title,
-            text=text,
-            values=[(value[1], value[0]) for value in values],
-            ok_text=ok_button_text,
-            cancel_text=cancel_button_text,
-            default_values=default_values,
-            style=style,
-        ).run()
+        if _use_prompt_toolkit():
+            try:
+                from prompt_toolkit.shortcuts.dialogs import checkboxlist_dialog  # pylint: disable=import-outside-toplevel
+
+                return checkboxlist_dialog(
+                    title=title,
+                    text=text,
+                    values=[(value[1], value[0]) for value in values],
+                    ok_text=ok_button_text,
+                    cancel_text=cancel_button_text,
+                    default_values=default_values,
+                    style=style,
+                ).run()
+            except Exception:
+                pass
+
+        print(title.upper())
+        for index, value in enumerate(values):
+            print(f"{index}. {value[0]}")
+        selected: str = read_input(text + " (numbers separated by commas): ")
+        if not selected.strip():
+            return list(default_values or ())
+        return [values[int(index)][1] for index in selected.split(",") if index.strip().isdigit() and int(index) < len(values)]
 
     @staticmethod
     def progress_bar_dialog(
@@ -166,6 +212,13 @@ class ConsoleDialogs:
         :param style:
         :return:
         """
+        # pylint: disable=import-outside-toplevel
+        from asyncio import get_event_loop
+
+        from prompt_toolkit.eventloop import run_in_executor_with_context
+        from prompt_toolkit.layout import D, HSplit
+        from prompt_toolkit.shortcuts.dialogs import _create_app
+        from prompt_toolkit.widgets import Box, Dialog, Label, ProgressBar, TextArea
 
         loop = get_event_loop()
         progressbar = ProgressBar()
@@ -211,3 +264,7 @@ class ConsoleDialogs:
         app.pre_run_callables.append(pre_run)
 
         return app
+
+
+def _use_prompt_toolkit() -> bool:
+    return get_terminal_profile().is_interactive and get_input_source().interactive
@@ -0,0 +1,223 @@
+"""
+Where menus and dialogs read their answers from: the console by default, or a script, a file or pipe,
+or a recorded transcript, so that they can be driven without a TTY.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class ReplayError(Exception):
+    """
+    Raised when a replayed transcript does not match the prompts asked.
+    """
+
+
+class Transcript:
+    """
+    The prompts asked and the answers read, in order. Saved as JSON lines (``{"prompt": ..., "answer": ...}``).
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: Iterable[tuple[str, str]] = ()):
+        self.entries: list[tuple[str, str]] = list(entries)
+
+    def record(self, prompt: str, answer: str):
+        self.entries.append((prompt, answer))
+
+    @property
+    def answers(self) -> list[str]:
+        return [answer for _, answer in self.entries]
+
+    def save(self, path: str | Path):
+        import json  # pylint: disable=import-outside-toplevel
+
+        with open(path, "w", encoding="utf-8") as file:
+            for prompt, answer in self.entries:
+                file.write(json.dumps({"prompt": prompt, "answer": answer}) + "\n")
+
+    @classmethod
+    def load(cls, path: str | Path) -> Transcript:
+        import json  # pylint: disable=import-outside-toplevel
+
+        with open(path, encoding="utf-8") as file:
+            return cls((entry["prompt"], entry["answer"]) for entry in map(json.loads, filter(str.strip, file)))
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class InputSource(ABC):
+    """
+    Reads one answer per prompt. Every answer read is appended to ``transcript`` when set.
+
+    :param echo: when set, prompts and answers are written to it, as a terminal would show them
+        (sources other than the console do not print their prompts otherwise)
+    """
+
+    # Whether a user can answer full screen prompt_toolkit dialogs
+    interactive: bool = False
+    # Whether reading may wait for input
+    blocking: bool = False
+
+    def __init__(self, transcript: Transcript | None = None, echo: TextIO | None = None):
+        self.transcript: Transcript | None = transcript
+        self.echo: TextIO | None = echo
+
+    def read(self, prompt: str) -> str:
+        """
+        Returns the answer to ``prompt``, without line ending.
+
+        :raises EOFError: when there is no answer left
+        """
+        answer: str = self._read(prompt)
+        if self.transcript is not None:
+            self.transcript.record(prompt, answer)
+        if self.echo is not None:
+            self.echo.write(f"{prompt}{answer}\n")
+        return answer
+
+    async def read_async(self, prompt: str) -> str:
+        """
+        Same as :meth:`read`, without blocking the event loop. Sources whose reads block (the console, pipes)
+        read in a worker thread; the others answer directly.
+        """
+        if not self.blocking:
+            return self.read(prompt)
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        return await asyncio.to_thread(self.read, prompt)
+
+    @abstractmethod
+    def _read(self, prompt: str) -> str:
+        pass
+
+
+class ConsoleInput(InputSource):
+    """
+    Reads from the console with the builtin :func:`input`.
+    """
+
+    interactive: bool = True
+    blocking: bool = True
+
+    def _read(self, prompt: str) -> str:
+        return input(prompt)
+
+
+class ScriptedInput(InputSource):
+    """
+    Answers prompts with ``answers``, in order.
+    """
+
+    def __init__(self, answers: Iterable[str], transcript: Transcript | None = None, echo: TextIO | None = None):
+        super().__init__(transcript, echo)
+        self._answers: Iterator[str] = iter(answers)
+
+    def _read(self, prompt: str) -> str:
+        try:
+            return next(self._answers)
+        except StopIteration:
+            raise EOFError(f"No scripted answer left for {prompt!r}") from None
+
+
+class StreamInput(InputSource):
+    """
+    Answers prompts with the lines of ``stream``, e.g. a file or ``sys.stdin`` when it is a pipe.
+    """
+
+    blocking: bool = True
+
+    def __init__(self, stream: TextIO, transcript: Transcript | None = None, echo: TextIO | None = None):
+        super().__init__(transcript, echo)
+        self._stream: TextIO = stream
+
+    def _read(self, prompt: str) -> str:
+        line: str = self._stream.readline()
+        if not line:
+            raise EOFError(f"No input left for {prompt!r}")
+        return line.rstrip("\r\n")
+
+
+class ReplayInput(InputSource):
+    """
+    Answers prompts with the answers of a recorded transcript.
+
+    :param strict: when True, raises :class:`ReplayError` when a prompt differs from the recorded one
+    """
+
+    def __init__(self, recorded: Transcript, strict: bool = True, transcript: Transcript | None = None, echo: TextIO | None = None):
+        super().__init__(transcript, echo)
+        self.strict: bool = strict
+        self._entries: Iterator[tuple[str, str]] = iter(recorded.entries)
+
+    @classmethod
+    def from_file(cls, path: str | Path, strict: bool = True) -> ReplayInput:
+        return cls(Transcript.load(path), strict)
+
+    def _read(self, prompt: str) -> str:
+        try:
+            recorded_prompt, answer = next(self._entries)
+        except StopIteration:
+            raise EOFError(f"No recorded answer left for {prompt!r}") from None
+        if self.strict and recorded_prompt != prompt:
+            raise ReplayError(f"Expected prompt {recorded_prompt!r}, got {prompt!r}")
+        return answer
+
+
+_CONSOLE: ConsoleInput = ConsoleInput()
+_default: InputSource = _CONSOLE
+_current: ContextVar[InputSource | None] = ContextVar("econsole_input_source", default=None)
+
+
+def get_input_source() -> InputSource:
+    """
+    Returns the source set by :func:`use_input_source` in the current thread or task, else the process-wide one.
+    """
+    source: InputSource | None = _current.get()
+    return source if source is not None else _default
+
+
+def set_input_source(source: InputSource | None):
+    """
+    Sets the process-wide input source. Passing None restores the console.
+    """
+    global _default  # pylint: disable=global-statement
+    _default = source if source is not None else _CONSOLE
+
+
+@contextmanager
+def use_input_source(source: InputSource) -> Iterator[InputSource]:
+    """
+    Uses ``source`` in the current thread or asyncio task only, so that sessions can be driven concurrently.
+    """
+    token = _current.set(source)
+    try:
+        yield source
+    finally:
+        _current.reset(token)
+
+
+def read_input(prompt: str) -> str:
+    """
+    Reads the answer to ``prompt`` from the current input source.
+    """
+    return get_input_source().read(prompt)
+
+
+async def read_input_async(prompt: str) -> str:
+    """
+    Same as :func:`read_input`, without blocking the event loop.
+    """
+    return await get_input_source().read_async(prompt)
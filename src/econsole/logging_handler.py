@@ -0,0 +1,193 @@
+"""
+Asynchronous, colorized logging handler.
+"""
+from __future__ import annotations
+
+import copy
+import logging
+import sys
+from enum import Enum
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from typing import BinaryIO, TextIO
+
+from econsole import sequences
+from econsole.colors import Color4Bits
+from econsole.output import OutputBuffer, write_to_stream
+from econsole.terminal import stream_colors_enabled
+
+DEFAULT_LEVEL_COLORS: dict[int, Color4Bits] = {
+    logging.DEBUG: Color4Bits.GRAY,
+    logging.INFO: Color4Bits.GREEN,
+    logging.WARNING: Color4Bits.YELLOW,
+    logging.ERROR: Color4Bits.RED,
+    logging.CRITICAL: Color4Bits.PINK,
+}
+
+
+class OverflowPolicy(Enum):
+    BLOCK = 0
+    DROP_NEW = 1
+    DROP_OLDEST = 2
+
+
+class ColorHandler(logging.Handler):
+    """
+    Colors records by level and writes them from a background thread, in batches.
+
+    Records are queued in a bounded queue; when it is full, ``overflow_policy`` decides whether the logging
+    thread waits (``BLOCK``, the backpressure option) or a record is dropped (``DROP_NEW``, ``DROP_OLDEST``).
+    ``queue_depth``, ``max_queue_depth``, ``written`` and ``dropped`` can be used to monitor the handler.
+
+    :param stream: the target stream or OutputBuffer, ``sys.stderr`` when None
+    :param colorize: when None, colors are used when the target stream is a terminal
+        (see :func:`econsole.terminal.stream_colors_enabled`)
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        stream: OutputBuffer | TextIO | BinaryIO | None = None,
+        level: int = logging.NOTSET,
+        level_colors: dict[int, Color4Bits] | None = None,
+        colorize: bool | None = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 512,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
+        super().__init__(level)
+        self.stream: OutputBuffer | TextIO | BinaryIO | None = stream
+        if colorize is None:
+            target: OutputBuffer | TextIO | BinaryIO = self._target_stream()
+            colorize = stream_colors_enabled(target.stream if isinstance(target, OutputBuffer) else target)
+        self.colorize: bool = colorize
+        self.batch_size: int = batch_size
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        self.written: int = 0
+        self.dropped: int = 0
+        self.max_queue_depth: int = 0
+
+        self._prefixes: list[tuple[int, str]] = sorted(
+            (level_, sequences.SGR[color.value[0]]) for level_, color in (level_colors or DEFAULT_LEVEL_COLORS).items()
+        )
+        self._queue: Queue = Queue(max_queue_size)
+        self._counters_lock: Lock = Lock()
+        self._writer: Thread = Thread(target=self._write_loop, name="econsole-log-writer", daemon=True)
+        self._writer.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            # Merge the arguments now: they may be mutated before the writer thread formats the record.
+            # The record is shared with the other handlers, so a copy is queued (as QueueHandler.prepare does)
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+            self._enqueue(record)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(record)
+
+    def flush(self):
+        """
+        Waits until every queued record has been written.
+        """
+        if self._writer.is_alive():
+            self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(self._STOP)
+            self._writer.join()
+        super().close()
+
+    def _enqueue(self, record: logging.LogRecord):
+        if self.overflow_policy is OverflowPolicy.BLOCK:
+            self._queue.put(record)
+        elif self.overflow_policy is OverflowPolicy.DROP_NEW:
+            try:
+                self._queue.put_nowait(record)
+            except Full:
+                self._count_dropped()
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(record)
+                    break
+                except Full:
+                    try:
+                        self._queue.get_nowait()
+                        self._queue.task_done()
+                        self._count_dropped()
+                    except Empty:
+                        pass
+
+        depth: int = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def _count_dropped(self):
+        with self._counters_lock:
+            self.dropped += 1
+
+    def _write_loop(self):
+        stop: bool = False
+        while not stop:
+            batch: list[logging.LogRecord] = []
+            item = self._queue.get()
+            while True:
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+
+    def _write_batch(self, batch: list[logging.LogRecord]):
+        lines: list[str] = []
+        for record in batch:
+            try:
+                lines.append(self._format_line(record))
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.handleError(record)
+
+        lines.append("")
+        text: str = "\n".join(lines)
+        stream: OutputBuffer | TextIO | BinaryIO = self._target_stream()
+        try:
+            # Only this thread writes. Handler.lock must not be taken here: emit() holds it while waiting on a full queue
+            if isinstance(stream, OutputBuffer):
+                stream.write(text)
+            else:
+                write_to_stream(stream, text)
+            stream.flush()
+            self.written += len(lines) - 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(batch[-1])
+
+    def _target_stream(self) -> OutputBuffer | TextIO | BinaryIO:
+        return self.stream if self.stream is not None else sys.stderr
+
+    def _format_line(self, record: logging.LogRecord) -> str:
+        line: str = self.format(record)
+        if not self.colorize:
+            return line
+
+        prefix: str = ""
+        for level, level_prefix in self._prefixes:
+            if record.levelno < level:
+                break
+            prefix = level_prefix
+        return f"{prefix}{line}{sequences.RESET}" if prefix else line
@@ -1,8 +1,17 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from empire_commons.types_ import NULL
 
+from econsole.background import ActionCancelledError
+from econsole.input_source import get_input_source, read_input, read_input_async
+from econsole.search import TrigramIndex
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 
 class OperationError(Exception):
     def __init__(self):
@@ -16,74 +25,212 @@ class LazyProgrammerException(Exception):
 
 
 class AbstractMenu(ABC):
-    def __init__(self, title: str):
+    """
+    :param page_size: when set, the menu is displayed one page of ``page_size`` items at a time,
+        with ``n`` (next), ``p`` (previous) and ``g <page>`` (go to page) commands
+
+    In both modes, entering ``/text`` only displays the items best matching ``text`` (see :meth:`search_menu_items`),
+    and ``/`` alone clears the filter.
+
+    The displayed text is cached until the menu changes: adding, showing, hiding or renaming items, changing the title
+    or the default value, or :meth:`update_menu_items` not returning False.
+    """
+
+    FILTER_LIMIT: int = 20
+
+    def __init__(self, title: str, page_size: int | None = None):
         self.title = title
-        self.menu_items = []
+        self._menu_items: MenuItems = MenuItems()
         self.default = NULL
+        self.page_size: int | None = page_size
+        self._rendered: tuple[tuple, str] | None = None
         self.initialise()
 
+    @property
+    def menu_items(self) -> "MenuItems":
+        return self._menu_items
+
+    @menu_items.setter
+    def menu_items(self, menu_items: Iterable["MenuItem"]):
+        """
+        Any iterable of items (e.g. a list) is wrapped in a :class:`MenuItems`.
+        """
+        self._menu_items = menu_items if isinstance(menu_items, MenuItems) else MenuItems(menu_items)
+        # The new items' version says nothing about what was rendered
+        self._rendered = None
+
     @abstractmethod
     def initialise(self):
         pass
 
-    def update_menu_items(self):
-        pass
+    def update_menu_items(self) -> bool | None:
+        """
+        Called before each display of the menu. Subclasses refreshing their items from external data
+        return False when nothing changed, so the previously rendered menu is reused.
+        """
+        return False
 
     def display(self):
-        repeat: bool = True
-        while repeat:
-            self.update_menu_items()
-            print()
-            print(self.title)
+        """
+        Displays the menu until an exit option is selected. Submenus are displayed by the same
+        :class:`MenuNavigator`, without nesting calls.
+        """
+        MenuNavigator(self).run()
+
+    async def display_async(self):
+        """
+        Same as :meth:`display`, without blocking the event loop: input is read in a worker thread, coroutine actions
+        are awaited, and the menu is displayed again when background tasks change its items while waiting for input.
+        """
+        await MenuNavigator(self).run_async()
+
+    def action_completed(self, menu_item: "MenuItem", result: Any):
+        """
+        Called by the navigator with the return value of each action run from this menu, including actions run
+        on an executor. Failures are raised instead, once.
+        """
+
+    def search_menu_items(self, query: str, limit: int | None = None) -> list[int]:
+        """
+        Returns the positions of the visible items whose description best matches ``query``, best first.
+        Descriptions are indexed on first search, then as items are added (see :class:`econsole.search.TrigramIndex`).
+
+        :param limit: the maximum number of positions, ``page_size`` or ``FILTER_LIMIT`` by default
+        """
+        return self.menu_items.search(query, limit or self.page_size or self.FILTER_LIMIT)
+
+    def render(self) -> str:
+        """
+        Returns the text of the whole menu: the title and the visible items.
+        """
+        return self._render(index for index, item in enumerate(self.menu_items) if item.isVisible)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.menu_items) // self.page_size)) if self.page_size else 1
+
+    def render_page(self, page: int) -> str:
+        """
+        Returns the text of a page: the title and the visible items among the ``page_size`` items of the page.
+        Items keep their position as number, so pages may show fewer items when some are hidden.
+        """
+        start: int = page * self.page_size
+        positions: range = range(start, min(start + self.page_size, len(self.menu_items)))
+        return self._render(
+            (index for index in positions if self.menu_items[index].isVisible),
+            f"Page {page + 1}/{self.page_count} (n: next, p: previous, g <page>: go to page)",
+        )
+
+    def render_filter(self, query: str) -> str:
+        """
+        Returns the text of the menu filtered by ``query``: the title and the best matching items.
+        """
+        positions: list[int] = self.search_menu_items(query)
+        return self._render(positions, f"Filter: {query} ({len(positions)} shown, / to clear)")
+
+    def _render(self, positions: Iterable[int], footer: str | None = None) -> str:
+        lines: list[str] = ["", self.title]
+        if self.default != NULL:
+            lines.append(f"\tDefault value is: {self.default}")
+        lines.extend(f"{index}. {self._menu_item_at(index).description}" for index in positions)
+        if footer is not None:
+            lines.append(footer)
+        lines.append("")
+        return "\n".join(lines)
+
+    def _menu_item_at(self, position: int) -> "MenuItem":
+        """
+        :raises IndexError: when there is no item at ``position``
+        """
+        return self.menu_items[position]
+
+    def _render_cached(self, view: tuple) -> str:
+        """
+        Returns the text of ``view`` (``("menu",)``, ``("page", page)`` or ``("filter", query)``),
+        rendering it only when the view or the menu changed since the last call.
+        """
+        key: tuple = (view, self.menu_items.version, self.title, self.default)
+        if self._rendered is not None and self._rendered[0] == key:
+            return self._rendered[1]
+
+        if view[0] == "page":
+            text: str = self.render_page(view[1])
+        elif view[0] == "filter":
+            text = self.render_filter(view[1])
+        else:
+            text = self.render()
+        self._rendered = (key, text)
+        return text
+
+    def _render_view(self, page: int, query: str) -> str:
+        if query:
+            return self._render_cached(("filter", query))
+        return self._render_cached(("page", page)) if self.page_size else self._render_cached(("menu",))
+
+    def _update_menu_items(self):
+        if self.update_menu_items() is not False:
+            self.menu_items.touch()
+
+    async def _load_async(self, page: int, command: str = ""):
+        """
+        Called by :meth:`MenuNavigator.run_async` before displaying ``page`` and before handling ``command``,
+        so that menus reading their items from elsewhere load them without blocking the event loop.
+        """
+
+    def _page_command(self, inp: str, page: int) -> int | None:
+        """
+        Returns the page to display after ``inp``, or None when ``inp`` is not a page command.
+        """
+        command: str = inp.lower()
+        if command == "n":
+            return min(page + 1, self.page_count - 1)
+        if command == "p":
+            return max(page - 1, 0)
+        if command.startswith("g") and command[1:].strip().isdigit():
+            target: int = int(command[1:]) - 1
+            if 0 <= target < self.page_count:
+                return target
+            print(f"Invalid page. Page {target + 1} doesn't exist.")
+            return page
+        return None
+
+    def _selected_item(self, inp: str) -> "MenuItem | None":
+        """
+        Returns the visible item at position ``inp``, or None (after telling why) when ``inp`` is not a valid option.
+        """
+        try:
+            menu_item = self._menu_item_at(int(inp))
+            if menu_item.isVisible:
+                return menu_item
+            raise OperationError()
+        except ValueError:
             if self.default != NULL:
-                print(f"\tDefault value is: {self.default}")
-
-            for index, item in enumerate(self.menu_items):
-                if item.isVisible:
-                    print(f"{index}. {item.description}")
-
-            inp = input("Select Option: ")
-            try:
-                menu_item = self.menu_items[int(inp)]
-                if menu_item.isVisible:
-                    repeat = menu_item.run()
-                else:
-                    raise OperationError()
-            except ValueError:
-                if self.default != NULL:
-                    raise LazyProgrammerException(value=self.default)
-                print("Invalid option, you need to enter a number.", inp)
-                repeat = True
-            except IndexError:
-                print(f"Invalid option. Option {inp} doesn't exist.")
-                repeat = True
-            except OperationError:
-                print(f"Invalid option. Option at {inp} is hidden.")
-                repeat = True
+                raise LazyProgrammerException(value=self.default)
+            print("Invalid option, you need to enter a number.", inp)
+        except IndexError:
+            print(f"Invalid option. Option {inp} doesn't exist.")
+        except OperationError:
+            print(f"Invalid option. Option at {inp} is hidden.")
+        return None
 
     def add_menu_item(self, menu_item: "MenuItem"):
-        if not self.menu_items.__contains__(menu_item):
-            self.menu_items.append(menu_item)
-        else:
-            raise ValueError(f"Menu item with id {menu_item.id} already exists!.")
+        self.menu_items.append(menu_item)
 
     def add_hidden_menu_item(self, menu_item: "MenuItem"):
         self.add_menu_item(menu_item.hide())
 
     def show_menu_item(self, item_id: int):
-        try:
-            menu_item = MenuItem(item_id)
-            index = self.menu_items.index(menu_item)
-            self.menu_items[index].show()
-        except ValueError:
+        menu_item = self.menu_items.get(item_id)
+        if menu_item is not None:
+            menu_item.show()
+        else:
             print(f"Error showing menu item. Menu item with ID {item_id} hasn't been added to this menu.")
 
     def hide_menu_item(self, item_id: int):
-        try:
-            menu_item = MenuItem(item_id)
-            index = self.menu_items.index(menu_item)
-            self.menu_items[index].hide()
-        except ValueError:
+        menu_item = self.menu_items.get(item_id)
+        if menu_item is not None:
+            menu_item.hide()
+        else:
             print(f"Error hiding menu item. Menu item with ID {item_id} hasn't been added to this menu.")
 
 
@@ -96,17 +243,52 @@ class MenuItem:
         menu: AbstractMenu = None,
         action_args: tuple[Any, ...] = (),
         action_kwargs: dict[str, Any] = None,
+        executor: "Executor | None" = None,
+        report_progress: bool = False,
     ):
+        """
+        :param executor: when set, the action runs on it (e.g. a ``ThreadPoolExecutor``) while a spinner is displayed,
+            see :func:`econsole.background.run_in_background`
+        :param report_progress: when True, the action is called with a ``progress`` keyword argument
+            (:class:`econsole.background.Progress`) to report its progress and check for cancellation
+        """
         action_kwargs = action_kwargs or {}
 
         self.id: int = id_
-        self.description: str = description
+        self._description: str = description
         self.action = action
         self.action_args = action_args
         self.action_kwargs = action_kwargs
         self.menu: AbstractMenu = menu
         self.isExitOption: bool = False
-        self.isVisible: bool = True
+        self.executor: "Executor | None" = executor
+        self.report_progress: bool = report_progress
+        # Return value of the last run of the action
+        self.result: Any = None
+        self._visible: bool = True
+        self._containers: list[MenuItems] = []
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @description.setter
+    def description(self, description: str):
+        if description != self._description:
+            self._description = description
+            for menu_items in self._containers:
+                menu_items.touch(descriptions=True)
+
+    @property
+    def isVisible(self) -> bool:
+        return self._visible
+
+    @isVisible.setter
+    def isVisible(self, visible: bool):
+        if visible != self._visible:
+            self._visible = visible
+            for menu_items in self._containers:
+                menu_items.touch()
 
     def hide(self) -> "MenuItem":
         self.isVisible = False
@@ -121,17 +303,65 @@ class MenuItem:
         return self
 
     def run(self) -> bool:
+        """
+        :raises ActionCancelledError: when the user cancels an action running on ``executor``
+        """
         if self.action is not None:
-            try:
-                self.action(*self.action_args, **self.action_kwargs)
-            except:
-                self.action()
+            result: Any = self._call_action()
+            if hasattr(result, "__await__"):
+                # Coroutine action run outside of display_async
+                import asyncio  # pylint: disable=import-outside-toplevel
+
+                result = asyncio.run(_awaited(result))
+            self.result = result
 
         elif self.menu is not None:
             self.menu.display()
 
         return not self.isExitOption
 
+    async def run_async(self) -> bool:
+        """
+        Same as :meth:`run`, awaiting the action when it is a coroutine function.
+        """
+        if self.action is not None:
+            result: Any = await self._call_action_async()
+            if hasattr(result, "__await__"):
+                result = await result
+            self.result = result
+
+        elif self.menu is not None:
+            await self.menu.display_async()
+
+        return not self.isExitOption
+
+    def _call_action(self) -> Any:
+        if self.executor is None:
+            return self.action(*self.action_args, **self._kwargs(None))
+
+        from econsole.background import Progress, run_in_background  # pylint: disable=import-outside-toplevel
+
+        progress: Progress | None = Progress() if self.report_progress else None
+        return run_in_background(self.executor, self.description, self.action, self.action_args, self._kwargs(progress), progress)
+
+    async def _call_action_async(self) -> Any:
+        if self.executor is None:
+            return self.action(*self.action_args, **self._kwargs(None))
+
+        from econsole.background import Progress, run_in_background_async  # pylint: disable=import-outside-toplevel
+
+        progress: Progress | None = Progress() if self.report_progress else None
+        return await run_in_background_async(self.executor, self.description, self.action, self.action_args, self._kwargs(progress), progress)
+
+    def _kwargs(self, progress: Any) -> dict[str, Any]:
+        if not self.report_progress:
+            return self.action_kwargs
+        if progress is None:
+            from econsole.background import Progress  # pylint: disable=import-outside-toplevel
+
+            progress = Progress()
+        return {**self.action_kwargs, "progress": progress}
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             return self.id == other.id
@@ -142,16 +372,323 @@ class MenuItem:
         return not self.__eq__(other)
 
 
-class _Menu(AbstractMenu):
-    def __init__(self, title: str, button_results_mapping: dict[int, Any]):
-        super().__init__(title)
-        self.button_results_mapping = button_results_mapping
+class MenuItems:
+    """
+    Menu items in insertion order, indexed by id: appending, looking an item up by id and finding its position take constant time.
+    Items are read like a list (``len``, iteration, indexing by position).
+    """
+
+    __slots__ = ("_items", "_positions", "_index", "version")
+
+    def __init__(self, menu_items: Iterable[MenuItem] = ()):
+        self._items: list[MenuItem] = []
+        self._positions: dict[int, int] = {}
+        self._index: TrigramIndex | None = None
+        # Incremented on every change of the items, see touch()
+        self.version: int = 0
+        self.extend(menu_items)
+
+    def append(self, menu_item: MenuItem):
+        """
+        :raises ValueError: when an item with the same id was already added
+        """
+        if menu_item.id in self._positions:
+            raise ValueError(f"Menu item with id {menu_item.id} already exists!.")
+        self._positions[menu_item.id] = len(self._items)
+        self._items.append(menu_item)
+        menu_item._containers.append(self)  # pylint: disable=protected-access
+        if self._index is not None:
+            self._index.add(menu_item.description)
+        self.version += 1
+
+    def touch(self, descriptions: bool = False):
+        """
+        Marks the items as changed, so menus render them again. Showing, hiding and renaming items already does.
+
+        :param descriptions: when True, descriptions changed: the search index is rebuilt on next search
+        """
+        if descriptions:
+            self._index = None
+        self.version += 1
+
+    def extend(self, menu_items: Iterable[MenuItem]):
+        for menu_item in menu_items:
+            self.append(menu_item)
+
+    def remove(self, menu_item: MenuItem):
+        """
+        Removes the item having the id of ``menu_item``. The positions of the following items are shifted, as in a list.
+
+        :raises ValueError: when there is no such item
+        """
+        position: int = self.index(menu_item)
+        removed: MenuItem = self._items.pop(position)
+        del self._positions[removed.id]
+        for shifted in self._items[position:]:
+            self._positions[shifted.id] -= 1
+        removed._containers.remove(self)  # pylint: disable=protected-access
+        # The index refers to items by position: it is rebuilt on next search
+        self._index = None
+        self.version += 1
+
+    def clear(self):
+        for menu_item in self._items:
+            menu_item._containers.remove(self)  # pylint: disable=protected-access
+        self._items.clear()
+        self._positions.clear()
+        self._index = None
+        self.version += 1
+
+    def get(self, item_id: int) -> MenuItem | None:
+        position: int | None = self._positions.get(item_id)
+        return self._items[position] if position is not None else None
+
+    def search(self, query: str, limit: int) -> list[int]:
+        """
+        Returns the positions of the ``limit`` visible items whose description best matches ``query``, best first.
+        Hidden items stay indexed and are skipped when searching, so hiding and showing items costs nothing.
+        """
+        if self._index is None:
+            self._index = TrigramIndex(menu_item.description for menu_item in self._items)
+        return self._index.search(query, limit, lambda position: self._items[position].isVisible)
+
+    def index(self, menu_item: MenuItem) -> int:
+        """
+        Returns the position of the item having the id of ``menu_item``.
+
+        :raises ValueError: when there is no such item
+        """
+        try:
+            return self._positions[menu_item.id]
+        except KeyError:
+            raise ValueError(f"Menu item with id {menu_item.id} is not in the menu") from None
+
+    def __contains__(self, menu_item: object) -> bool:
+        return isinstance(menu_item, MenuItem) and menu_item.id in self._positions
+
+    def __getitem__(self, index: int) -> MenuItem:
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[MenuItem]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _Frame:
+    """
+    A menu on the navigation stack, with its cursor (page and filter).
+    """
+
+    __slots__ = ("menu", "page", "query", "exit_parent")
+
+    def __init__(self, menu: AbstractMenu, exit_parent: bool = False):
+        self.menu: AbstractMenu = menu
+        self.page: int = 0
+        self.query: str = ""
+        # Set when the menu was entered through an exit option: leaving it leaves the parent as well
+        self.exit_parent: bool = exit_parent
+
+
+class MenuNavigator:
+    """
+    Displays menus from an explicit stack: selecting a submenu item pushes its menu instead of calling its ``display()``,
+    so the call stack does not grow with the depth of the menus. Each menu on the stack keeps its page, filter and
+    rendered text. Entering a menu that is already on the stack (cyclic menus) goes back to it, so the stack never
+    holds more than the number of distinct menus.
+
+    Below the top menu, ``b`` goes back to the parent menu and ``h`` to the top menu; the breadcrumbs are shown above
+    the title (the top menu and the ``BREADCRUMBS_SHOWN`` last ones).
+    """
 
+    BREADCRUMBS_SHOWN: int = 3
+    PROMPT: str = "Select Option: "
+    # Seconds between checks for changed items while waiting for input, in run_async
+    REFRESH_INTERVAL: float = 0.25
+
+    __slots__ = ("_stack", "_depths", "selected")
+
+    def __init__(self, root: AbstractMenu):
+        self._stack: list[_Frame] = []
+        # id of each menu on the stack -> its depth, to find cycles without scanning the stack
+        self._depths: dict[int, int] = {}
+        # Last item selected by the user
+        self.selected: MenuItem | None = None
+        self._push(_Frame(root))
+
+    @property
+    def current(self) -> AbstractMenu | None:
+        return self._stack[-1].menu if self._stack else None
+
+    @property
+    def breadcrumbs(self) -> list[str]:
+        return [frame.menu.title for frame in self._stack]
+
+    def enter(self, menu: AbstractMenu, exit_parent: bool = False):
+        depth: int | None = self._depths.get(id(menu))
+        if depth is not None:
+            self._truncate(depth + 1)
+        else:
+            self._push(_Frame(menu, exit_parent))
+
+    def back(self):
+        if len(self._stack) > 1:
+            self._pop()
+
+    def home(self):
+        self._truncate(1)
+
+    def run(self):
+        """
+        Displays the menus until the top one is left.
+        """
+        redraw: bool | MenuItem = True
+        while self._stack:
+            frame: _Frame = self._stack[-1]
+            # Full menus are displayed again after every input, paged menus only when needed
+            if redraw or not frame.menu.page_size:
+                self._draw(frame)
+
+            redraw = self._handle(frame, read_input(self.PROMPT))
+            if isinstance(redraw, MenuItem):
+                try:
+                    redraw = self._after_action(frame, redraw, redraw.run())
+                except ActionCancelledError as error:
+                    print(error)
+                    redraw = True
+
+    async def run_async(self):
+        """
+        Same as :meth:`run`, without blocking the event loop. While waiting for input, the menu is displayed again
+        (followed by the prompt) when its items change.
+        """
+        redraw: bool | MenuItem = True
+        while self._stack:
+            frame: _Frame = self._stack[-1]
+            if redraw or not frame.menu.page_size:
+                await frame.menu._load_async(frame.page)  # pylint: disable=protected-access
+                self._draw(frame)
+
+            inp: str = await self._read_async(frame)
+            await frame.menu._load_async(frame.page, inp.strip())  # pylint: disable=protected-access
+            redraw = self._handle(frame, inp)
+            if isinstance(redraw, MenuItem):
+                redraw = self._after_action(frame, redraw, await redraw.run_async())
+
+    def _draw(self, frame: _Frame):
+        menu: AbstractMenu = frame.menu
+        menu._update_menu_items()  # pylint: disable=protected-access
+        frame.page = min(frame.page, menu.page_count - 1)
+        sys.stdout.write(self._render(frame))
+        sys.stdout.flush()
+
+    async def _read_async(self, frame: _Frame) -> str:
+        if not get_input_source().blocking:
+            return await read_input_async(self.PROMPT)
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        reading: asyncio.Task = asyncio.ensure_future(read_input_async(self.PROMPT))
+        try:
+            version: int = frame.menu.menu_items.version
+            while True:
+                done, _ = await asyncio.wait((reading,), timeout=self.REFRESH_INTERVAL)
+                if done:
+                    return reading.result()
+                if frame.menu.menu_items.version != version:
+                    self._draw(frame)
+                    sys.stdout.write(self.PROMPT)
+                    sys.stdout.flush()
+                    version = frame.menu.menu_items.version
+        finally:
+            # The worker thread still waits for a line, but its answer is dropped
+            reading.cancel()
+
+    def _after_action(self, frame: _Frame, menu_item: MenuItem, keep_going: bool) -> bool:
+        if menu_item.action is not None:
+            frame.menu.action_completed(menu_item, menu_item.result)
+        if not keep_going:
+            self._leave()
+        return True
+
+    def _render(self, frame: _Frame) -> str:
+        text: str = frame.menu._render_view(frame.page, frame.query)  # pylint: disable=protected-access
+        if len(self._stack) == 1:
+            return text
+
+        titles: list[str] = [shown.menu.title for shown in self._stack[-self.BREADCRUMBS_SHOWN :]]
+        if len(self._stack) > self.BREADCRUMBS_SHOWN + 1:
+            titles.insert(0, "...")
+        if len(self._stack) > self.BREADCRUMBS_SHOWN:
+            titles.insert(0, self._stack[0].menu.title)
+        return f"\n{' > '.join(titles)} (b: back, h: home){text}"
+
+    def _handle(self, frame: _Frame, inp: str) -> bool | MenuItem:
+        """
+        Applies ``inp`` and returns whether the display changed, or the selected item when its action must be run.
+        """
+        menu: AbstractMenu = frame.menu
+        command: str = inp.strip()
+        if command.startswith("/"):
+            frame.query = command[1:].strip()
+            return True
+        if len(self._stack) > 1 and command.lower() == "b":
+            self.back()
+            return True
+        if len(self._stack) > 1 and command.lower() == "h":
+            self.home()
+            return True
+        if menu.page_size and not frame.query:
+            page: int | None = menu._page_command(command, frame.page)  # pylint: disable=protected-access
+            if page is not None:
+                changed: bool = page != frame.page
+                frame.page = page
+                return changed
+
+        menu_item: MenuItem | None = menu._selected_item(inp)  # pylint: disable=protected-access
+        if menu_item is None:
+            return False
+        self.selected = menu_item
+        if menu_item.action is None and menu_item.menu is not None:
+            self.enter(menu_item.menu, menu_item.isExitOption)
+            return True
+        return menu_item
+
+    def _leave(self):
+        frame: _Frame = self._pop()
+        while frame.exit_parent and self._stack:
+            frame = self._pop()
+
+    def _push(self, frame: _Frame):
+        self._depths[id(frame.menu)] = len(self._stack)
+        self._stack.append(frame)
+
+    def _pop(self) -> _Frame:
+        frame: _Frame = self._stack.pop()
+        del self._depths[id(frame.menu)]
+        return frame
+
+    def _truncate(self, depth: int):
+        while len(self._stack) > depth:
+            self._pop()
+
+
+async def _awaited(awaitable: Any) -> Any:
+    return await awaitable
+
+
+class _Menu(AbstractMenu):
     def initialise(self):
         pass
 
 
-def build_menu(title: str, text: str, buttons: list[tuple[str, Any]], default: Any = NULL) -> Any:
+# Number of distinct menus kept by build_menu
+BUILD_MENU_CACHE_SIZE: int = 128
+_FIRST_BUTTON_ID: int = 100
+
+
+def build_menu(title: str, text: str, buttons: list[tuple[str, Any]], default: Any = NULL, page_size: int | None = None) -> Any:
     """
     Main function to build a simple menu. Example: ::
 
@@ -166,32 +703,33 @@ def build_menu(title: str, text: str, buttons: list[tuple[str, Any]], default: A
 
         print(z)
 
+    Menus are cached by title, text, button texts and page size (the ``BUILD_MENU_CACHE_SIZE`` last ones):
+    calling it again with the same buttons reuses the items and the rendered text. Only the displayed structure
+    is shared: the returned value is taken from ``buttons`` of the current call, and the page, filter and selection
+    belong to the call, so cached menus can be displayed by several threads at once.
+
     :param title:
     :param text:
     :param buttons: a list of tuples where tuple indices: 0 -> button text, 1 -> the value to return when the button is selected
     :param default:
+    :param page_size: displays the buttons one page at a time (see :class:`AbstractMenu`)
     :return:
     """
-    mapping: dict[int, Any] = {}
-    menu = _Menu(f"{title}: {text}", mapping)
-    count: int = 100
-    selected: int = -1
-
-    def _set_selected(value: int):
-        nonlocal selected
-        selected = int(value)
-
-    for button in buttons:
-        mapping[count] = button[1]
-        menu.add_menu_item(MenuItem(count, button[0], _set_selected, action_args=(count,)).set_as_exit_option())
-        count += 1
-
+    navigator: MenuNavigator = MenuNavigator(_cached_menu(title, text, tuple(button[0] for button in buttons), page_size))
     try:
-        menu.display()
+        navigator.run()
     except LazyProgrammerException as error:
         return error.value
 
-    return mapping[selected]
+    return buttons[navigator.selected.id - _FIRST_BUTTON_ID][1]
+
+
+@lru_cache(maxsize=BUILD_MENU_CACHE_SIZE)
+def _cached_menu(title: str, text: str, button_texts: tuple[str, ...], page_size: int | None) -> _Menu:
+    menu = _Menu(f"{title}: {text}", page_size)
+    for button_id, button_text in enumerate(button_texts, _FIRST_BUTTON_ID):
+        menu.add_menu_item(MenuItem(button_id, button_text).set_as_exit_option())
+    return menu
 
 
 if __name__ == "__main__":
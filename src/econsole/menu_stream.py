@@ -0,0 +1,346 @@
+"""
+Menus whose items are read from an iterator, one page at a time, as the user navigates.
+"""
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Union
+
+from econsole.menu_builder import AbstractMenu, MenuItem
+
+MenuItemProvider = Union[Iterable[MenuItem], AsyncIterable[MenuItem], Callable[[], Union[Iterable[MenuItem], AsyncIterable[MenuItem]]]]
+
+
+class MenuItemStream:
+    """
+    Reads menu items from ``provider`` one page at a time, in a background thread. The page after the last one read
+    is fetched ahead, and the last ``cached_pages`` pages read are kept.
+
+    ``provider`` is an iterable or an async iterable of menu items, or a callable returning one. Reading a page that
+    was evicted from the cache starts the provider again and skips the previous items: this needs a callable or an
+    iterable that is not an iterator (e.g. a list or a database cursor factory). A one-shot iterator, such as a
+    generator object, can only be read forward.
+
+    An async provider first read from a running event loop (see :meth:`page_async`) is read on that loop, so it can
+    use resources bound to it; otherwise it is read on a private event loop of the background thread.
+    """
+
+    def __init__(self, provider: MenuItemProvider, page_size: int, cached_pages: int = 8, prefetch: bool = True):
+        self.page_size: int = page_size
+        self.cached_pages: int = max(2, cached_pages)
+        self.prefetch: bool = prefetch
+        self._provider: MenuItemProvider = provider
+        self._pages: OrderedDict[int, list[MenuItem]] = OrderedDict()
+        self._pending: dict[int, Future] = {}
+        self._lock: Lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # Only used from the executor thread
+        self._iterator: Iterator[MenuItem] | AsyncIterator[MenuItem] | None = None
+        self._opened: bool = False
+        self._read: int = 0
+        # Event loop reading the async iterator: the caller's running loop, or a private one (_loop) when None
+        self._iterator_loop: Any = None
+        self._loop: Any = None
+        # Number of items, once the provider is exhausted
+        self.total: int | None = None
+        self.pages_read: int = 0
+
+    @property
+    def page_count(self) -> int:
+        """
+        The number of pages, or the number of pages known to exist (plus the next one) while the provider is not exhausted.
+        """
+        if self.total is not None:
+            return max(1, -(-self.total // self.page_size))
+        return self.pages_read + 1
+
+    def page(self, number: int) -> list[MenuItem]:
+        """
+        Returns the items of page ``number`` (from 0), fetching it if needed; an empty list past the last page.
+
+        :raises LookupError: when the page was evicted and the provider cannot be started again
+        :raises RuntimeError: when called from a running event loop for a page that is not read yet
+            and the provider may be async: reading it needs the loop, use :meth:`page_async`
+        """
+        with self._lock:
+            items: list[MenuItem] | None = self._pages.get(number)
+            if items is not None:
+                self._pages.move_to_end(number)
+        if items is None:
+            future: Future = self._fetch(number)
+            if not future.done() and _running_loop() is not None and self._may_be_async():
+                raise RuntimeError("Reading this page would block the running event loop: await page_async() first")
+            items = future.result()
+
+        if self.prefetch and (self.total is None or (number + 1) * self.page_size < self.total):
+            with self._lock:
+                cached: bool = number + 1 in self._pages
+            if not cached:
+                self._fetch(number + 1)
+        return items
+
+    async def page_async(self, number: int) -> list[MenuItem]:
+        """
+        Same as :meth:`page`, for coroutines: the page is read without blocking the running event loop.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        with self._lock:
+            cached: bool = number in self._pages
+        if not cached:
+            await asyncio.wrap_future(self._fetch(number))
+        return self.page(number)
+
+    def item(self, position: int) -> MenuItem:
+        """
+        :raises IndexError: when there is no item at ``position``
+        """
+        if position < 0:
+            raise IndexError(position)
+        try:
+            items: list[MenuItem] = self.page(position // self.page_size)
+        except LookupError as error:
+            raise IndexError(position) from error
+        return items[position % self.page_size]
+
+    def cached_items(self) -> Iterator[tuple[int, MenuItem]]:
+        """
+        Yields the position and item of every cached item, in position order.
+        """
+        with self._lock:
+            pages: list[tuple[int, list[MenuItem]]] = sorted(self._pages.items())
+        for number, items in pages:
+            yield from enumerate(items, number * self.page_size)
+
+    def close(self):
+        """
+        Closes the provider's iterator and stops the background thread. Reading a page afterwards starts them again.
+        Called from a running event loop, it does not wait for a page being read.
+        """
+        if self._executor is not None:
+            self._executor.submit(self._shutdown)
+            # From a running loop, a page read in progress may be waiting for this loop: it ends once the caller returns to it
+            self._executor.shutdown(wait=_running_loop() is None)
+            self._executor = None
+
+    def _fetch(self, number: int) -> Future:
+        with self._lock:
+            future: Future | None = self._pending.get(number)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="econsole-menu-stream")
+                future = self._pending[number] = self._executor.submit(self._read_page, number, _running_loop())
+        return future
+
+    def _read_page(self, number: int, loop: Any) -> list[MenuItem]:
+        # Executor thread: the only one using the iterator
+        try:
+            with self._lock:
+                items: list[MenuItem] | None = self._pages.get(number)
+            if items is not None:
+                return items
+
+            start: int = number * self.page_size
+            if self.total is not None and start >= self.total:
+                return []
+            if start < self._read or self._iterator is None or (self._iterator_loop is not None and self._iterator_loop.is_closed()):
+                self._open(loop)
+            if self._read < start:
+                self._next_items(start - self._read)
+            items = self._next_items(self.page_size)
+            if len(items) < self.page_size:
+                self.total = start + len(items)
+
+            with self._lock:
+                self._pages[number] = items
+                while len(self._pages) > self.cached_pages:
+                    self._pages.popitem(last=False)
+                self.pages_read = max(self.pages_read, number + 1)
+            return items
+        finally:
+            with self._lock:
+                del self._pending[number]
+
+    def _open(self, loop: Any):
+        if self._opened and not self._restartable():
+            raise LookupError("The menu items provider cannot be read again: provide a callable or a reiterable")
+
+        self._close_iterator()
+        source: Any = self._provider() if self._is_factory() else self._provider
+        self._iterator = source.__aiter__() if hasattr(source, "__aiter__") else iter(source)
+        self._iterator_loop = loop if hasattr(self._iterator, "__anext__") else None
+        self._opened = True
+        self._read = 0
+
+    def _next_items(self, count: int) -> list[MenuItem]:
+        items: list[MenuItem]
+        if hasattr(self._iterator, "__anext__"):
+            import asyncio  # pylint: disable=import-outside-toplevel
+
+            if self._iterator_loop is not None:
+                # The caller's loop awaits the page (page_async) while this thread waits for the items
+                items = asyncio.run_coroutine_threadsafe(_next_items_async(self._iterator, count), self._iterator_loop).result()
+            else:
+                if self._loop is None:
+                    self._loop = asyncio.new_event_loop()
+                items = self._loop.run_until_complete(_next_items_async(self._iterator, count))
+        else:
+            items = [item for _, item in zip(range(count), self._iterator)]
+        self._read += len(items)
+        return items
+
+    def _is_factory(self) -> bool:
+        return callable(self._provider) and not hasattr(self._provider, "__iter__") and not hasattr(self._provider, "__aiter__")
+
+    def _restartable(self) -> bool:
+        if self._is_factory():
+            return True
+        if hasattr(self._provider, "__aiter__"):
+            return not hasattr(self._provider, "__anext__")
+        return not hasattr(self._provider, "__next__")
+
+    def _may_be_async(self) -> bool:
+        if self._iterator is not None:
+            return hasattr(self._iterator, "__anext__")
+        return self._is_factory() or hasattr(self._provider, "__aiter__")
+
+    def _close_iterator(self):
+        if hasattr(self._iterator, "aclose"):
+            if self._iterator_loop is None:
+                self._loop.run_until_complete(self._iterator.aclose())
+            elif not self._iterator_loop.is_closed():
+                import asyncio  # pylint: disable=import-outside-toplevel
+
+                # Not waited for: close() may be called from the loop's thread
+                asyncio.run_coroutine_threadsafe(self._iterator.aclose(), self._iterator_loop)
+        elif hasattr(self._iterator, "close"):
+            self._iterator.close()
+        self._iterator = None
+        self._iterator_loop = None
+
+    def _shutdown(self):
+        self._close_iterator()
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+
+def _running_loop() -> Any:
+    # Without asyncio imported, no event loop can be running
+    asyncio: Any = sys.modules.get("asyncio")
+    if asyncio is None:
+        return None
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _next_items_async(iterator: AsyncIterator[MenuItem], count: int) -> list[MenuItem]:
+    items: list[MenuItem] = []
+    while len(items) < count:
+        try:
+            items.append(await iterator.__anext__())
+        except StopAsyncIteration:
+            break
+    return items
+
+
+class StreamingMenu(AbstractMenu):
+    """
+    Paged menu whose items come from a :class:`MenuItemStream`: only the pages the user displays are read.
+    Item numbers are positions in the provider. The filter (``/text``) only searches the cached pages.
+
+    :param provider: see :class:`MenuItemStream`
+    """
+
+    def __init__(self, title: str, provider: MenuItemProvider, page_size: int = 20, cached_pages: int = 8, prefetch: bool = True):
+        self.stream: MenuItemStream = MenuItemStream(provider, page_size, cached_pages, prefetch)
+        self._seen_total: int | None = None
+        super().__init__(title, page_size)
+
+    def initialise(self):
+        pass
+
+    def update_menu_items(self) -> bool | None:
+        # The page count shown in the footer changes once the provider is exhausted
+        changed: bool = self.stream.total != self._seen_total
+        self._seen_total = self.stream.total
+        return changed
+
+    @property
+    def page_count(self) -> int:
+        return self.stream.page_count
+
+    def render_page(self, page: int) -> str:
+        try:
+            items: list[MenuItem] = self.stream.page(page)
+        except LookupError as error:
+            return self._render((), f"Page {page + 1} is no longer available: {error}")
+
+        start: int = page * self.page_size
+        count: str = str(self.stream.page_count) if self.stream.total is not None else "?"
+        return self._render(
+            (position for position, item in enumerate(items, start) if item.isVisible),
+            f"Page {page + 1}/{count} (n: next, p: previous, g <page>: go to page)",
+        )
+
+    def search_menu_items(self, query: str, limit: int | None = None) -> list[int]:
+        query = query.lower()
+        limit = limit or self.page_size or self.FILTER_LIMIT
+        found: list[int] = []
+        for position, item in self.stream.cached_items():
+            if item.isVisible and query in item.description.lower():
+                found.append(position)
+                if len(found) == limit:
+                    break
+        return found
+
+    def close(self):
+        """
+        Stops the background reading of the provider.
+        """
+        self.stream.close()
+
+    def _menu_item_at(self, position: int) -> MenuItem:
+        return self.stream.item(position)
+
+    async def _load_async(self, page: int, command: str = ""):
+        # The pages the display or the command reads, read here on the running loop
+        command = command.lower()
+        pages: list[int] = [page]
+        if command == "n":
+            pages.append(page + 1)
+        elif command == "p":
+            pages.append(page - 1)
+        elif command.startswith("g") and command[1:].strip().isdigit():
+            pages.append(int(command[1:]) - 1)
+        elif command.isdigit():
+            pages.append(int(command) // self.page_size)
+        for number in pages:
+            if number < 0:
+                continue
+            try:
+                await self.stream.page_async(number)
+            except LookupError:
+                # Reported when the page is displayed or the command handled
+                pass
+
+    def _page_command(self, inp: str, page: int) -> int | None:
+        command: str = inp.lower()
+        target: int | None = None
+        if command == "n":
+            target = page + 1
+        elif command.startswith("g") and command[1:].strip().isdigit():
+            target = int(command[1:]) - 1
+        if target is not None and self.stream.total is None and target >= self.stream.pages_read:
+            # Reads forward up to the requested page, to know whether it exists
+            try:
+                self.stream.page(target)
+            except LookupError as error:
+                print(f"Invalid page. {error}")
+                return page
+        return super()._page_command(inp, page)
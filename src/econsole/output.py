@@ -0,0 +1,163 @@
+"""
+Buffered output for :class:`econsole.styles.Print`.
+"""
+from __future__ import annotations
+
+import atexit
+import io
+import sys
+from enum import Enum
+from threading import Lock, Timer
+from time import monotonic
+from typing import BinaryIO, TextIO
+from weakref import WeakSet
+
+
+class FlushPolicy(Enum):
+    LINE = 0
+    SIZE = 1
+    INTERVAL = 2
+
+
+class OutputBuffer:
+    """
+    Write buffer in front of a text or binary stream. Many :class:`econsole.styles.Print` instances
+    (and threads) can share the same buffer; it is only written to the stream according to ``flush_policy``:
+
+    - ``LINE``: whenever a written chunk contains a newline
+    - ``SIZE``: whenever ``size_threshold`` characters are buffered
+    - ``INTERVAL``: at most ``interval_in_seconds`` after a write, from a timer thread, or on the first write happening
+      ``interval_in_seconds`` after the previous flush. Output still buffered is flushed when the interpreter exits.
+
+    :param stream: the target stream, ``sys.stdout`` (resolved at flush time) when None
+    :param encoding: used to encode the text when ``stream`` is a binary stream
+    """
+
+    __slots__ = (
+        "_stream",
+        "_flush_policy",
+        "_size_threshold",
+        "_interval",
+        "_encoding",
+        "_parts",
+        "_size",
+        "_last_flush",
+        "_lock",
+        "_timer",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        stream: TextIO | BinaryIO | None = None,
+        flush_policy: FlushPolicy = FlushPolicy.LINE,
+        size_threshold: int = 8192,
+        interval_in_seconds: float = 0.1,
+        encoding: str = "utf-8",
+    ):
+        self._stream: TextIO | BinaryIO | None = stream
+        self._flush_policy: FlushPolicy = flush_policy
+        self._size_threshold: int = size_threshold
+        self._interval: float = interval_in_seconds
+        self._encoding: str = encoding
+        self._parts: list[str] = []
+        self._size: int = 0
+        self._last_flush: float = monotonic()
+        self._lock: Lock = Lock()
+        # Pending flush of the INTERVAL policy
+        self._timer: Timer | None = None
+
+    @property
+    def stream(self) -> TextIO | BinaryIO:
+        return self._stream if self._stream is not None else sys.stdout
+
+    def write(self, text: str):
+        with self._lock:
+            self._parts.append(text)
+            self._size += len(text)
+
+            if self._flush_policy is FlushPolicy.LINE:
+                must_flush = "\n" in text
+            elif self._flush_policy is FlushPolicy.SIZE:
+                must_flush = self._size >= self._size_threshold
+            else:
+                elapsed: float = monotonic() - self._last_flush
+                must_flush = elapsed >= self._interval
+                if not must_flush and self._timer is None:
+                    self._schedule_flush(self._interval - elapsed)
+
+            if must_flush:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _schedule_flush(self, delay: float):
+        self._timer = Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+        _pending_buffers.add(self)
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            _pending_buffers.discard(self)
+        if self._parts:
+            write_to_stream(self.stream, "".join(self._parts), self._encoding)
+            self._parts.clear()
+            self._size = 0
+        self.stream.flush()
+        self._last_flush = monotonic()
+
+    def __enter__(self) -> OutputBuffer:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+
+# Buffers holding output until their INTERVAL timer fires; the timer threads do not outlive the interpreter
+_pending_buffers: WeakSet[OutputBuffer] = WeakSet()
+
+
+def _flush_pending_buffers():
+    for buffer in list(_pending_buffers):
+        buffer.flush()
+
+
+atexit.register(_flush_pending_buffers)
+
+
+def write_output(output: OutputBuffer | TextIO | BinaryIO | None, text: str, flush: bool = False):
+    """
+    Writes ``text`` to an OutputBuffer or a text or binary stream, ``sys.stdout`` when ``output`` is None.
+    """
+    if output is None:
+        output = sys.stdout
+    if isinstance(output, OutputBuffer):
+        output.write(text)
+    else:
+        write_to_stream(output, text)
+    if flush:
+        output.flush()
+
+
+def output_stream(output: OutputBuffer | TextIO | BinaryIO | None) -> TextIO | BinaryIO:
+    """
+    Returns the stream ``output`` ends up in: the stream of an OutputBuffer, ``sys.stdout`` when ``output`` is None.
+    """
+    if isinstance(output, OutputBuffer):
+        return output.stream
+    return output if output is not None else sys.stdout
+
+
+def write_to_stream(stream: TextIO | BinaryIO, text: str, encoding: str = "utf-8"):
+    """
+    Writes ``text`` to ``stream``, encoding it first when ``stream`` is a binary stream.
+    """
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        stream.write(text.encode(encoding))
+    else:
+        stream.write(text)
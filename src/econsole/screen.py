@@ -0,0 +1,253 @@
+"""
+Double-buffered screen model.
+
+Drawing happens in a back buffer; :meth:`ScreenBuffer.render` compares it with the frame currently displayed
+and only emits the cursor moves and SGR runs needed for the cells that changed.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import BinaryIO, TextIO
+
+from econsole import sequences, sgr
+from econsole.output import OutputBuffer, write_output
+from econsole.sgr import CellAttributes, Color
+
+# Unchanged cells shorter than a cursor move sequence
+_MAX_REWRITTEN_GAP: int = 4
+# Color parameters interned before those no longer on screen are evicted
+_MAX_PARAMETERS: int = 4096
+
+
+class ScreenBuffer:
+    """
+    A ``width`` x ``height`` grid of single-column cells. Each cell holds a character, a foreground id,
+    a background id and an attribute id, stored in flat arrays.
+
+    Colors are given as a :class:`econsole.colors.Color4Bits`, an 8-bit palette index or an ``(r, g, b)`` tuple.
+    The back buffer is kept between frames: only redraw what changes.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "_chars",
+        "_foregrounds",
+        "_backgrounds",
+        "_attributes",
+        "_front_chars",
+        "_front_foregrounds",
+        "_front_backgrounds",
+        "_front_attributes",
+        "_parameters",
+        "_parameter_ids",
+        "_states",
+        "_invalidated",
+    )
+
+    def __init__(self, width: int, height: int):
+        self.width: int = width
+        self.height: int = height
+        self._chars, self._foregrounds, self._backgrounds, self._attributes = _blank_cells(width * height)
+        self._front_chars, self._front_foregrounds, self._front_backgrounds, self._front_attributes = _blank_cells(width * height)
+        self._parameters: list[str | None] = [None]
+        self._parameter_ids: dict[str, int] = {}
+        self._states: dict[tuple[int, int, int], tuple[str | None, ...]] = {}
+        self._invalidated: bool = True
+
+    def resize(self, width: int, height: int):
+        """
+        Resizes the screen, clearing it. The next frame is a full repaint.
+        """
+        self.width = width
+        self.height = height
+        self._chars, self._foregrounds, self._backgrounds, self._attributes = _blank_cells(width * height)
+        self._front_chars, self._front_foregrounds, self._front_backgrounds, self._front_attributes = _blank_cells(width * height)
+        self._invalidated = True
+
+    def invalidate(self):
+        """
+        Forces the next frame to be a full repaint, e.g. after something else wrote to the terminal.
+        """
+        self._invalidated = True
+
+    def clear(self):
+        """
+        Blanks the back buffer.
+        """
+        self._chars, self._foregrounds, self._backgrounds, self._attributes = _blank_cells(self.width * self.height)
+
+    def write(
+        self,
+        row: int,
+        column: int,
+        text: str,
+        foreground: Color = None,
+        background: Color = None,
+        attributes: CellAttributes = CellAttributes.NONE,
+    ):
+        """
+        Writes ``text`` in the back buffer, starting at (``row``, ``column``), both 0-based.
+        Text going beyond the right edge is clipped.
+        """
+        if not 0 <= row < self.height or column >= self.width:
+            return
+        if column < 0:
+            text = text[-column:]
+            column = 0
+
+        text = text[: self.width - column]
+        length: int = len(text)
+        if not length:
+            return
+
+        start: int = row * self.width + column
+        end: int = start + length
+        self._chars[start:end] = list(text)
+        self._foregrounds[start:end] = array("I", [self._parameter_id(sgr.foreground_parameter(foreground))]) * length
+        self._backgrounds[start:end] = array("I", [self._parameter_id(sgr.background_parameter(background))]) * length
+        self._attributes[start:end] = array("B", [int(attributes)]) * length
+
+    def fill(
+        self,
+        row: int,
+        column: int,
+        width: int,
+        height: int,
+        char: str = " ",
+        foreground: Color = None,
+        background: Color = None,
+        attributes: CellAttributes = CellAttributes.NONE,
+    ):
+        for current_row in range(row, row + height):
+            self.write(current_row, column, char * width, foreground, background, attributes)
+
+    def render(self) -> str:
+        """
+        Returns the sequences turning the displayed frame into the back buffer, then makes the back buffer the displayed frame.
+        """
+        parts: list[str] = []
+        if self._invalidated:
+            # The cleared terminal is a blank frame: only non-blank cells get painted
+            self._reset_front()
+            parts.append(sequences.RESET)
+            parts.append(sequences.CLEAR_ALL)
+
+        chars, foregrounds, backgrounds, attributes = self._chars, self._foregrounds, self._backgrounds, self._attributes
+        front_chars, front_foregrounds, front_backgrounds, front_attributes = (
+            self._front_chars,
+            self._front_foregrounds,
+            self._front_backgrounds,
+            self._front_attributes,
+        )
+        width: int = self.width
+        state: tuple[str | None, ...] = sgr.DEFAULT_STATE
+
+        for row in range(self.height):
+            start: int = row * width
+            end: int = start + width
+            # A gap is only rewritten within a row: the cursor never wraps to the next one
+            cursor: int = -1
+            if (
+                chars[start:end] == front_chars[start:end]
+                and foregrounds[start:end] == front_foregrounds[start:end]
+                and backgrounds[start:end] == front_backgrounds[start:end]
+                and attributes[start:end] == front_attributes[start:end]
+            ):
+                continue
+
+            for index in range(start, end):
+                if (
+                    chars[index] == front_chars[index]
+                    and foregrounds[index] == front_foregrounds[index]
+                    and backgrounds[index] == front_backgrounds[index]
+                    and attributes[index] == front_attributes[index]
+                ):
+                    continue
+
+                if index != cursor:
+                    if cursor != -1 and index - cursor <= _MAX_REWRITTEN_GAP and self._gap_has_state(cursor, index, state):
+                        # Re-emitting a few unchanged cells is shorter than a cursor move
+                        parts.extend(chars[cursor:index])
+                    else:
+                        parts.append(sequences.cursor_at(row + 1, index - start + 1))
+
+                cell_state: tuple[str | None, ...] = self._state(foregrounds[index], backgrounds[index], attributes[index])
+                if cell_state != state:
+                    parts.append(sgr.transition(state, cell_state))
+                    state = cell_state
+
+                parts.append(chars[index])
+                cursor = index + 1
+
+        if state != sgr.DEFAULT_STATE:
+            parts.append(sequences.RESET)
+
+        front_chars[:] = chars
+        front_foregrounds[:] = foregrounds
+        front_backgrounds[:] = backgrounds
+        front_attributes[:] = attributes
+        self._invalidated = False
+        if len(self._parameters) > _MAX_PARAMETERS:
+            self._evict_parameters()
+
+        return "".join(parts)
+
+    def present(self, output: OutputBuffer | TextIO | BinaryIO):
+        """
+        Renders the frame and writes it to ``output``.
+        """
+        frame: str = self.render()
+        if frame:
+            write_output(output, frame, flush=True)
+
+    def _reset_front(self):
+        self._front_chars, self._front_foregrounds, self._front_backgrounds, self._front_attributes = _blank_cells(self.width * self.height)
+
+    def _gap_has_state(self, start: int, end: int, state: tuple[str | None, ...]) -> bool:
+        foregrounds, backgrounds, attributes = self._foregrounds, self._backgrounds, self._attributes
+        return all(self._state(foregrounds[index], backgrounds[index], attributes[index]) == state for index in range(start, end))
+
+    def _parameter_id(self, parameter: str | None) -> int:
+        if parameter is None:
+            return 0
+
+        parameter_id: int | None = self._parameter_ids.get(parameter)
+        if parameter_id is None:
+            parameter_id = len(self._parameters)
+            self._parameters.append(parameter)
+            self._parameter_ids[parameter] = parameter_id
+        return parameter_id
+
+    def _evict_parameters(self):
+        """
+        Forgets the parameters no cell uses anymore, renumbering the others.
+        Only called after a render, when the back buffer and the displayed frame are the same.
+        """
+        used: list[int] = sorted(set(self._foregrounds) | set(self._backgrounds) | {0})
+        new_ids: dict[int, int] = {parameter_id: new_id for new_id, parameter_id in enumerate(used)}
+        self._parameters = [self._parameters[parameter_id] for parameter_id in used]
+        self._parameter_ids = {parameter: new_id for new_id, parameter in enumerate(self._parameters) if parameter is not None}
+        self._states.clear()
+        self._foregrounds = array("I", map(new_ids.__getitem__, self._foregrounds))
+        self._backgrounds = array("I", map(new_ids.__getitem__, self._backgrounds))
+        self._front_foregrounds[:] = self._foregrounds
+        self._front_backgrounds[:] = self._backgrounds
+
+    def _state(self, foreground_id: int, background_id: int, attribute_id: int) -> tuple[str | None, ...]:
+        key: tuple[int, int, int] = (foreground_id, background_id, attribute_id)
+        state: tuple[str | None, ...] | None = self._states.get(key)
+        if state is None:
+            slots: list[str | None] = list(sgr.DEFAULT_STATE)
+            sgr.apply_attributes(slots, attribute_id)
+            slots[sgr.FOREGROUND] = self._parameters[foreground_id]
+            slots[sgr.BACKGROUND] = self._parameters[background_id]
+            state = self._states[key] = tuple(slots)
+        return state
+
+
+def _blank_cells(size: int) -> tuple[list[str], array, array, array]:
+    """
+    Characters, foreground ids, background ids and attribute ids of ``size`` blank cells.
+    """
+    return [" "] * size, array("I", bytes(4 * size)), array("I", bytes(4 * size)), array("B", bytes(size))
@@ -0,0 +1,211 @@
+"""
+Type-to-filter search over short texts, such as menu item descriptions.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from heapq import merge
+from itertools import groupby
+from typing import Callable, Iterable, Sequence
+
+
+class TrigramIndex:
+    """
+    Case-insensitive index of texts, identified by their insertion position.
+
+    Texts are indexed by word (word -> positions) and words by trigram (trigram -> words): indexing a text only
+    costs a few dictionary updates, and a query only checks the texts having a word that contains its rarest word.
+
+    A query matches the texts containing it. Texts where it starts a word come first, then the others, each in
+    position order; the search stops once ``limit`` of the former are found, so common queries are as fast as rare
+    ones. When fewer than ``limit`` texts match exactly, texts having words that share a third of their trigrams
+    with two thirds of the query words of 3 characters or more, and containing the shorter ones, are appended,
+    most matched query words first, so that typos still find something.
+
+    When a search reads every match of a query, they are kept: refining that query (typing more characters)
+    only checks them, and adding texts updates them instead of invalidating them.
+    """
+
+    __slots__ = ("_texts", "_postings", "_vocabulary", "_sorted_words", "_last_query", "_last_matches", "_last_size")
+
+    def __init__(self, texts: Iterable[str] = ()):
+        self._texts: list[str] = []
+        self._postings: dict[str, list[int]] = {}
+        self._vocabulary: dict[str, set[str]] = {}
+        self._sorted_words: list[str] | None = None
+        self._last_query: str = ""
+        self._last_matches: list[int] = []
+        self._last_size: int = 0
+        for text in texts:
+            self.add(text)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, text: str) -> int:
+        """
+        Indexes ``text`` and returns its position.
+        """
+        position: int = len(self._texts)
+        text = text.lower()
+        self._texts.append(text)
+        for word in set(text.split()):
+            posting: list[int] | None = self._postings.get(word)
+            if posting is not None:
+                posting.append(position)
+                continue
+
+            self._postings[word] = [position]
+            self._sorted_words = None
+            for trigram in _trigrams(word):
+                words: set[str] | None = self._vocabulary.get(trigram)
+                if words is None:
+                    self._vocabulary[trigram] = {word}
+                else:
+                    words.add(word)
+        return position
+
+    def matches(self, query: str) -> list[int]:
+        """
+        Returns the positions of the texts containing ``query``, in order.
+        """
+        query = query.lower()
+        texts: list[str] = self._texts
+        found: list[int] = [position for position in self._candidates(query) if query in texts[position]]
+        self._remember(query, found)
+        return found
+
+    def search(self, query: str, limit: int = 20, accept: Callable[[int], bool] | None = None) -> list[int]:
+        """
+        Returns the positions of the ``limit`` best matches of ``query``, best first.
+
+        :param accept: when set, only the positions for which it returns True are returned (e.g. visible items)
+        """
+        query = query.lower()
+        if not query.strip():
+            return []
+
+        texts: list[str] = self._texts
+        spaced: str = " " + query
+        # Without any word starting like the query, the first matches are the best ones
+        word_starts: bool = not query[0].isspace() and self._has_word_starting_with(query.split()[0])
+        best: list[int] = []
+        others: list[int] = []
+        found: list[int] = []
+        for position in self._candidates(query):
+            text: str = texts[position]
+            if query not in text:
+                continue
+            found.append(position)
+            if accept is not None and not accept(position):
+                continue
+
+            if word_starts and (text.startswith(query) or spaced in text):
+                best.append(position)
+                if len(best) == limit:
+                    break
+            elif len(others) < limit:
+                others.append(position)
+                if not word_starts and len(others) == limit:
+                    break
+        else:
+            self._remember(query, found)
+        best.extend(others[: limit - len(best)])
+
+        tokens: list[str] = [token for token in query.split() if len(token) >= 3]
+        if len(best) < limit and tokens:
+            short_tokens: list[str] = [token for token in query.split() if len(token) < 3]
+            best.extend(self._fuzzy(tokens, short_tokens, limit - len(best), set(found), accept))
+        return best
+
+    def _remember(self, query: str, found: list[int]):
+        self._last_query, self._last_matches, self._last_size = query, found, len(self._texts)
+
+    def _candidates(self, query: str) -> Sequence[int]:
+        """
+        Returns positions, in order, including those of every text containing ``query``.
+        """
+        texts: list[str] = self._texts
+        if self._last_query and query.startswith(self._last_query):
+            if self._last_size < len(texts):
+                last_query: str = self._last_query
+                self._last_matches.extend(position for position in range(self._last_size, len(texts)) if last_query in texts[position])
+                self._last_size = len(texts)
+            return self._last_matches
+
+        # Every word of the query is part of a word of the matching texts: the rarest one gives the candidates
+        tokens: list[str] = query.split()
+        if not tokens:
+            return range(len(texts))
+        long_tokens: list[str] = [token for token in tokens if len(token) >= 3]
+        postings: list[list[list[int]]] = [
+            [self._postings[word] for word in self._words_containing(token)] for token in long_tokens or [max(tokens, key=len)]
+        ]
+        rarest: list[list[int]] = min(postings, key=lambda token_postings: sum(map(len, token_postings)))
+        if len(rarest) == 1:
+            return rarest[0]
+        if sum(map(len, rarest)) * 4 > len(texts):
+            return range(len(texts))
+        return sorted(set().union(*rarest))
+
+    def _has_word_starting_with(self, prefix: str) -> bool:
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._postings)
+        index: int = bisect_left(self._sorted_words, prefix)
+        return index < len(self._sorted_words) and self._sorted_words[index].startswith(prefix)
+
+    def _words_containing(self, token: str) -> list[str]:
+        if len(token) < 3:
+            return [word for word in self._postings if token in word]
+
+        smallest: set[str] | None = None
+        for trigram in _trigrams(token):
+            words: set[str] | None = self._vocabulary.get(trigram)
+            if words is None:
+                return []
+            if smallest is None or len(words) < len(smallest):
+                smallest = words
+        return [word for word in smallest if token in word]
+
+    def _similar_words(self, token: str) -> list[str]:
+        trigrams: set[str] = _trigrams(token)
+        counts: Counter = Counter()
+        for trigram in trigrams:
+            counts.update(self._vocabulary.get(trigram, ()))
+        threshold: int = max(1, len(trigrams) // 3)
+        return [word for word, count in counts.items() if count >= threshold]
+
+    def _fuzzy(self, tokens: list[str], short_tokens: list[str], limit: int, exclude: set[int], accept: Callable[[int], bool] | None) -> list[int]:
+        # Score: number of query words (of 3 characters or more) having a similar word in the text.
+        # Shorter query words have no trigrams to be similar: texts must contain them as they are.
+        similar: list[set[str]] = [set(self._similar_words(token)) for token in tokens]
+        threshold: int = len(tokens) - len(tokens) // 3
+        # A text reaching the threshold has a word similar to one of the (len(tokens) - threshold + 1) rarest query words
+        sizes: list[int] = [sum(len(self._postings[word]) for word in words) for words in similar]
+        rarest: list[int] = sorted(range(len(tokens)), key=sizes.__getitem__)[: len(tokens) - threshold + 1]
+        postings: list[list[int]] = [self._postings[word] for index in rarest for word in similar[index]]
+
+        best_score: int = sum(1 for words in similar if words)
+        if best_score < threshold:
+            return []
+
+        texts: list[str] = self._texts
+        by_score: list[list[int]] = [[] for _ in range(best_score + 1)]
+        for position, _ in groupby(merge(*postings)):
+            if position in exclude or (accept is not None and not accept(position)):
+                continue
+            text: str = texts[position]
+            if short_tokens and not all(token in text for token in short_tokens):
+                continue
+            words: set[str] = set(text.split())
+            score: int = sum(not words.isdisjoint(similar_words) for similar_words in similar if similar_words)
+            if score >= threshold and len(by_score[score]) < limit:
+                by_score[score].append(position)
+                if len(by_score[-1]) == limit:
+                    break
+        return [position for positions in reversed(by_score) for position in positions][:limit]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[index : index + 3] for index in range(len(text) - 2)}
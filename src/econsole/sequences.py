@@ -0,0 +1,217 @@
+"""
+Precomputed escape sequences.
+
+Every fixed sequence emitted by :class:`econsole.styles.ConsoleCharacters` is built once, at import time, and interned.
+Parameterised sequences (256 colors, RGB colors, cursor positioning) go through cached encoders.
+"""
+from functools import lru_cache
+from sys import intern
+
+CSI: str = "\u001b["
+
+# All single-parameter SGR sequences, indexed by their code: SGR[1] == "\u001b[1m"
+SGR: tuple[str, ...] = tuple(intern(f"{CSI}{code}m") for code in range(108))
+FOREGROUND_8BITS: tuple[str, ...] = tuple(intern(f"{CSI}38;5;{value}m") for value in range(256))
+BACKGROUND_8BITS: tuple[str, ...] = tuple(intern(f"{CSI}48;5;{value}m") for value in range(256))
+
+RESET: str = SGR[0]
+BOLD: str = SGR[1]
+THIN: str = SGR[2]
+ITALIC: str = SGR[3]
+UNDERLINE: str = SGR[4]
+SLOW_BLINK: str = SGR[5]
+FAST_BLINK: str = SGR[6]
+SWAP_COLORS: str = SGR[7]
+CONCEAL: str = SGR[8]
+STRIKE_OUT: str = SGR[9]
+FRAKTUR: str = SGR[20]
+RESET_BOLD: str = SGR[21]
+DOUBLE_UNDERLINE: str = SGR[21]
+RESET_FONT_WEIGHT: str = SGR[22]
+RESET_ITALIC: str = SGR[23]
+RESET_FRAKTUR: str = SGR[23]
+RESET_UNDERLINE: str = SGR[24]
+RESET_BLINK: str = SGR[25]
+RESET_SWAP_COLORS: str = SGR[27]
+RESET_CONCEAL: str = SGR[28]
+RESET_STRIKE_OUT: str = SGR[29]
+RESET_FOREGROUND: str = SGR[39]
+RESET_BACKGROUND: str = SGR[49]
+FRAMED: str = SGR[51]
+ENCIRCLED: str = SGR[52]
+OVERLINED: str = SGR[53]
+RESET_FRAMED_ENCIRCLED: str = SGR[54]
+RESET_OVERLINED: str = SGR[55]
+IDEOGRAM_UNDERLINED: str = SGR[60]
+IDEOGRAM_DOUBLE_UNDERLINED: str = SGR[61]
+IDEOGRAM_OVERLINED: str = SGR[62]
+IDEOGRAM_DOUBLE_OVERLINED: str = SGR[63]
+IDEOGRAM_STRESS_MARKING: str = SGR[64]
+RESET_IDEOGRAM: str = SGR[65]
+
+CLEAR_FROM_CURSOR_TO_END_OF_LINE: str = intern(f"{CSI}K")
+CLEAR_FROM_LINE_START_TO_CURSOR: str = intern(f"{CSI}1K")
+CLEAR_LINE: str = intern(f"{CSI}2K")
+CLEAR_BELOW: str = intern(f"{CSI}J")
+CLEAR_ABOVE: str = intern(f"{CSI}1J")
+CLEAR_ALL: str = intern(f"{CSI}2J")
+CLEAR_SAVED_LINES: str = intern(f"{CSI}3J")
+
+MOVE_CURSOR_AT_00: str = intern(f"{CSI}H")
+SAVE_CURSOR_POSITION: str = intern(f"{CSI}7")
+RESTORE_CURSOR_POSITION: str = intern(f"{CSI}8")
+MOVE_CURSOR_BACK_ONE_SPACE: str = "\b"
+MAKE_CURSOR_INVISIBLE: str = intern(f"{CSI}?25l")
+MAKE_CURSOR_VISIBLE: str = intern(f"{CSI}?25h")
+
+SAVE_SCREEN: str = intern(f"{CSI}?47h")
+RESTORE_SCREEN: str = intern(f"{CSI}?47l")
+PRINT_SCREEN: str = intern(f"{CSI}?0i")
+DUMP_SCREEN_TO_HTML: str = intern(f"{CSI}?10i")
+DUMP_SCREEN_TO_SVG: str = intern(f"{CSI}?11i")
+
+BELL: str = "\a"
+SET_AUTOWRAP: str = intern(f"{CSI}?7h")
+UNSET_AUTOWRAP: str = intern(f"{CSI}?7l")
+SET_CURSOR_BLINK: str = intern(f"{CSI}?14h")
+UNSET_CURSOR_BLINK: str = intern(f"{CSI}?14l")
+SET_TEKTRONIX: str = intern(f"{CSI}?38h")
+UNSET_TEKTRONIX: str = intern(f"{CSI}?38l")
+SET_SLOW_SCROLL: str = intern(f"{CSI}?4h")
+UNSET_SLOW_SCROLL: str = intern(f"{CSI}?4l")
+SET_MARGIN_BELL: str = intern(f"{CSI}?44h")
+UNSET_MARGIN_BELL: str = intern(f"{CSI}?44l")
+
+NEVER_HIDE_MOUSE: str = intern(f"{CSI}0p")
+HIDE_MOUSE_IF_TRACKING_MODE_ENABLED: str = intern(f"{CSI}1p")
+HIDE_MOUSE_EXCEPT_LEAVING_WINDOW: str = intern(f"{CSI}2p")
+HIDE_MOUSE: str = intern(f"{CSI}3p")
+RESET_SCROLLING_REGION: str = intern(f"{CSI}r")
+
+# Fixed sequences by ConsoleCharacters method name
+SEQUENCES: dict[str, str] = {
+    "reset": RESET,
+    "set_bold": BOLD,
+    "set_thin": THIN,
+    "set_italic": ITALIC,
+    "set_underline": UNDERLINE,
+    "set_slow_blink": SLOW_BLINK,
+    "set_fast_blink": FAST_BLINK,
+    "swap_colors": SWAP_COLORS,
+    "set_conceal": CONCEAL,
+    "set_strike_out": STRIKE_OUT,
+    "set_fraktur": FRAKTUR,
+    "reset_bold": RESET_BOLD,
+    "set_double_underline": DOUBLE_UNDERLINE,
+    "reset_font_weight": RESET_FONT_WEIGHT,
+    "reset_italic": RESET_ITALIC,
+    "reset_fraktur": RESET_FRAKTUR,
+    "reset_underline": RESET_UNDERLINE,
+    "reset_blink": RESET_BLINK,
+    "reset_swap_colors": RESET_SWAP_COLORS,
+    "reset_conceal": RESET_CONCEAL,
+    "reset_strike_out": RESET_STRIKE_OUT,
+    "reset_foreground": RESET_FOREGROUND,
+    "reset_background": RESET_BACKGROUND,
+    "set_framed": FRAMED,
+    "set_encircled": ENCIRCLED,
+    "set_overlined": OVERLINED,
+    "reset_framed_encircled": RESET_FRAMED_ENCIRCLED,
+    "reset_overlined": RESET_OVERLINED,
+    "set_ideogram_underlined": IDEOGRAM_UNDERLINED,
+    "set_ideogram_double_underlined": IDEOGRAM_DOUBLE_UNDERLINED,
+    "set_ideogram_overlined": IDEOGRAM_OVERLINED,
+    "set_ideogram_double_overlined": IDEOGRAM_DOUBLE_OVERLINED,
+    "set_ideogram_stress_marking": IDEOGRAM_STRESS_MARKING,
+    "reset_ideogram": RESET_IDEOGRAM,
+    "clear_from_cursor_to_end_of_line": CLEAR_FROM_CURSOR_TO_END_OF_LINE,
+    "clear_from_line_start_to_cursor": CLEAR_FROM_LINE_START_TO_CURSOR,
+    "clear_line": CLEAR_LINE,
+    "clear_below": CLEAR_BELOW,
+    "clear_above": CLEAR_ABOVE,
+    "clear_all": CLEAR_ALL,
+    "clear_saved_lines": CLEAR_SAVED_LINES,
+    "move_cursor_at_00": MOVE_CURSOR_AT_00,
+    "save_cursor_position": SAVE_CURSOR_POSITION,
+    "restore_cursor_position": RESTORE_CURSOR_POSITION,
+    "move_cursor_back_one_space": MOVE_CURSOR_BACK_ONE_SPACE,
+    "make_cursor_invisible": MAKE_CURSOR_INVISIBLE,
+    "make_cursor_visible": MAKE_CURSOR_VISIBLE,
+    "save_screen": SAVE_SCREEN,
+    "restore_screen": RESTORE_SCREEN,
+    "print_screen": PRINT_SCREEN,
+    "dump_screen_to_html": DUMP_SCREEN_TO_HTML,
+    "dump_screen_to_svg": DUMP_SCREEN_TO_SVG,
+    "bell": BELL,
+    "set_autowrap": SET_AUTOWRAP,
+    "unset_autowrap": UNSET_AUTOWRAP,
+    "set_cursor_blink": SET_CURSOR_BLINK,
+    "unset_cursor_blink": UNSET_CURSOR_BLINK,
+    "set_tektronix": SET_TEKTRONIX,
+    "unset_tektronix": UNSET_TEKTRONIX,
+    "set_slow_scroll": SET_SLOW_SCROLL,
+    "unset_slow_scroll": UNSET_SLOW_SCROLL,
+    "set_margin_bell": SET_MARGIN_BELL,
+    "unset_margin_bell": UNSET_MARGIN_BELL,
+    "never_hide_mouse": NEVER_HIDE_MOUSE,
+    "hide_mouse_if_tracking_mode_enabled": HIDE_MOUSE_IF_TRACKING_MODE_ENABLED,
+    "hide_mouse_except_leaving_window": HIDE_MOUSE_EXCEPT_LEAVING_WINDOW,
+    "hide_mouse": HIDE_MOUSE,
+    "reset_scrolling_region": RESET_SCROLLING_REGION,
+}
+
+
+def get_sequence(name: str) -> str:
+    """
+    Returns the fixed sequence produced by the ConsoleCharacters method named ``name``.
+
+    :raises KeyError: if ``name`` is not a fixed sequence
+    """
+    return SEQUENCES[name]
+
+
+def sgr(code: int) -> str:
+    """
+    Returns the single-parameter SGR sequence for ``code``, e.g. ``sgr(91)`` for a red foreground.
+    """
+    if 0 <= code < 108:
+        return SGR[code]
+    return f"{CSI}{code}m"
+
+
+def foreground_8bits(value: int) -> str:
+    validate_byte("value", value)
+    return FOREGROUND_8BITS[value]
+
+
+def background_8bits(value: int) -> str:
+    validate_byte("value", value)
+    return BACKGROUND_8BITS[value]
+
+
+@lru_cache(maxsize=4096)
+def foreground_24bits(r: int, g: int, b: int) -> str:
+    validate_rgb(r, g, b)
+    return intern(f"{CSI}38;2;{r};{g};{b}m")
+
+
+@lru_cache(maxsize=4096)
+def background_24bits(r: int, g: int, b: int) -> str:
+    validate_rgb(r, g, b)
+    return intern(f"{CSI}48;2;{r};{g};{b}m")
+
+
+@lru_cache(maxsize=4096)
+def cursor_at(x: int, y: int) -> str:
+    return f"{CSI}{x};{y}H"
+
+
+def validate_byte(name: str, value: int):
+    if not 0 <= value <= 255:
+        raise ValueError(f'"{name}" must be between 0 and 255, not {value}')
+
+
+def validate_rgb(r: int, g: int, b: int):
+    validate_byte("r", r)
+    validate_byte("g", g)
+    validate_byte("b", b)
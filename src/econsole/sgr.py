@@ -0,0 +1,236 @@
+"""
+Terminal attribute state and minimal SGR transitions.
+
+A state is a tuple with one SGR parameter (or None when the attribute is at its default) per attribute slot.
+:func:`transition` returns the single, merged sequence that moves the terminal from one state to another.
+"""
+from enum import IntFlag
+from functools import lru_cache
+from typing import Callable
+
+from econsole.colors import Color4Bits, palette_to_4bits, rgb_to_4bits, rgb_to_8bits
+from econsole.sequences import CSI, RESET, validate_byte, validate_rgb
+from econsole.terminal import ColorDepth, add_color_mode_listener, get_terminal_profile
+
+WEIGHT: int = 0
+ITALIC: int = 1
+UNDERLINE: int = 2
+BLINK: int = 3
+SWAP: int = 4
+CONCEAL: int = 5
+STRIKE: int = 6
+FONT: int = 7
+FOREGROUND: int = 8
+BACKGROUND: int = 9
+
+Color = Color4Bits | int | tuple[int, int, int] | None
+
+
+class CellAttributes(IntFlag):
+    NONE = 0
+    BOLD = 1
+    THIN = 2
+    ITALIC = 4
+    UNDERLINE = 8
+    BLINK = 16
+    SWAP = 32
+    CONCEAL = 64
+    STRIKE = 128
+
+
+ATTRIBUTE_SLOTS: tuple[tuple[CellAttributes, int, str], ...] = (
+    (CellAttributes.BOLD, WEIGHT, "1"),
+    (CellAttributes.THIN, WEIGHT, "2"),
+    (CellAttributes.ITALIC, ITALIC, "3"),
+    (CellAttributes.UNDERLINE, UNDERLINE, "4"),
+    (CellAttributes.BLINK, BLINK, "5"),
+    (CellAttributes.SWAP, SWAP, "7"),
+    (CellAttributes.CONCEAL, CONCEAL, "8"),
+    (CellAttributes.STRIKE, STRIKE, "9"),
+)
+
+SLOT_COUNT: int = 10
+DEFAULT_STATE: tuple[str | None, ...] = (None,) * SLOT_COUNT
+
+# Parameter that returns each slot to its default
+_RESET_PARAMETERS: tuple[str, ...] = ("22", "23", "24", "25", "27", "28", "29", "10", "39", "49")
+
+FOREGROUND_4BITS_PARAMETERS: dict[Color4Bits, str] = {color: str(color.value[0]) for color in Color4Bits}
+BACKGROUND_4BITS_PARAMETERS: dict[Color4Bits, str] = {color: str(color.value[1]) for color in Color4Bits}
+_FOREGROUND_8BITS_PARAMETERS: tuple[str, ...] = tuple(f"38;5;{value}" for value in range(256))
+_BACKGROUND_8BITS_PARAMETERS: tuple[str, ...] = tuple(f"48;5;{value}" for value in range(256))
+
+
+def foreground_8bits(value: int) -> str:
+    validate_byte("value", value)
+    return _FOREGROUND_8BITS_PARAMETERS[value]
+
+
+def background_8bits(value: int) -> str:
+    validate_byte("value", value)
+    return _BACKGROUND_8BITS_PARAMETERS[value]
+
+
+@lru_cache(maxsize=4096)
+def foreground_24bits(r: int, g: int, b: int) -> str:
+    validate_rgb(r, g, b)
+    return f"38;2;{r};{g};{b}"
+
+
+@lru_cache(maxsize=4096)
+def background_24bits(r: int, g: int, b: int) -> str:
+    validate_rgb(r, g, b)
+    return f"48;2;{r};{g};{b}"
+
+
+PaletteDownsampler = Callable[[int], Color4Bits]
+RgbDownsampler = Callable[[int, int, int], int | Color4Bits]
+
+# Color depth -> (palette downsampler, RGB downsampler), each returning the nearest color that depth supports:
+# a 256 colors palette index or a Color4Bits member. None when the depth supports the colors as they are.
+DOWNSAMPLERS: dict[ColorDepth, tuple[PaletteDownsampler | None, RgbDownsampler | None]] = {
+    ColorDepth.TRUECOLOR: (None, None),
+    ColorDepth.COLORS_256: (None, rgb_to_8bits),
+    ColorDepth.COLORS_16: (palette_to_4bits, rgb_to_4bits),
+    ColorDepth.NONE: (palette_to_4bits, rgb_to_4bits),
+}
+
+_downsamplers: tuple[PaletteDownsampler | None, RgbDownsampler | None] | None = None
+
+
+def downsamplers() -> tuple[PaletteDownsampler | None, RgbDownsampler | None]:
+    """
+    The :data:`DOWNSAMPLERS` of the terminal's color depth, looked up once per terminal profile.
+    """
+    global _downsamplers  # pylint: disable=global-statement
+    if _downsamplers is None:
+        _downsamplers = DOWNSAMPLERS[get_terminal_profile().color_depth]
+    return _downsamplers
+
+
+def _reset_downsamplers():
+    global _downsamplers  # pylint: disable=global-statement
+    _downsamplers = None
+
+
+add_color_mode_listener(_reset_downsamplers)
+
+
+def foreground_palette(value: int) -> str:
+    """
+    Foreground parameter for the 256 colors palette entry ``value``, downsampled to what the terminal supports.
+    """
+    palette: PaletteDownsampler | None = (_downsamplers or downsamplers())[0]
+    return foreground_8bits(value) if palette is None else FOREGROUND_4BITS_PARAMETERS[palette(value)]
+
+
+def background_palette(value: int) -> str:
+    """
+    Background parameter for the 256 colors palette entry ``value``, downsampled to what the terminal supports.
+    """
+    palette: PaletteDownsampler | None = (_downsamplers or downsamplers())[0]
+    return background_8bits(value) if palette is None else BACKGROUND_4BITS_PARAMETERS[palette(value)]
+
+
+def foreground_rgb(r: int, g: int, b: int) -> str:
+    """
+    Foreground parameter for an RGB color, downsampled to what the terminal supports.
+    """
+    rgb: RgbDownsampler | None = (_downsamplers or downsamplers())[1]
+    if rgb is None:
+        return foreground_24bits(r, g, b)
+    color: int | Color4Bits = rgb(r, g, b)
+    return FOREGROUND_4BITS_PARAMETERS[color] if isinstance(color, Color4Bits) else _FOREGROUND_8BITS_PARAMETERS[color]
+
+
+def background_rgb(r: int, g: int, b: int) -> str:
+    """
+    Background parameter for an RGB color, downsampled to what the terminal supports.
+    """
+    rgb: RgbDownsampler | None = (_downsamplers or downsamplers())[1]
+    if rgb is None:
+        return background_24bits(r, g, b)
+    color: int | Color4Bits = rgb(r, g, b)
+    return BACKGROUND_4BITS_PARAMETERS[color] if isinstance(color, Color4Bits) else _BACKGROUND_8BITS_PARAMETERS[color]
+
+
+def foreground_parameter(color: Color, downsample: bool = True) -> str | None:
+    """
+    Foreground parameter for a Color4Bits, an 8-bit palette index or an ``(r, g, b)`` tuple.
+
+    :param downsample: when False, the color is kept as requested (see :func:`terminal_state`)
+    """
+    if color is None:
+        return None
+    if isinstance(color, Color4Bits):
+        return FOREGROUND_4BITS_PARAMETERS[color]
+    if isinstance(color, tuple):
+        return foreground_rgb(*color) if downsample else foreground_24bits(*color)
+    return foreground_palette(color) if downsample else foreground_8bits(color)
+
+
+def background_parameter(color: Color, downsample: bool = True) -> str | None:
+    """
+    Background parameter for a Color4Bits, an 8-bit palette index or an ``(r, g, b)`` tuple.
+
+    :param downsample: when False, the color is kept as requested (see :func:`terminal_state`)
+    """
+    if color is None:
+        return None
+    if isinstance(color, Color4Bits):
+        return BACKGROUND_4BITS_PARAMETERS[color]
+    if isinstance(color, tuple):
+        return background_rgb(*color) if downsample else background_24bits(*color)
+    return background_palette(color) if downsample else background_8bits(color)
+
+
+def terminal_state(state: tuple[str | None, ...]) -> tuple[str | None, ...]:
+    """
+    Returns ``state`` with its 256 colors and RGB parameters downsampled to what the terminal supports.
+    """
+    slots: list[str | None] = list(state)
+    slots[FOREGROUND] = _downsample(state[FOREGROUND], foreground_palette, foreground_rgb)
+    slots[BACKGROUND] = _downsample(state[BACKGROUND], background_palette, background_rgb)
+    return tuple(slots)
+
+
+def _downsample(parameter: str | None, palette: Callable[[int], str], rgb: Callable[[int, int, int], str]) -> str | None:
+    if parameter is None or ";" not in parameter:
+        return parameter
+    values: list[int] = [int(value) for value in parameter.split(";")]
+    return rgb(*values[2:]) if values[1] == 2 else palette(values[2])
+
+
+def apply_attributes(slots: list[str | None], attributes: CellAttributes | int):
+    """
+    Sets the slots of every flag in ``attributes``.
+    """
+    for flag, slot, parameter in ATTRIBUTE_SLOTS:
+        if attributes & flag:
+            slots[slot] = parameter
+
+
+@lru_cache(maxsize=4096)
+def transition(current: tuple[str | None, ...], target: tuple[str | None, ...]) -> str:
+    """
+    Returns the shortest single SGR sequence going from ``current`` to ``target``,
+    or an empty string when both states are the same.
+    """
+    if current == target:
+        return ""
+    if target == DEFAULT_STATE:
+        return RESET
+
+    incremental: list[str] = []
+    full: list[str] = ["0"]
+    for slot, (current_parameter, target_parameter) in enumerate(zip(current, target)):
+        if target_parameter is not None:
+            full.append(target_parameter)
+        if current_parameter != target_parameter:
+            incremental.append(target_parameter if target_parameter is not None else _RESET_PARAMETERS[slot])
+
+    incremental_parameters: str = ";".join(incremental)
+    full_parameters: str = ";".join(full)
+    if len(full_parameters) < len(incremental_parameters):
+        return f"{CSI}{full_parameters}m"
+    return f"{CSI}{incremental_parameters}m"
@@ -0,0 +1,171 @@
+"""
+Styled text as spans: parallel sequences of texts and interned style ids, rendered to ANSI, plain text or HTML.
+"""
+from functools import lru_cache
+from html import escape
+from threading import Lock
+from typing import Callable, Sequence
+
+from econsole import sgr
+from econsole.colors import SYSTEM_PALETTE, XTERM_256_PALETTE
+from econsole.terminal import add_color_mode_listener
+
+# Interned styles (sgr states): a style id is an index in STYLES
+STYLES: list[tuple[str | None, ...]] = [sgr.DEFAULT_STATE]
+_style_ids: dict[tuple[str | None, ...], int] = {sgr.DEFAULT_STATE: 0}
+_styles_lock: Lock = Lock()
+
+DEFAULT_STYLE_ID: int = 0
+
+# (style id, slot, parameter) -> id of that style with the slot set to the parameter
+_restyled: dict[tuple[int, int, str | None], int] = {}
+_RESTYLED_MAX: int = 65536
+
+# (style id, style id) -> SGR sequence between both styles, their colors downsampled to what the terminal supports.
+# Cleared when the terminal profile changes.
+_transitions: dict[tuple[int, int], str] = {}
+_TRANSITIONS_MAX: int = 65536
+
+
+def style_id(state: tuple[str | None, ...]) -> int:
+    """
+    Returns the id of the interned ``state``, interning it when first seen.
+    """
+    identifier: int | None = _style_ids.get(state)
+    if identifier is None:
+        with _styles_lock:
+            identifier = _style_ids.get(state)
+            if identifier is None:
+                identifier = len(STYLES)
+                STYLES.append(state)
+                _style_ids[state] = identifier
+    return identifier
+
+
+def restyle(identifier: int, slot: int, parameter: str | None) -> int:
+    """
+    Returns the id of the style ``identifier`` with ``slot`` set to ``parameter``, without building the state when already seen.
+    """
+    key: tuple[int, int, str | None] = (identifier, slot, parameter)
+    restyled: int | None = _restyled.get(key)
+    if restyled is None:
+        if len(_restyled) >= _RESTYLED_MAX:
+            _restyled.clear()
+        state: list[str | None] = list(STYLES[identifier])
+        state[slot] = parameter
+        restyled = _restyled[key] = style_id(tuple(state))
+    return restyled
+
+
+def render_ansi(
+    texts: Sequence[str], styles: Sequence[int], final_style: int = DEFAULT_STYLE_ID, escape_text: Callable[[str], str] | None = None
+) -> str:
+    """
+    Renders the spans with the minimal SGR transition between consecutive styles,
+    then the transition to ``final_style`` (the style pending after the last span).
+    Colors are downsampled to what the terminal supports.
+    """
+    parts: list[str] = []
+    transitions: dict[tuple[int, int], str] = _transitions
+    current: int = DEFAULT_STYLE_ID
+    for text, identifier in zip(texts, styles):
+        if identifier != current:
+            parts.append(transitions.get((current, identifier)) or _transition(current, identifier))
+            current = identifier
+        parts.append(escape_text(text) if escape_text is not None else text)
+
+    if final_style != current:
+        parts.append(transitions.get((current, final_style)) or _transition(current, final_style))
+    return "".join(parts)
+
+
+def _transition(current: int, target: int) -> str:
+    # Cache miss of render_ansi
+    if len(_transitions) >= _TRANSITIONS_MAX:
+        _transitions.clear()
+    sequence: str = sgr.transition(sgr.terminal_state(STYLES[current]), sgr.terminal_state(STYLES[target]))
+    _transitions[(current, target)] = sequence
+    return sequence
+
+
+add_color_mode_listener(_transitions.clear)
+
+
+def render_plain(texts: Sequence[str]) -> str:
+    return "".join(texts)
+
+
+def render_html(texts: Sequence[str], styles: Sequence[int]) -> str:
+    """
+    Renders the spans as HTML: one ``<span style="...">`` per run of styled text.
+    """
+    parts: list[str] = []
+    current: int = DEFAULT_STYLE_ID
+    for text, identifier in zip(texts, styles):
+        if identifier != current:
+            if current != DEFAULT_STYLE_ID:
+                parts.append("</span>")
+            css: str = _css(identifier)
+            if css:
+                parts.append(f'<span style="{css}">')
+                current = identifier
+            else:
+                current = DEFAULT_STYLE_ID
+        parts.append(escape(text, quote=False))
+
+    if current != DEFAULT_STYLE_ID:
+        parts.append("</span>")
+    return "".join(parts)
+
+
+_WEIGHT_CSS: dict[str, str] = {"1": "font-weight:bold", "2": "opacity:0.7"}
+_ITALIC_CSS: dict[str, str] = {"3": "font-style:italic", "20": "font-style:italic"}
+_DECORATION_CSS: dict[str, str] = {"4": "underline", "21": "underline double"}
+
+
+@lru_cache(maxsize=4096)
+def _css(identifier: int) -> str:
+    state: tuple[str | None, ...] = STYLES[identifier]
+    declarations: list[str] = []
+    foreground: str | None = _css_color(state[sgr.FOREGROUND])
+    background: str | None = _css_color(state[sgr.BACKGROUND])
+    if state[sgr.SWAP] is not None:
+        foreground, background = background or "white", foreground or "black"
+    if foreground:
+        declarations.append(f"color:{foreground}")
+    if background:
+        declarations.append(f"background-color:{background}")
+
+    if state[sgr.WEIGHT] in _WEIGHT_CSS:
+        declarations.append(_WEIGHT_CSS[state[sgr.WEIGHT]])
+    if state[sgr.ITALIC] in _ITALIC_CSS:
+        declarations.append(_ITALIC_CSS[state[sgr.ITALIC]])
+
+    decorations: list[str] = []
+    if state[sgr.UNDERLINE] in _DECORATION_CSS:
+        decorations.append(_DECORATION_CSS[state[sgr.UNDERLINE]])
+    if state[sgr.STRIKE] is not None:
+        decorations.append("line-through")
+    if state[sgr.BLINK] is not None:
+        decorations.append("blink")
+    if decorations:
+        declarations.append(f"text-decoration:{' '.join(decorations)}")
+
+    if state[sgr.CONCEAL] is not None:
+        declarations.append("visibility:hidden")
+    return ";".join(declarations)
+
+
+def _css_color(parameter: str | None) -> str | None:
+    if parameter is None:
+        return None
+
+    values: list[int] = [int(value) for value in parameter.split(";")]
+    rgb: tuple[int, ...]
+    if len(values) == 5:
+        rgb = tuple(values[2:])
+    elif len(values) == 3:
+        rgb = XTERM_256_PALETTE[values[2]]
+    else:
+        rgb = SYSTEM_PALETTE[values[0] % 10 + (8 if values[0] >= 90 else 0)]
+    return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
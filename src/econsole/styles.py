@@ -1,27 +1,15 @@
 from __future__ import annotations
 
 from enum import Enum
-from time import sleep
-from typing import Any
-
-
-class Color4Bits(Enum):
-    BLACK = (30, 40)
-    DARK_RED = (31, 41)
-    GREEN = (32, 42)
-    DARK_YELLOW = (33, 43)
-    DARK_BLUE = (34, 44)
-    PURPLE = (35, 45)
-    TURQUOISE = (36, 46)
-    SILVER = (37, 47)
-    GRAY = (90, 100)
-    RED = (91, 101)
-    LIME = (92, 102)
-    YELLOW = (93, 103)
-    BLUE = (94, 104)
-    PINK = (95, 105)
-    CYAN = (96, 106)
-    WHITE = (97, 107)
+from itertools import groupby, islice, zip_longest
+from time import monotonic, sleep
+from typing import Any, BinaryIO, Callable, Iterable, Mapping, Sequence, TextIO
+
+from econsole import sequences, sgr, spans
+from econsole.colors import Color4Bits
+from econsole.output import OutputBuffer, output_stream, write_output
+from econsole.sgr import CellAttributes, Color
+from econsole.terminal import ColorDepth, add_color_mode_listener, colors_enabled, get_terminal_profile, stream_colors_enabled
 
 
 class KeyboardLeds(Enum):
@@ -43,222 +31,219 @@ class CursorStyles(Enum):
     STEADY_BAR = 6
 
 
+FOREGROUND_4BITS: dict[Color4Bits, str] = {color: sequences.SGR[color.value[0]] for color in Color4Bits}
+BACKGROUND_4BITS: dict[Color4Bits, str] = {color: sequences.SGR[color.value[1]] for color in Color4Bits}
+
+
 class ConsoleCharacters:
     @staticmethod
     def reset() -> str:
-        return "\u001b[0m"
+        return sequences.RESET
 
     @staticmethod
     def set_bold() -> str:
-        return "\u001b[1m"
+        return sequences.BOLD
 
     @staticmethod
     def set_thin() -> str:
-        return "\u001b[2m"
+        return sequences.THIN
 
     @staticmethod
     def set_italic() -> str:
-        return "\u001b[3m"
+        return sequences.ITALIC
 
     @staticmethod
     def set_underline() -> str:
-        return "\u001b[4m"
+        return sequences.UNDERLINE
 
     @staticmethod
     def set_slow_blink() -> str:
-        return "\u001b[5m"
+        return sequences.SLOW_BLINK
 
     @staticmethod
     def set_fast_blink() -> str:
-        return "\u001b[6m"
+        return sequences.FAST_BLINK
 
     @staticmethod
     def swap_colors() -> str:
-        return "\u001b[7m"
+        return sequences.SWAP_COLORS
 
     @staticmethod
     def set_conceal() -> str:
-        return "\u001b[8m"
+        return sequences.CONCEAL
 
     @staticmethod
     def set_strike_out() -> str:
-        return "\u001b[9m"
+        return sequences.STRIKE_OUT
 
     @staticmethod
     def set_font(n: int = 0) -> str:
         """
         :param n: An integer between 0 and 9. 0 is the default font.
         """
-        if 0 > n > 9:
+        if not 0 <= n <= 9:
             raise ValueError(f"n must be between 0 and 9. Actual: {n}")
         else:
-            return f"\u001b[{n + 10}m"
+            return sequences.SGR[n + 10]
 
     @staticmethod
     def set_fraktur() -> str:
-        return "\u001b[20m"
+        return sequences.FRAKTUR
 
     @staticmethod
     def reset_bold() -> str:
-        return "\u001b[21m"
+        return sequences.RESET_BOLD
 
     @staticmethod
     def set_double_underline() -> str:
-        return "\u001b[21m"
+        return sequences.DOUBLE_UNDERLINE
 
     @staticmethod
     def reset_font_weight() -> str:
-        return "\u001b[22m"
+        return sequences.RESET_FONT_WEIGHT
 
     @staticmethod
     def reset_italic() -> str:
-        return "\u001b[23m"
+        return sequences.RESET_ITALIC
 
     @staticmethod
     def reset_fraktur() -> str:
-        return "\u001b[23m"
+        return sequences.RESET_FRAKTUR
 
     @staticmethod
     def reset_underline() -> str:
-        return "\u001b[24m"
+        return sequences.RESET_UNDERLINE
 
     @staticmethod
     def reset_blink() -> str:
-        return "\u001b[25m"
+        return sequences.RESET_BLINK
 
     @staticmethod
     def reset_swap_colors() -> str:
-        return "\u001b[27m"
+        return sequences.RESET_SWAP_COLORS
 
     @staticmethod
     def reset_conceal() -> str:
-        return "\u001b[28m"
+        return sequences.RESET_CONCEAL
 
     @staticmethod
     def reset_strike_out() -> str:
-        return "\u001b[29m"
+        return sequences.RESET_STRIKE_OUT
 
     @staticmethod
     def set_foreground_4bits(code: Color4Bits | int | str) -> str:
         if isinstance(code, Color4Bits):
-            code: str = str(code.value[0])
+            return FOREGROUND_4BITS[code]
 
-        return f"\u001b[{code}m"
+        return sequences.sgr(int(code))
 
     @staticmethod
     def set_foreground_8bits(value: int) -> str:
-        if 0 > value > 255:
-            raise ValueError(f"Value must be between 0 and 255, not {value}")
-        else:
-            return f"\u001b[38;5{value}m"
+        # Downsampled on terminals with fewer colors, see _DOWNSAMPLED_SGR_METHODS
+        return sequences.foreground_8bits(value)
 
     @staticmethod
     def set_foreground_32bits(r: int, g: int, b: int) -> str:
-        ConsoleCharacters._validate_rgb(r, g, b)
-        return f"\u001b[38;2;{r};{g};{b}m"
+        return sequences.foreground_24bits(r, g, b)
 
     @staticmethod
     def reset_foreground() -> str:
-        return "\u001b[39m"
+        return sequences.RESET_FOREGROUND
 
     @staticmethod
     def set_background_4bits(code: Color4Bits | int | str) -> str:
         if isinstance(code, Color4Bits):
-            code: str = str(code.value[1])
+            return BACKGROUND_4BITS[code]
 
-        return f"\u001b[{code}m"
+        return sequences.sgr(int(code))
 
     @staticmethod
     def set_background_8bits(value: int) -> str:
-        if 0 > value > 255:
-            raise ValueError(f"Value must be between 0 and 255, not {value}")
-        else:
-            return f"\u001b[48;5{value}"
+        return sequences.background_8bits(value)
 
     @staticmethod
     def set_background_32bits(r: int, g: int, b: int) -> str:
-        ConsoleCharacters._validate_rgb(r, g, b)
-        return f"\u001b[48;2;{r};{g};{b}m"
+        return sequences.background_24bits(r, g, b)
 
     @staticmethod
     def reset_background() -> str:
-        return "\u001b[49m"
+        return sequences.RESET_BACKGROUND
 
     @staticmethod
     def set_framed() -> str:
-        return "\u001b[51m"
+        return sequences.FRAMED
 
     @staticmethod
     def set_encircled() -> str:
-        return "\u001b[52m"
+        return sequences.ENCIRCLED
 
     @staticmethod
     def set_overlined() -> str:
-        return "\u001b[53m"
+        return sequences.OVERLINED
 
     @staticmethod
     def reset_framed_encircled() -> str:
-        return "\u001b[54m"
+        return sequences.RESET_FRAMED_ENCIRCLED
 
     @staticmethod
     def reset_overlined() -> str:
-        return "\u001b[55m"
+        return sequences.RESET_OVERLINED
 
     @staticmethod
     def set_ideogram_underlined() -> str:
-        return "\u001b[60m"
+        return sequences.IDEOGRAM_UNDERLINED
 
     @staticmethod
     def set_ideogram_double_underlined() -> str:
-        return "\u001b[61m"
+        return sequences.IDEOGRAM_DOUBLE_UNDERLINED
 
     @staticmethod
     def set_ideogram_overlined() -> str:
-        return "\u001b[62m"
+        return sequences.IDEOGRAM_OVERLINED
 
     @staticmethod
     def set_ideogram_double_overlined() -> str:
-        return "\u001b[63m"
+        return sequences.IDEOGRAM_DOUBLE_OVERLINED
 
     @staticmethod
     def set_ideogram_stress_marking() -> str:
-        return "\u001b[64m"
+        return sequences.IDEOGRAM_STRESS_MARKING
 
     @staticmethod
     def reset_ideogram() -> str:
-        return "\u001b[65m"
+        return sequences.RESET_IDEOGRAM
 
     @staticmethod
     def clear_from_cursor_to_end_of_line() -> str:
-        return "\u001b[K"
+        return sequences.CLEAR_FROM_CURSOR_TO_END_OF_LINE
 
     @staticmethod
     def clear_from_line_start_to_cursor() -> str:
-        return "\u001b[1K"
+        return sequences.CLEAR_FROM_LINE_START_TO_CURSOR
 
     @staticmethod
     def clear_line() -> str:
-        return "\u001b[2K"
+        return sequences.CLEAR_LINE
 
     @staticmethod
     def clear_below() -> str:
-        return "\u001b[J"
+        return sequences.CLEAR_BELOW
 
     @staticmethod
     def clear_above() -> str:
-        return "\u001b[1J"
+        return sequences.CLEAR_ABOVE
 
     @staticmethod
     def clear_all() -> str:
-        return "\u001b[2J"
+        return sequences.CLEAR_ALL
 
     @staticmethod
     def clear_saved_lines() -> str:
-        return "\u001b[3J"
+        return sequences.CLEAR_SAVED_LINES
 
     @staticmethod
     def move_cursor_at_absolute(x: int, y: int) -> str:
-        return f"\u001b[{x};{y}H"
+        return sequences.cursor_at(x, y)
 
     @staticmethod
     def move_cursor_at_column_relative(columns: int = 1) -> str:
@@ -286,91 +271,91 @@ class ConsoleCharacters:
 
     @staticmethod
     def move_cursor_at_00() -> str:
-        return "\u001b[H"
+        return sequences.MOVE_CURSOR_AT_00
 
     @staticmethod
     def save_cursor_position() -> str:
-        return "\u001b[7"
+        return sequences.SAVE_CURSOR_POSITION
 
     @staticmethod
     def restore_cursor_position() -> str:
-        return "\u001b[8"
+        return sequences.RESTORE_CURSOR_POSITION
 
     @staticmethod
     def move_cursor_back_one_space() -> str:
-        return "\b"
+        return sequences.MOVE_CURSOR_BACK_ONE_SPACE
 
     @staticmethod
     def make_cursor_invisible() -> str:
-        return "\u001b[?25l"
+        return sequences.MAKE_CURSOR_INVISIBLE
 
     @staticmethod
     def make_cursor_visible() -> str:
-        return "\u001b[?25h"
+        return sequences.MAKE_CURSOR_VISIBLE
 
     @staticmethod
     def save_screen() -> str:
-        return "\u001b[?47h"
+        return sequences.SAVE_SCREEN
 
     @staticmethod
     def restore_screen() -> str:
-        return "\u001b[?47l"
+        return sequences.RESTORE_SCREEN
 
     @staticmethod
     def print_screen() -> str:
-        return "\u001b[?0i"
+        return sequences.PRINT_SCREEN
 
     @staticmethod
     def dump_screen_to_html() -> str:
-        return "\u001b[?10i"
+        return sequences.DUMP_SCREEN_TO_HTML
 
     @staticmethod
     def dump_screen_to_svg() -> str:
-        return "\u001b[?11i"
+        return sequences.DUMP_SCREEN_TO_SVG
 
     @staticmethod
     def bell() -> str:
-        return "\a"
+        return sequences.BELL
 
     @staticmethod
     def set_autowrap() -> str:
-        return "\u001b[?7h"
+        return sequences.SET_AUTOWRAP
 
     @staticmethod
     def unset_autowrap() -> str:
-        return "\u001b[?7l"
+        return sequences.UNSET_AUTOWRAP
 
     @staticmethod
     def set_cursor_blink() -> str:
-        return "\u001b[?14h"
+        return sequences.SET_CURSOR_BLINK
 
     @staticmethod
     def unset_cursor_blink() -> str:
-        return "\u001b[?14l"
+        return sequences.UNSET_CURSOR_BLINK
 
     @staticmethod
     def set_tektronix() -> str:
-        return "\u001b[?38h"
+        return sequences.SET_TEKTRONIX
 
     @staticmethod
     def unset_tektronix() -> str:
-        return "\u001b[?38l"
+        return sequences.UNSET_TEKTRONIX
 
     @staticmethod
     def set_slow_scroll() -> str:
-        return "\u001b[?4h"
+        return sequences.SET_SLOW_SCROLL
 
     @staticmethod
     def unset_slow_scroll() -> str:
-        return "\u001b[?4l"
+        return sequences.UNSET_SLOW_SCROLL
 
     @staticmethod
     def set_margin_bell() -> str:
-        return "\u001b[?44h"
+        return sequences.SET_MARGIN_BELL
 
     @staticmethod
     def unset_margin_bell() -> str:
-        return "\u001b[?44l"
+        return sequences.UNSET_MARGIN_BELL
 
     @staticmethod
     def insert_n_lines(n: int = 1) -> str:
@@ -393,19 +378,19 @@ class ConsoleCharacters:
 
     @staticmethod
     def never_hide_mouse() -> str:
-        return "\u001b[0p"
+        return sequences.NEVER_HIDE_MOUSE
 
     @staticmethod
     def hide_mouse_if_tracking_mode_enabled() -> str:
-        return "\u001b[1p"
+        return sequences.HIDE_MOUSE_IF_TRACKING_MODE_ENABLED
 
     @staticmethod
     def hide_mouse_except_leaving_window() -> str:
-        return "\u001b[2p"
+        return sequences.HIDE_MOUSE_EXCEPT_LEAVING_WINDOW
 
     @staticmethod
     def hide_mouse() -> str:
-        return "\u001b[3p"
+        return sequences.HIDE_MOUSE
 
     @staticmethod
     def keyboard_leds(keyboard_led: KeyboardLeds) -> str:
@@ -424,7 +409,7 @@ class ConsoleCharacters:
 
     @staticmethod
     def reset_scrolling_region() -> str:
-        return "\u001b[r"
+        return sequences.RESET_SCROLLING_REGION
 
     @staticmethod
     def fill_rectangle(with_char: str, top: int, left: int, bottom: int, right: int) -> str:
@@ -434,31 +419,161 @@ class ConsoleCharacters:
     def erase_rectangle_area(top: int, left: int, bottom: int, right: int) -> str:
         return f"\u001b[{top};{left};{bottom};{right}$z"
 
-    @staticmethod
-    def _validate_rgb(r: int, g: int, b: int):
-        if 0 > r > 255:
-            raise ValueError(f'"r" must be between 0 and 255, not {r}')
-        if 0 > g > 255:
-            raise ValueError(f'"g" must be between 0 and 255, not {g}')
-        if 0 > b > 255:
-            raise ValueError(f'"b" must be between 0 and 255, not {b}')
 
+# ConsoleCharacters methods returning SGR sequences, which all return an empty string when colors are disabled
+_SGR_METHODS: tuple[str, ...] = tuple(
+    name for name, sequence in sequences.SEQUENCES.items() if sequence.startswith(sequences.CSI) and sequence.endswith("m")
+) + (
+    "set_font",
+    "set_foreground_4bits",
+    "set_foreground_8bits",
+    "set_foreground_32bits",
+    "set_background_4bits",
+    "set_background_8bits",
+    "set_background_32bits",
+)
+_SGR_IMPLEMENTATIONS: dict[str, staticmethod] = {name: ConsoleCharacters.__dict__[name] for name in _SGR_METHODS}
+
+
+def _no_sequence(*_args, **_kwargs) -> str:
+    return ""
+
+
+_NO_SEQUENCE: staticmethod = staticmethod(_no_sequence)
+
+
+def _downsampled_sgr_methods(palette: sgr.PaletteDownsampler | None, rgb: sgr.RgbDownsampler | None) -> dict[str, staticmethod]:
+    """
+    The ConsoleCharacters color methods replaced by an encoder downsampling the colors with the given downsamplers.
+    """
+    methods: dict[str, staticmethod] = {}
+    if palette is not None:
+        methods["set_foreground_8bits"] = staticmethod(lambda value: FOREGROUND_4BITS[palette(value)])
+        methods["set_background_8bits"] = staticmethod(lambda value: BACKGROUND_4BITS[palette(value)])
+    if rgb is not None:
+        methods["set_foreground_32bits"] = staticmethod(lambda r, g, b: _color_sequence(rgb(r, g, b), FOREGROUND_4BITS, sequences.FOREGROUND_8BITS))
+        methods["set_background_32bits"] = staticmethod(lambda r, g, b: _color_sequence(rgb(r, g, b), BACKGROUND_4BITS, sequences.BACKGROUND_8BITS))
+    return methods
+
+
+def _color_sequence(color: int | Color4Bits, sequences_4bits: dict[Color4Bits, str], sequences_8bits: tuple[str, ...]) -> str:
+    return sequences_4bits[color] if isinstance(color, Color4Bits) else sequences_8bits[color]
+
+
+# Color depth -> ConsoleCharacters methods replaced by an encoder downsampling the colors to that depth
+_DOWNSAMPLED_SGR_METHODS: dict[ColorDepth, dict[str, staticmethod]] = {
+    depth: _downsampled_sgr_methods(palette, rgb) for depth, (palette, rgb) in sgr.DOWNSAMPLERS.items()
+}
+
+
+_color_mode_applied: bool = False
+
+
+def _apply_color_mode():
+    global _color_mode_applied  # pylint: disable=global-statement
+    enabled: bool = colors_enabled()
+    downsampled: dict[str, staticmethod] = _DOWNSAMPLED_SGR_METHODS[get_terminal_profile().color_depth] if enabled else {}
+    for name, implementation in _SGR_IMPLEMENTATIONS.items():
+        setattr(ConsoleCharacters, name, downsampled.get(name, implementation) if enabled else _NO_SEQUENCE)
+    _color_mode_applied = True
+
+
+def _resolve_color_mode_on_call(name: str) -> staticmethod:
+    def resolve(*args, **kwargs) -> str:
+        # Only reached through references taken before the color mode was applied
+        if not _color_mode_applied:
+            _apply_color_mode()
+        return getattr(ConsoleCharacters, name)(*args, **kwargs)
+
+    return staticmethod(resolve)
 
-def timed_print(text: str, delay_in_seconds: float, newline: bool = True):
-    for char in text:
-        print(char, end="")
-        sleep(delay_in_seconds)
+
+def _defer_color_mode():
+    """
+    The color mode is resolved on the first SGR call, then the ConsoleCharacters methods are swapped
+    for either their implementation, downsampled to the terminal's color depth, or the shared no-op,
+    so later calls pay nothing for the checks.
+    """
+    global _color_mode_applied  # pylint: disable=global-statement
+    _color_mode_applied = False
+    for name in _SGR_METHODS:
+        setattr(ConsoleCharacters, name, _resolve_color_mode_on_call(name))
+
+
+_defer_color_mode()
+add_color_mode_listener(_defer_color_mode)
+
+
+def timed_print(text: str, delay_in_seconds: float, newline: bool = True, output: OutputBuffer | TextIO | BinaryIO | None = None):
+    """
+    Prints ``text`` one character every ``delay_in_seconds``, blocking the thread.
+    Characters are scheduled against a monotonic clock: when writing falls behind, the late characters are written together.
+    """
+    start: float = monotonic()
+    written: int = 0
+    while written < len(text):
+        end: int = _timed_print_end(monotonic() - start, delay_in_seconds, written, len(text))
+        _write_and_flush(output, text[written:end])
+        written = end
+        if written < len(text):
+            sleep(max(0.0, start + written * delay_in_seconds - monotonic()))
+
+    if newline:
+        _write_and_flush(output, "\n")
+
+
+async def timed_print_async(text: str, delay_in_seconds: float, newline: bool = True, output: OutputBuffer | TextIO | BinaryIO | None = None):
+    """
+    Same as :func:`timed_print`, but waits on the event loop between characters, so many lines can be animated concurrently.
+    """
+    # Imported on call: asyncio alone costs more than the rest of this module's import
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    start: float = loop.time()
+    written: int = 0
+    while written < len(text):
+        end: int = _timed_print_end(loop.time() - start, delay_in_seconds, written, len(text))
+        _write_and_flush(output, text[written:end])
+        written = end
+        if written < len(text):
+            await asyncio.sleep(max(0.0, start + written * delay_in_seconds - loop.time()))
 
     if newline:
-        print("")
+        _write_and_flush(output, "\n")
+
+
+def _timed_print_end(elapsed: float, delay_in_seconds: float, written: int, length: int) -> int:
+    """
+    Returns the end index of the characters due after ``elapsed`` seconds (always at least one more character).
+    """
+    if delay_in_seconds <= 0:
+        return length
+    return min(length, max(written + 1, int(elapsed / delay_in_seconds) + 1))
+
+
+def _write_and_flush(output: OutputBuffer | TextIO | BinaryIO | None, text: str):
+    write_output(output, text, flush=True)
 
 
 class Print:
-    __slots__ = ("_string", "_colors_swapped")
+    __slots__ = ("_texts", "_styles", "_style_id")
 
-    def __init__(self):
-        self._string: list[str] = []
-        self._colors_swapped: bool = False
+    def __new__(cls, keep_styles: bool = False):
+        """
+        When colors are disabled (see :func:`econsole.terminal.colors_enabled`), style calls are a shared no-op
+        and only the text is kept, unless ``keep_styles`` is True (e.g. for :meth:`render_html`).
+        """
+        if cls is Print and not keep_styles and not colors_enabled():
+            return object.__new__(_NoColorPrint)
+        return object.__new__(cls)
+
+    def __init__(self, keep_styles: bool = False):  # pylint: disable=unused-argument
+        # Spans: each text and the id of its interned style
+        self._texts: list[str] = []
+        self._styles: list[int] = []
+        # Id of the style applied to the next text
+        self._style_id: int = spans.DEFAULT_STYLE_ID
 
     def add(self, data: Any) -> Print:
         return self._short(repr(data) if not isinstance(data, str) else data + " ")
@@ -467,192 +582,378 @@ class Print:
         [self.add(a_data) for a_data in data]
         return self
 
+    def placeholder(self, name: str, format_spec: str = "") -> Print:
+        """
+        Adds a named placeholder, filled when the chain is compiled (see :meth:`compile`) and the template rendered.
+        Like :meth:`add` with a string, it is followed by a space.
+        """
+        return self._short(_Placeholder(f"{{{name}:{format_spec}}} " if format_spec else f"{{{name}}} "))
+
+    def add_styled(
+        self,
+        text: str,
+        foregrounds: Sequence[Color] | None = None,
+        backgrounds: Sequence[Color] | None = None,
+        attributes: Sequence[CellAttributes] | None = None,
+    ) -> Print:
+        """
+        Adds ``text`` with one foreground, background and/or attributes value per character (e.g. a gradient).
+        Consecutive characters sharing the same style are emitted as a single run, under a single SGR sequence.
+        A None value (or a sequence shorter than ``text``) keeps the current style of the chain, which is restored afterwards.
+        """
+        length: int = len(text)
+        base_id: int = self._style_id
+        base: tuple[str | None, ...] = spans.STYLES[base_id]
+        styles = islice(zip_longest(foregrounds or (), backgrounds or (), attributes or ()), length)
+
+        position: int = 0
+        for (foreground, background, attribute), run in groupby(styles):
+            run_length: int = sum(1 for _ in run)
+            pending: list[str | None] = list(base)
+            if foreground is not None:
+                pending[sgr.FOREGROUND] = sgr.foreground_parameter(foreground, downsample=False)
+            if background is not None:
+                pending[sgr.BACKGROUND] = sgr.background_parameter(background, downsample=False)
+            if attribute:
+                sgr.apply_attributes(pending, attribute)
+
+            self._style_id = spans.style_id(tuple(pending))
+            self._short(text[position : position + run_length])
+            position += run_length
+
+        self._style_id = base_id
+        return self._short(text[position:] + " ")
+
     def reset(self) -> Print:
-        return self._short(ConsoleCharacters.reset())
+        self._style_id = spans.DEFAULT_STYLE_ID
+        return self
 
     def bold(self) -> Print:
-        return self._short(ConsoleCharacters.set_bold())
+        return self._style(sgr.WEIGHT, "1")
 
     def thin(self) -> Print:
-        return self._short(ConsoleCharacters.set_thin())
+        return self._style(sgr.WEIGHT, "2")
 
     def italic(self) -> Print:
-        return self._short(ConsoleCharacters.set_italic())
+        return self._style(sgr.ITALIC, "3")
 
     def underline(self) -> Print:
-        return self._short(ConsoleCharacters.set_underline())
+        return self._style(sgr.UNDERLINE, "4")
 
     def slow_blink(self) -> Print:
-        return self._short(ConsoleCharacters.set_slow_blink())
+        return self._style(sgr.BLINK, "5")
 
     def fast_blink(self) -> Print:
-        return self._short(ConsoleCharacters.set_fast_blink())
+        return self._style(sgr.BLINK, "6")
 
     def swap_colors(self) -> Print:
-        if self._colors_swapped:
-            return self._short(ConsoleCharacters.reset_swap_colors())
+        if spans.STYLES[self._style_id][sgr.SWAP] is not None:
+            return self._style(sgr.SWAP, None)
         else:
-            return self._short(ConsoleCharacters.swap_colors())
+            return self._style(sgr.SWAP, "7")
 
     def conceal(self) -> Print:
-        return self._short(ConsoleCharacters.set_conceal())
+        return self._style(sgr.CONCEAL, "8")
 
     def strike_out(self) -> Print:
-        return self._short(ConsoleCharacters.set_strike_out())
+        return self._style(sgr.STRIKE, "9")
 
     def reset_bold(self) -> Print:
-        return self._short(ConsoleCharacters.reset_bold())
+        return self._style(sgr.WEIGHT, None)
 
     def font(self, n: int = 0) -> Print:
-        return self._short(ConsoleCharacters.set_font(n))
+        if not 0 <= n <= 9:
+            raise ValueError(f"n must be between 0 and 9. Actual: {n}")
+        return self._style(sgr.FONT, str(n + 10) if n else None)
 
     def fraktur(self) -> Print:
-        return self._short(ConsoleCharacters.set_fraktur())
+        return self._style(sgr.ITALIC, "20")
 
     def double_underline(self) -> Print:
-        return self._short(ConsoleCharacters.set_double_underline())
+        return self._style(sgr.UNDERLINE, "21")
 
     def reset_italic(self) -> Print:
-        return self._short(ConsoleCharacters.reset_italic())
+        return self._style(sgr.ITALIC, None)
 
     def reset_fraktur(self) -> Print:
-        return self._short(ConsoleCharacters.reset_fraktur())
+        return self._style(sgr.ITALIC, None)
 
     def reset_underline(self) -> Print:
-        return self._short(ConsoleCharacters.reset_underline())
+        return self._style(sgr.UNDERLINE, None)
 
     def reset_blink(self) -> Print:
-        return self._short(ConsoleCharacters.reset_blink())
+        return self._style(sgr.BLINK, None)
 
     def reset_conceal(self) -> Print:
-        return self._short(ConsoleCharacters.reset_conceal())
+        return self._style(sgr.CONCEAL, None)
 
     def reset_strike_out(self) -> Print:
-        return self._short(ConsoleCharacters.reset_strike_out())
+        return self._style(sgr.STRIKE, None)
 
     def set_fore_black(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.BLACK)
+        return self._style(sgr.FOREGROUND, "30")
 
     def set_fore_dark_red(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.DARK_RED)
+        return self._style(sgr.FOREGROUND, "31")
 
     def set_fore_green(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.GREEN)
+        return self._style(sgr.FOREGROUND, "32")
 
     def set_fore_dark_yellow(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.DARK_YELLOW)
+        return self._style(sgr.FOREGROUND, "33")
 
     def set_fore_dark_blue(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.DARK_BLUE)
+        return self._style(sgr.FOREGROUND, "34")
 
     def set_fore_purple(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.PURPLE)
+        return self._style(sgr.FOREGROUND, "35")
 
     def set_fore_turquoise(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.TURQUOISE)
+        return self._style(sgr.FOREGROUND, "36")
 
     def set_fore_silver(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.SILVER)
+        return self._style(sgr.FOREGROUND, "37")
 
     def set_fore_gray(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.GRAY)
+        return self._style(sgr.FOREGROUND, "90")
 
     def set_fore_red(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.RED)
+        return self._style(sgr.FOREGROUND, "91")
 
     def set_fore_lime(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.LIME)
+        return self._style(sgr.FOREGROUND, "92")
 
     def set_fore_yellow(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.YELLOW)
+        return self._style(sgr.FOREGROUND, "93")
 
     def set_fore_blue(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.BLUE)
+        return self._style(sgr.FOREGROUND, "94")
 
     def set_fore_pink(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.PINK)
+        return self._style(sgr.FOREGROUND, "95")
 
     def set_fore_cyan(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.CYAN)
+        return self._style(sgr.FOREGROUND, "96")
 
     def set_fore_white(self) -> Print:
-        return self.set_foreground_4bits(Color4Bits.WHITE)
+        return self._style(sgr.FOREGROUND, "97")
 
     def set_back_black(self) -> Print:
-        return self.set_background_4bits(Color4Bits.BLACK)
+        return self._style(sgr.BACKGROUND, "40")
 
     def set_back_dark_red(self) -> Print:
-        return self.set_background_4bits(Color4Bits.DARK_RED)
+        return self._style(sgr.BACKGROUND, "41")
 
     def set_back_green(self) -> Print:
-        return self.set_background_4bits(Color4Bits.GREEN)
+        return self._style(sgr.BACKGROUND, "42")
 
     def set_back_dark_yellow(self) -> Print:
-        return self.set_background_4bits(Color4Bits.DARK_YELLOW)
+        return self._style(sgr.BACKGROUND, "43")
 
     def set_back_dark_blue(self) -> Print:
-        return self.set_background_4bits(Color4Bits.DARK_BLUE)
+        return self._style(sgr.BACKGROUND, "44")
 
     def set_back_purple(self) -> Print:
-        return self.set_background_4bits(Color4Bits.PURPLE)
+        return self._style(sgr.BACKGROUND, "45")
 
     def set_back_turquoise(self) -> Print:
-        return self.set_background_4bits(Color4Bits.TURQUOISE)
+        return self._style(sgr.BACKGROUND, "46")
 
     def set_back_silver(self) -> Print:
-        return self.set_background_4bits(Color4Bits.SILVER)
+        return self._style(sgr.BACKGROUND, "47")
 
     def set_back_gray(self) -> Print:
-        return self.set_background_4bits(Color4Bits.GRAY)
+        return self._style(sgr.BACKGROUND, "100")
 
     def set_back_red(self) -> Print:
-        return self.set_background_4bits(Color4Bits.RED)
+        return self._style(sgr.BACKGROUND, "101")
 
     def set_back_lime(self) -> Print:
-        return self.set_background_4bits(Color4Bits.LIME)
+        return self._style(sgr.BACKGROUND, "102")
 
     def set_back_yellow(self) -> Print:
-        return self.set_background_4bits(Color4Bits.YELLOW)
+        return self._style(sgr.BACKGROUND, "103")
 
     def set_back_blue(self) -> Print:
-        return self.set_background_4bits(Color4Bits.BLUE)
+        return self._style(sgr.BACKGROUND, "104")
 
     def set_back_pink(self) -> Print:
-        return self.set_background_4bits(Color4Bits.PINK)
+        return self._style(sgr.BACKGROUND, "105")
 
     def set_back_cyan(self) -> Print:
-        return self.set_background_4bits(Color4Bits.CYAN)
+        return self._style(sgr.BACKGROUND, "106")
 
     def set_back_white(self) -> Print:
-        return self.set_background_4bits(Color4Bits.WHITE)
+        return self._style(sgr.BACKGROUND, "107")
 
     def set_foreground_4bits(self, code: Color4Bits | int | str) -> Print:
-        return self._short(ConsoleCharacters.set_foreground_4bits(code))
+        return self._style(sgr.FOREGROUND, sgr.FOREGROUND_4BITS_PARAMETERS[code] if isinstance(code, Color4Bits) else str(code))
 
     def set_foreground_8bits(self, value: int) -> Print:
-        return self._short(ConsoleCharacters.set_foreground_8bits(value))
+        return self._style(sgr.FOREGROUND, sgr.foreground_8bits(value))
 
     def set_foreground_24bits(self, r: int, g: int, b: int) -> Print:
-        return self._short(ConsoleCharacters.set_foreground_32bits(r, g, b))
+        return self._style(sgr.FOREGROUND, sgr.foreground_24bits(r, g, b))
 
     def reset_foreground(self) -> Print:
-        return self._short(ConsoleCharacters.reset_foreground())
+        return self._style(sgr.FOREGROUND, None)
 
     def set_background_4bits(self, code: Color4Bits | int | str) -> Print:
-        return self._short(ConsoleCharacters.set_background_4bits(code))
+        return self._style(sgr.BACKGROUND, sgr.BACKGROUND_4BITS_PARAMETERS[code] if isinstance(code, Color4Bits) else str(code))
 
     def set_background_8bits(self, value: int) -> Print:
-        return self._short(ConsoleCharacters.set_background_8bits(value))
+        return self._style(sgr.BACKGROUND, sgr.background_8bits(value))
 
     def set_background_24bits(self, r: int, g: int, b: int) -> Print:
-        return self._short(ConsoleCharacters.set_background_32bits(r, g, b))
+        return self._style(sgr.BACKGROUND, sgr.background_24bits(r, g, b))
 
     def reset_background(self) -> Print:
-        return self._short(ConsoleCharacters.reset_background())
+        return self._style(sgr.BACKGROUND, None)
+
+    def render(self) -> str:
+        """
+        Returns the built string, with every run of style changes merged into a single SGR sequence.
+        When colors are disabled (see :func:`econsole.terminal.set_color_mode`), returns the plain text.
+        """
+        if not colors_enabled():
+            return self.render_plain()
+        return spans.render_ansi(self._texts, self._styles, self._style_id).strip()
+
+    def render_plain(self) -> str:
+        """
+        Returns the built text, without any escape sequence.
+        """
+        return spans.render_plain(self._texts).strip()
+
+    def render_html(self) -> str:
+        """
+        Returns the built text as HTML, styles being rendered as inline CSS.
+        """
+        return spans.render_html(self._texts, self._styles).strip()
+
+    def compile(self) -> PrintTemplate:
+        """
+        Compiles the chain into a template: escape sequences and static text are rendered once,
+        and only the placeholders are filled for each record. Example: ::
 
-    def print(self):
-        print(("".join(self._string)).strip())
+            line = Print().bold().placeholder("level").reset().placeholder("message").compile()
+            line.print(level="INFO", message="started")
+        """
+        return PrintTemplate(
+            spans.render_ansi(self._texts, self._styles, self._style_id, _escape_format_text).strip(),
+            "".join(map(_escape_format_text, self._texts)).strip(),
+        )
+
+    def print(self, output: OutputBuffer | TextIO | BinaryIO | None = None):
+        """
+        :param output: where to write the line. When None, ``sys.stdout`` is used.
+            Escape sequences are only written when colors are enabled for that stream.
+        """
+        write_output(output, self._render(stream_colors_enabled(output_stream(output))) + "\n")
+
+    @staticmethod
+    def print_many(records: Iterable[Print], output: OutputBuffer | TextIO | BinaryIO | None = None):
+        """
+        Renders all ``records``, one per line, and writes them with a single write.
+
+        :param output: where to write the lines. When None, ``sys.stdout`` is used.
+        """
+        colors: bool = stream_colors_enabled(output_stream(output))
+        lines: list[str] = [record._render(colors) for record in records]  # pylint: disable=protected-access
+        if lines:
+            lines.append("")
+            write_output(output, "\n".join(lines))
+
+    def _render(self, colors: bool) -> str:
+        if not colors:
+            return self.render_plain()
+        return spans.render_ansi(self._texts, self._styles, self._style_id).strip()
 
     def _short(self, s: str) -> Print:
-        self._string.append(s)
+        self._texts.append(s)
+        self._styles.append(self._style_id)
+        return self
+
+    def _style(self, slot: int, parameter: str | None) -> Print:
+        self._style_id = spans.restyle(self._style_id, slot, parameter)
         return self
+
+
+class _NoColorPrint(Print):
+    """
+    What :class:`Print` instantiates when colors are disabled: style calls are the shared no-op and only text is kept.
+    """
+
+    __slots__ = ()
+
+    def add_styled(
+        self,
+        text: str,
+        foregrounds: Sequence[Color] | None = None,
+        backgrounds: Sequence[Color] | None = None,
+        attributes: Sequence[CellAttributes] | None = None,
+    ) -> Print:
+        return self._short(text + " ")
+
+
+def _no_style(self: Print, *_args, **_kwargs) -> Print:
+    return self
+
+
+_PRINT_CONTENT_METHODS: frozenset[str] = frozenset(
+    ("add", "add_x", "placeholder", "add_styled", "render", "render_plain", "render_html", "compile", "print", "print_many")
+)
+for _name, _attribute in list(Print.__dict__.items()):
+    if callable(_attribute) and not _name.startswith("_") and _name not in _PRINT_CONTENT_METHODS:
+        setattr(_NoColorPrint, _name, _no_style)
+
+
+class _Placeholder(str):
+    """
+    A ``str.format`` replacement field added by :meth:`Print.placeholder`, kept unescaped by :meth:`Print.compile`.
+    """
+
+    __slots__ = ()
+
+
+def _escape_format_text(text: str) -> str:
+    return text if isinstance(text, _Placeholder) else text.replace("{", "{{").replace("}", "}}")
+
+
+class PrintTemplate:
+    """
+    A compiled :class:`Print` chain. ``render(**values)`` is a single ``str.format`` call.
+    ``template`` (thus ``render``) has escape sequences when colors were enabled at compile time,
+    :meth:`print` and :meth:`print_many` check the stream they write to.
+
+    :param plain_template: the template without escape sequences, ``template`` when None
+    """
+
+    __slots__ = ("template", "render", "_ansi_template", "_plain_template")
+
+    def __init__(self, template: str, plain_template: str | None = None):
+        self._ansi_template: str = template
+        self._plain_template: str = template if plain_template is None else plain_template
+        self.template: str = self._template(colors_enabled())
+        self.render: Callable[..., str] = self.template.format
+
+    def print(self, output: OutputBuffer | TextIO | BinaryIO | None = None, **values: Any):
+        """
+        :param output: where to write the line. When None, ``sys.stdout`` is used.
+        """
+        write_output(output, self._template(stream_colors_enabled(output_stream(output))).format_map(values) + "\n")
+
+    def print_many(self, records: Iterable[Mapping[str, Any]], output: OutputBuffer | TextIO | BinaryIO | None = None):
+        """
+        Renders one line per mapping of placeholder values and writes them with a single write.
+
+        :param output: where to write the lines. When None, ``sys.stdout`` is used.
+        """
+        template: str = self._template(stream_colors_enabled(output_stream(output)))
+        lines: list[str] = list(map(template.format_map, records))
+        if lines:
+            lines.append("")
+            write_output(output, "\n".join(lines))
+
+    def _template(self, colors: bool) -> str:
+        return self._ansi_template if colors else self._plain_template
@@ -0,0 +1,181 @@
+"""
+Terminal capability profile, detected once and shared by the whole process.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Callable
+
+
+class ColorDepth(Enum):
+    NONE = 0
+    COLORS_16 = 1
+    COLORS_256 = 2
+    TRUECOLOR = 3
+
+
+class ColorMode(Enum):
+    AUTO = 0
+    ALWAYS = 1
+    NEVER = 2
+
+
+@dataclass(frozen=True, slots=True)
+class TerminalProfile:
+    is_tty: bool
+    is_interactive: bool
+    color_depth: ColorDepth
+    width: int = 80
+    height: int = 24
+
+
+_profile: TerminalProfile | None = None
+_profile_lock: Lock = Lock()
+_color_mode: ColorMode = ColorMode.AUTO
+# Result of colors_enabled(), until the color mode or the terminal profile changes
+_colors_enabled: bool | None = None
+_color_mode_listeners: list[Callable[[], None]] = []
+
+
+def get_terminal_profile() -> TerminalProfile:
+    """
+    Returns the capability profile of the current terminal, detecting it on first call.
+    """
+    profile: TerminalProfile | None = _profile
+    if profile is None:
+        with _profile_lock:
+            profile = _profile if _profile is not None else _set_profile(detect_terminal_profile())
+    return profile
+
+
+def set_terminal_profile(profile: TerminalProfile | None):
+    """
+    Overrides the detected profile, e.g. in tests. Passing None makes the next
+    :func:`get_terminal_profile` call detect the profile again.
+    """
+    with _profile_lock:
+        _set_profile(profile)
+    _notify_color_mode_listeners()
+
+
+def set_color_mode(mode: ColorMode):
+    """
+    ``AUTO`` (the default) enables colors unless the terminal profile has no color support
+    (not a TTY, ``NO_COLOR`` set or a dumb terminal); ``ALWAYS`` and ``NEVER`` force the choice.
+    """
+    global _color_mode  # pylint: disable=global-statement
+    _color_mode = mode
+    _notify_color_mode_listeners()
+
+
+def colors_enabled() -> bool:
+    global _colors_enabled  # pylint: disable=global-statement
+    enabled: bool | None = _colors_enabled
+    if enabled is None:
+        if _color_mode is ColorMode.AUTO:
+            enabled = get_terminal_profile().color_depth is not ColorDepth.NONE
+        else:
+            enabled = _color_mode is ColorMode.ALWAYS
+        _colors_enabled = enabled
+    return enabled
+
+
+def stream_colors_enabled(stream) -> bool:
+    """
+    Same as :func:`colors_enabled`, for another stream than ``sys.stdout`` (e.g. a log file): in ``AUTO`` mode,
+    colors are only enabled when ``stream`` is a terminal.
+    """
+    if stream is sys.stdout:
+        return colors_enabled()
+    if _color_mode is ColorMode.AUTO:
+        return _colors_supported(_isatty(stream))
+    return _color_mode is ColorMode.ALWAYS
+
+
+def add_color_mode_listener(callback: Callable[[], None]):
+    """
+    Registers ``callback`` to be called whenever the color mode or the terminal profile is changed.
+    """
+    _color_mode_listeners.append(callback)
+
+
+def _notify_color_mode_listeners():
+    global _colors_enabled  # pylint: disable=global-statement
+    _colors_enabled = None
+    for callback in _color_mode_listeners:
+        callback()
+
+
+def _set_profile(profile: TerminalProfile | None) -> TerminalProfile | None:
+    global _profile  # pylint: disable=global-statement
+    _profile = profile
+    return profile
+
+
+def detect_terminal_profile() -> TerminalProfile:
+    """
+    Detects the capabilities of the terminal behind ``sys.stdout`` from the environment, ``isatty`` and terminfo.
+    """
+    is_tty: bool = _isatty(sys.stdout)
+    size: os.terminal_size = shutil.get_terminal_size()
+    return TerminalProfile(
+        is_tty=is_tty,
+        is_interactive=is_tty and _isatty(sys.stdin),
+        color_depth=_detect_color_depth(is_tty),
+        width=size.columns,
+        height=size.lines,
+    )
+
+
+def _isatty(stream) -> bool:
+    try:
+        return stream is not None and stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _colors_supported(is_tty: bool) -> bool:
+    environment = os.environ
+    if environment.get("NO_COLOR"):
+        return False
+
+    # FORCE_COLOR=0 / false disables colors, as in Node.js and most tools reading it
+    force_color: str = environment.get("FORCE_COLOR", "").lower()
+    if force_color in ("0", "false"):
+        return False
+    return bool(force_color) or (is_tty and environment.get("TERM", "") != "dumb")
+
+
+def _detect_color_depth(is_tty: bool) -> ColorDepth:
+    if not _colors_supported(is_tty):
+        return ColorDepth.NONE
+
+    environment = os.environ
+    term: str = environment.get("TERM", "")
+    if environment.get("COLORTERM", "").lower() in ("truecolor", "24bit") or "WT_SESSION" in environment:
+        return ColorDepth.TRUECOLOR
+    if "256" in term:
+        return ColorDepth.COLORS_256
+
+    colors: int = _terminfo_colors(term) if is_tty else -1
+    if colors >= 2**24:
+        return ColorDepth.TRUECOLOR
+    if colors >= 256:
+        return ColorDepth.COLORS_256
+    return ColorDepth.COLORS_16
+
+
+def _terminfo_colors(term: str) -> int:
+    try:
+        import curses  # pylint: disable=import-outside-toplevel
+
+        curses.setupterm(term or None, sys.stdout.fileno())
+        return curses.tigetnum("colors")
+    except Exception:  # pylint: disable=broad-exception-caught
+        # No curses (Windows), no terminfo entry or no usable file descriptor
+        return -1
@@ -0,0 +1,58 @@
+"""
+Display width of styled strings: escape sequences take no room, wide (East Asian) characters take two columns
+and combining characters take none.
+"""
+import re
+from functools import lru_cache
+from typing import Iterable
+from unicodedata import category, east_asian_width
+
+ANSI_ESCAPE: re.Pattern = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b[@-Z\\-_]")
+
+_ZERO_WIDTH_CATEGORIES: frozenset[str] = frozenset(("Mn", "Me", "Cf", "Cc"))
+
+
+def strip_ansi(text: str) -> str:
+    """
+    Returns ``text`` without its escape sequences.
+    """
+    if "\x1b" not in text:
+        return text
+    return ANSI_ESCAPE.sub("", text)
+
+
+@lru_cache(maxsize=16384)
+def visible_width(text: str) -> int:
+    """
+    Returns the number of terminal columns ``text`` takes once printed.
+    """
+    text = strip_ansi(text)
+    if text.isascii() and text.isprintable():
+        return len(text)
+    return sum(map(_char_width, text))
+
+
+def visible_widths(cells: Iterable[str]) -> list[int]:
+    """
+    Bulk version of :func:`visible_width`.
+    """
+    return list(map(visible_width, cells))
+
+
+def pad(text: str, width: int, align_right: bool = False, fill_char: str = " ") -> str:
+    """
+    Pads ``text`` with ``fill_char`` up to ``width`` visible columns.
+    """
+    padding: int = width - visible_width(text)
+    if padding <= 0:
+        return text
+    return fill_char * padding + text if align_right else text + fill_char * padding
+
+
+@lru_cache(maxsize=4096)
+def _char_width(char: str) -> int:
+    if char.isascii():
+        return 1 if char.isprintable() else 0
+    if category(char) in _ZERO_WIDTH_CATEGORIES:
+        return 0
+    return 2 if east_asian_width(char) in ("W", "F") else 1
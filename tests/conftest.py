@@ -0,0 +1,19 @@
+"""
+Fixtures shared by the tests.
+"""
+import pytest
+
+from econsole.terminal import ColorDepth, ColorMode, TerminalProfile, get_terminal_profile, set_color_mode, set_terminal_profile
+
+
+@pytest.fixture(name="truecolor")
+def _truecolor():
+    """
+    Forces colors on a true color terminal, whatever the terminal running the tests.
+    """
+    previous: TerminalProfile = get_terminal_profile()
+    set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=ColorDepth.TRUECOLOR))
+    set_color_mode(ColorMode.ALWAYS)
+    yield
+    set_color_mode(ColorMode.AUTO)
+    set_terminal_profile(previous)
@@ -0,0 +1,119 @@
+"""
+Actions run on an executor: spinner lines, progress, failures and cancellation.
+"""
+import asyncio
+import concurrent.futures
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from econsole import background
+from econsole.background import ActionCancelledError, Progress, run_in_background, run_in_background_async, status_line
+from econsole.input_source import ScriptedInput, use_input_source
+from econsole.menu_builder import AbstractMenu, MenuItem, MenuNavigator
+from econsole.sequences import CLEAR_LINE
+from econsole.terminal import ColorDepth, TerminalProfile, get_terminal_profile, set_terminal_profile
+
+
+@pytest.fixture(name="executor")
+def _executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+@pytest.fixture(name="tty")
+def _tty(monkeypatch):
+    monkeypatch.setattr(background, "REFRESH_INTERVAL", 0.005)
+    previous: TerminalProfile = get_terminal_profile()
+    set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=ColorDepth.TRUECOLOR))
+    yield
+    set_terminal_profile(previous)
+
+
+class _Menu(AbstractMenu):
+    def initialise(self):
+        pass
+
+
+def _until_cancelled(progress: Progress, started: Event) -> str:
+    started.set()
+    while not progress.cancelled:
+        time.sleep(0.001)
+    return "stopped"
+
+
+def test_status_line():
+    progress = Progress()
+    assert status_line("Export", 1.25) == "| Export (1.2s, Ctrl+C to cancel)"
+    progress.update(0.421, "rows 4210/10000")
+    assert status_line("Export", 3.14, progress, 1) == "/ Export 42% rows 4210/10000 (3.1s, Ctrl+C to cancel)"
+
+
+def test_progress_fraction_is_clamped():
+    progress = Progress()
+    progress.update(1.5)
+    assert progress.fraction == 1.0
+    progress.update(-1, "message")
+    assert (progress.fraction, progress.message) == (0.0, "message")
+
+
+def test_results_and_failures_are_returned_once(executor, capsys):
+    assert run_in_background(executor, "Adding", lambda a, b: a + b, (1, 2)) == 3
+    with pytest.raises(ZeroDivisionError):
+        run_in_background(executor, "Dividing", lambda: 1 / 0)
+    assert capsys.readouterr().out == "Adding...\nDividing...\n"
+
+
+@pytest.mark.usefixtures("tty")
+def test_spinner_line_is_cleared_when_done(executor, capsys):
+    run_in_background(executor, "Waiting", time.sleep, (0.05,))
+    out: str = capsys.readouterr().out
+    assert "Waiting (" in out
+    assert out.endswith(f"\r{CLEAR_LINE}")
+
+
+def test_ctrl_c_cancels_the_action(executor, monkeypatch):
+    progress, started = Progress(), Event()
+
+    def interrupted(*_, **__):
+        assert started.wait(5)
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(concurrent.futures, "wait", interrupted)
+    with pytest.raises(ActionCancelledError, match="Cancelled: Looping"):
+        run_in_background(executor, "Looping", _until_cancelled, (progress, started), progress=progress)
+    assert progress.cancelled
+
+
+def test_cancelling_the_task_cancels_the_action(executor):
+    progress, started = Progress(), Event()
+
+    async def cancel():
+        running: asyncio.Task = asyncio.ensure_future(
+            run_in_background_async(executor, "Looping", _until_cancelled, (progress, started), progress=progress)
+        )
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+
+    asyncio.run(cancel())
+    assert progress.cancelled
+
+
+def test_menu_items_report_progress(executor, capsys):
+    def export(rows: int, progress: Progress) -> int:
+        progress.update(1, f"rows {rows}/{rows}")
+        return rows
+
+    item = MenuItem(0, "Export", action=export, action_args=(10,), executor=executor, report_progress=True).set_as_exit_option()
+    menu = _Menu("Background")
+    menu.add_menu_item(item)
+    with use_input_source(ScriptedInput(["0"])):
+        MenuNavigator(menu).run()
+
+    assert item.result == 10
+    assert "Export..." in capsys.readouterr().out
@@ -0,0 +1,53 @@
+"""
+Menus built by build_menu, cached by their displayed structure.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from econsole.input_source import ScriptedInput, use_input_source
+from econsole.menu_builder import _cached_menu, build_menu
+
+_BUTTONS: list[tuple[str, str]] = [("roger", "GERMAINE"), ("raymond", "SOLANGE")]
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    _cached_menu.cache_clear()
+    yield
+    _cached_menu.cache_clear()
+
+
+def _build(answer: str, buttons: list[tuple[str, str]], page_size: int | None = None) -> str:
+    with use_input_source(ScriptedInput([answer])):
+        return build_menu("le title", "le text", buttons, page_size=page_size)
+
+
+def _cache_info():
+    return _cached_menu.cache_info()  # pylint: disable=no-value-for-parameter
+
+
+def test_selected_button_value_is_returned(capsys):
+    assert _build("1", _BUTTONS) == "SOLANGE"
+    out: str = capsys.readouterr().out
+    assert "le title: le text" in out and "0. roger" in out
+
+
+def test_same_buttons_reuse_the_menu(capsys):
+    _build("0", _BUTTONS)
+    # The values come from the current call, only the texts are cached
+    assert _build("0", [("roger", "ROBERT"), ("raymond", "RAYMONDE")]) == "ROBERT"
+    assert _cache_info().hits == 1
+
+    _build("0", [("roger", "GERMAINE")])
+    _build("0", _BUTTONS, page_size=1)
+    assert _cache_info().currsize == 3
+    capsys.readouterr()
+
+
+def test_cached_menus_are_displayed_by_several_threads(capsys):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results: list[str] = list(executor.map(lambda answer: _build(answer, _BUTTONS), ["0", "1"] * 8))
+    assert results == ["GERMAINE", "SOLANGE"] * 8
+    assert _cache_info().currsize == 1
+    capsys.readouterr()
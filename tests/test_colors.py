@@ -0,0 +1,48 @@
+"""
+Quantisation of truecolor values, checked against a brute-force search of the palettes.
+"""
+import random
+
+import pytest
+
+from econsole.colors import COLORS_4BITS, SYSTEM_PALETTE, XTERM_256_PALETTE, palette_to_4bits, rgb_to_4bits, rgb_to_8bits
+
+
+def _distance(color: tuple[int, int, int], rgb: tuple[int, int, int]) -> int:
+    return sum((first - second) ** 2 for first, second in zip(color, rgb))
+
+
+def _samples() -> list[tuple[int, int, int]]:
+    generator = random.Random(256)
+    grays = [(value, value, value) for value in range(256)]
+    near_grays = [(value, value + 1, value + 2) for value in range(254)]
+    return grays + near_grays + [(20, 43, 68)] + [tuple(generator.randrange(256) for _ in range(3)) for _ in range(3000)]
+
+
+def test_rgb_to_8bits_is_the_nearest_cube_or_gray_entry():
+    for rgb in _samples():
+        nearest: int = min(_distance(color, rgb) for color in XTERM_256_PALETTE[16:])
+        assert _distance(XTERM_256_PALETTE[rgb_to_8bits(*rgb)], rgb) == nearest, rgb
+
+
+def test_rgb_to_4bits_is_the_nearest_system_color():
+    for rgb in _samples():
+        nearest: int = min(_distance(color, rgb) for color in SYSTEM_PALETTE)
+        assert _distance(SYSTEM_PALETTE[COLORS_4BITS.index(rgb_to_4bits(*rgb))], rgb) == nearest, rgb
+
+
+def test_rgb_to_8bits_rounds_the_gray_level():
+    assert rgb_to_8bits(20, 43, 68) == 236
+
+
+def test_palette_to_4bits_keeps_system_colors():
+    assert [palette_to_4bits(value) for value in range(16)] == list(COLORS_4BITS)
+
+
+def test_out_of_range_values_are_rejected():
+    with pytest.raises(ValueError):
+        rgb_to_8bits(256, 0, 0)
+    with pytest.raises(ValueError):
+        rgb_to_4bits(0, -1, 0)
+    with pytest.raises(ValueError):
+        palette_to_4bits(256)
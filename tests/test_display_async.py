@@ -0,0 +1,73 @@
+"""
+Menus displayed from a running event loop: coroutine actions, and menus changed while waiting for input.
+"""
+import asyncio
+from threading import Event
+from typing import Any
+
+from econsole.input_source import InputSource, ScriptedInput, use_input_source
+from econsole.menu_builder import AbstractMenu, MenuItem, MenuNavigator
+
+
+class _Menu(AbstractMenu):
+    def initialise(self):
+        self.completed: list[tuple[int, Any]] = []
+
+    def action_completed(self, menu_item: MenuItem, result: Any):
+        self.completed.append((menu_item.id, result))
+
+
+class _WaitingInput(InputSource):
+    """
+    A blocking source answering ``answer`` once ``release`` is set.
+    """
+
+    blocking: bool = True
+
+    def __init__(self, answer: str):
+        super().__init__()
+        self.answer: str = answer
+        self.release: Event = Event()
+
+    def _read(self, prompt: str) -> str:
+        assert self.release.wait(5)
+        return self.answer
+
+
+def test_coroutine_actions_are_awaited():
+    async def double(value: int) -> int:
+        await asyncio.sleep(0)
+        return value * 2
+
+    menu = _Menu("Async")
+    menu.add_menu_item(MenuItem(0, "Double", action=double, action_args=(21,)))
+    menu.add_menu_item(MenuItem(1, "Sync", action=lambda: "sync").set_as_exit_option())
+    with use_input_source(ScriptedInput(["0", "1"])):
+        asyncio.run(menu.display_async())
+
+    assert menu.completed == [(0, 42), (1, "sync")]
+
+
+def test_menus_changed_while_waiting_for_input_are_displayed_again(monkeypatch, capsys):
+    monkeypatch.setattr(MenuNavigator, "REFRESH_INTERVAL", 0.01)
+    menu = _Menu("Async")
+    menu.add_menu_item(MenuItem(0, "Quit").set_as_exit_option())
+    source = _WaitingInput("0")
+
+    async def add_item():
+        await asyncio.sleep(0.05)
+        menu.add_menu_item(MenuItem(1, "Added"))
+        await asyncio.sleep(0.05)
+        source.release.set()
+
+    async def display():
+        adding: asyncio.Task = asyncio.ensure_future(add_item())
+        with use_input_source(source):
+            await menu.display_async()
+        await adding
+
+    asyncio.run(display())
+    out: str = capsys.readouterr().out
+    assert out.count("0. Quit") == 2
+    assert "1. Added" in out
+    assert out.endswith(MenuNavigator.PROMPT)
@@ -0,0 +1,8 @@
+"""
+Importing econsole must not load prompt_toolkit, asyncio or the modules it only needs on use.
+"""
+from benchmarks.check_import_time import EXPECTATIONS, check
+
+
+def test_modules_do_not_load_heavy_dependencies():
+    assert check(list(EXPECTATIONS)) == []
@@ -0,0 +1,104 @@
+"""
+Input sources: scripted, streamed and replayed answers, transcripts, and menus and dialogs driven by them.
+"""
+import asyncio
+import io
+
+import pytest
+
+from econsole.dialogs import ConsoleDialogs
+from econsole.input_source import (
+    ConsoleInput,
+    ReplayError,
+    ReplayInput,
+    ScriptedInput,
+    StreamInput,
+    Transcript,
+    get_input_source,
+    read_input,
+    read_input_async,
+    use_input_source,
+)
+from econsole.menu_builder import AbstractMenu, MenuItem, MenuNavigator
+
+
+class _Menu(AbstractMenu):
+    def initialise(self):
+        self.add_menu_item(MenuItem(0, "Stay"))
+        self.add_menu_item(MenuItem(1, "Quit").set_as_exit_option())
+
+
+def test_scripted_answers_then_eof():
+    with use_input_source(ScriptedInput(["a", "b"])):
+        assert read_input("1? ") == "a"
+        assert read_input("2? ") == "b"
+        with pytest.raises(EOFError):
+            read_input("3? ")
+
+
+def test_stream_answers_without_line_endings():
+    with use_input_source(StreamInput(io.StringIO("a\r\nb\n"))):
+        assert [read_input("? "), read_input("? ")] == ["a", "b"]
+        with pytest.raises(EOFError):
+            read_input("? ")
+
+
+def test_answers_are_recorded_and_echoed():
+    transcript, echo = Transcript(), io.StringIO()
+    with use_input_source(ScriptedInput(["yes"], transcript, echo)):
+        read_input("Sure? ")
+    assert transcript.entries == [("Sure? ", "yes")]
+    assert echo.getvalue() == "Sure? yes\n"
+
+
+def test_transcripts_are_saved_as_json_lines(tmp_path):
+    path = tmp_path / "session.jsonl"
+    Transcript([("Name: ", "Ada"), ('Say "hi": ', "hi")]).save(path)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert ReplayInput.from_file(path).read("Name: ") == "Ada"
+    assert Transcript.load(path).answers == ["Ada", "hi"]
+
+
+def test_replay_checks_the_prompts():
+    recorded = Transcript([("Name: ", "Ada")])
+    with pytest.raises(ReplayError):
+        ReplayInput(recorded).read("Age: ")
+    assert ReplayInput(recorded, strict=False).read("Age: ") == "Ada"
+    source = ReplayInput(recorded)
+    source.read("Name: ")
+    with pytest.raises(EOFError):
+        source.read("Name: ")
+
+
+def test_sources_are_set_per_task():
+    async def answer(value: str) -> str:
+        with use_input_source(ScriptedInput([value])):
+            await asyncio.sleep(0)
+            return await read_input_async("? ")
+
+    async def answers() -> list[str]:
+        return await asyncio.gather(answer("a"), answer("b"))
+
+    assert asyncio.run(answers()) == ["a", "b"]
+    assert isinstance(get_input_source(), ConsoleInput)
+
+
+def test_dialogs_read_their_fallback_answers():
+    with use_input_source(ScriptedInput(["Ada", "n", "y"])):
+        assert ConsoleDialogs.show_input_dialog("Name", "Your name") == "Ada"
+        assert ConsoleDialogs.confirm_dialog("Sure", "Really") is False
+        assert ConsoleDialogs.confirm_dialog("Sure", "Really") is True
+
+
+def test_recorded_menu_sessions_replay(capsys):
+    transcript = Transcript()
+    with use_input_source(ScriptedInput(["0", "1"], transcript)):
+        MenuNavigator(_Menu("Main")).run()
+    assert transcript.entries == [(MenuNavigator.PROMPT, "0"), (MenuNavigator.PROMPT, "1")]
+    recorded: str = capsys.readouterr().out
+
+    navigator = MenuNavigator(_Menu("Main"))
+    with use_input_source(ReplayInput(transcript)):
+        navigator.run()
+    assert navigator.selected.id == 1
+    assert capsys.readouterr().out == recorded
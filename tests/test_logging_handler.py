@@ -0,0 +1,129 @@
+"""
+The threaded, colorizing logging handler: overflow policies, counters, draining and record copies.
+"""
+import io
+import logging
+from threading import Event, Thread
+
+import pytest
+
+from econsole.logging_handler import ColorHandler, OverflowPolicy
+
+
+class _BlockingStream(io.StringIO):
+    """
+    A StringIO whose first write waits until ``release`` is set, holding the writer thread.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.writing: Event = Event()
+        self.release: Event = Event()
+
+    def write(self, text: str) -> int:
+        self.writing.set()
+        self.release.wait(5)
+        return super().write(text)
+
+
+def _record(message: str, *args, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, args, None)
+
+
+def _fill(handler: ColorHandler, stream: _BlockingStream):
+    # The writer holds "1" in its blocked write, the queue holds "2" and "3"
+    handler.handle(_record("1"))
+    assert stream.writing.wait(5)
+    handler.handle(_record("2"))
+    handler.handle(_record("3"))
+
+
+@pytest.fixture(name="blocked")
+def _blocked():
+    handlers: list[ColorHandler] = []
+
+    def create(policy: OverflowPolicy) -> tuple[ColorHandler, _BlockingStream]:
+        stream = _BlockingStream()
+        handler = ColorHandler(stream, colorize=False, max_queue_size=2, overflow_policy=policy)
+        handlers.append(handler)
+        return handler, stream
+
+    yield create
+    for handler in handlers:
+        handler.stream.release.set()
+        handler.close()
+
+
+def test_drop_new_drops_the_incoming_record(blocked):
+    handler, stream = blocked(OverflowPolicy.DROP_NEW)
+    _fill(handler, stream)
+    handler.handle(_record("4"))
+    assert handler.dropped == 1
+    assert handler.max_queue_depth == 2
+
+    stream.release.set()
+    handler.flush()
+    assert stream.getvalue() == "1\n2\n3\n"
+    assert handler.written == 3
+
+
+def test_drop_oldest_drops_the_oldest_queued_record(blocked):
+    handler, stream = blocked(OverflowPolicy.DROP_OLDEST)
+    _fill(handler, stream)
+    handler.handle(_record("4"))
+    assert handler.dropped == 1
+
+    stream.release.set()
+    handler.flush()
+    assert stream.getvalue() == "1\n3\n4\n"
+
+
+def test_block_waits_for_room_in_the_queue(blocked):
+    handler, stream = blocked(OverflowPolicy.BLOCK)
+    _fill(handler, stream)
+    logging_thread = Thread(target=handler.handle, args=(_record("4"),))
+    logging_thread.start()
+    logging_thread.join(0.2)
+    assert logging_thread.is_alive()
+
+    stream.release.set()
+    logging_thread.join(5)
+    handler.flush()
+    assert stream.getvalue() == "1\n2\n3\n4\n"
+    assert handler.dropped == 0
+    assert handler.queue_depth == 0
+
+
+def test_close_writes_every_queued_record():
+    stream = io.StringIO()
+    handler = ColorHandler(stream, colorize=False, batch_size=3)
+    for index in range(10):
+        handler.handle(_record("line %d", index))
+    handler.close()
+    assert stream.getvalue() == "".join(f"line {index}\n" for index in range(10))
+    assert handler.written == 10
+
+
+def test_arguments_are_merged_on_a_copy_of_the_record():
+    stream = io.StringIO()
+    handler = ColorHandler(stream, colorize=False)
+    values: list[int] = [1]
+    record = _record("values %s", values)
+    handler.handle(record)
+    values.append(2)
+    handler.flush()
+    handler.close()
+
+    assert stream.getvalue() == "values [1]\n"
+    assert record.msg == "values %s"
+    assert record.args == (values,)
+
+
+def test_records_are_colored_by_level():
+    stream = io.StringIO()
+    handler = ColorHandler(stream, colorize=True)
+    handler.handle(_record("fine"))
+    handler.handle(_record("bad", level=logging.ERROR))
+    handler.handle(_record("custom", level=logging.INFO + 5))
+    handler.close()
+    assert stream.getvalue() == "\x1b[32mfine\x1b[0m\n\x1b[91mbad\x1b[0m\n\x1b[32mcustom\x1b[0m\n"
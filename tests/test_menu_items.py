@@ -0,0 +1,86 @@
+"""
+The id-indexed menu item store.
+"""
+import pytest
+
+from econsole.menu_builder import AbstractMenu, MenuItem, MenuItems
+
+
+class _Menu(AbstractMenu):
+    def initialise(self):
+        pass
+
+
+class _ListMenu(AbstractMenu):
+    def initialise(self):
+        self.menu_items = [MenuItem(7, "Seven"), MenuItem(8, "Eight")]
+
+
+def _items(*ids: int) -> MenuItems:
+    return MenuItems(MenuItem(id_, f"Item {id_}") for id_ in ids)
+
+
+def test_items_are_read_like_a_list():
+    items = _items(5, 3, 9)
+    assert len(items) == 3
+    assert [item.id for item in items] == [5, 3, 9]
+    assert items[1].id == 3
+    assert items.get(9) is items[2]
+    assert items.get(4) is None
+    assert items.index(MenuItem(3)) == 1
+    assert MenuItem(5) in items and MenuItem(4) not in items
+
+
+def test_duplicate_ids_are_rejected():
+    items = _items(1)
+    with pytest.raises(ValueError):
+        items.append(MenuItem(1, "Again"))
+
+
+def test_remove_shifts_the_following_positions():
+    items = _items(1, 2, 3)
+    items.remove(MenuItem(2))
+    assert items.index(MenuItem(3)) == 1
+    assert items.get(2) is None
+    with pytest.raises(ValueError):
+        items.remove(MenuItem(2))
+
+
+def test_changes_bump_the_version():
+    items = _items(1, 2)
+    changes = (
+        lambda: items.append(MenuItem(3)),
+        items[0].hide,
+        lambda: setattr(items[1], "description", "Renamed"),
+        lambda: items.remove(MenuItem(3)),
+        items.clear,
+    )
+    for change in changes:
+        version: int = items.version
+        change()
+        assert items.version > version
+    assert not items
+
+
+def test_removed_items_no_longer_touch_their_container():
+    items = _items(1)
+    item = items[0]
+    items.remove(item)
+    version: int = items.version
+    item.hide()
+    assert items.version == version
+
+
+def test_menu_items_assigned_as_a_list_are_wrapped():
+    menu = _ListMenu("List")
+    assert isinstance(menu.menu_items, MenuItems)
+    assert menu.menu_items.get(8).description == "Eight"
+    assert "1. Eight" in menu.render()
+
+
+def test_assigning_menu_items_renders_them_again():
+    menu = _Menu("Menu")
+    menu.add_menu_item(MenuItem(0, "Old"))
+    assert "Old" in menu._render_view(0, "")  # pylint: disable=protected-access
+    menu.menu_items = [MenuItem(0, "New")]
+    assert "New" in menu._render_view(0, "")  # pylint: disable=protected-access
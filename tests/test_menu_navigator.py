@@ -0,0 +1,73 @@
+"""
+Menu navigation from an explicit stack: entering, going back or home, cycles and exit options.
+"""
+from econsole.input_source import ScriptedInput, use_input_source
+from econsole.menu_builder import AbstractMenu, MenuItem, MenuNavigator
+
+
+class _Menu(AbstractMenu):
+    def initialise(self):
+        pass
+
+
+def _menus() -> tuple[_Menu, _Menu, _Menu]:
+    root, settings, display = _Menu("Main"), _Menu("Settings"), _Menu("Display")
+    root.add_menu_item(MenuItem(0, "Settings", menu=settings))
+    root.add_menu_item(MenuItem(1, "Quit", action=lambda: None).set_as_exit_option())
+    settings.add_menu_item(MenuItem(0, "Display", menu=display))
+    settings.add_menu_item(MenuItem(1, "Main", menu=root))
+    display.add_menu_item(MenuItem(0, "Done", menu=settings).set_as_exit_option())
+    return root, settings, display
+
+
+def test_enter_back_and_home():
+    root, settings, display = _menus()
+    navigator = MenuNavigator(root)
+    navigator.enter(settings)
+    navigator.enter(display)
+    assert navigator.breadcrumbs == ["Main", "Settings", "Display"]
+
+    navigator.back()
+    assert navigator.current is settings
+    navigator.enter(display)
+    navigator.home()
+    assert navigator.breadcrumbs == ["Main"]
+
+
+def test_back_never_leaves_the_top_menu():
+    root, _, _ = _menus()
+    navigator = MenuNavigator(root)
+    navigator.back()
+    assert navigator.current is root
+
+
+def test_entering_a_menu_on_the_stack_goes_back_to_it():
+    root, settings, display = _menus()
+    navigator = MenuNavigator(root)
+    navigator.enter(settings)
+    navigator.enter(display)
+    navigator.enter(root)
+    assert navigator.breadcrumbs == ["Main"]
+
+    navigator.enter(settings)
+    assert navigator.breadcrumbs == ["Main", "Settings"]
+
+
+def test_run_follows_the_answers_until_the_top_menu_is_left(capsys):
+    root, _, _ = _menus()
+    navigator = MenuNavigator(root)
+    with use_input_source(ScriptedInput(["0", "0", "b", "h", "1"])):
+        navigator.run()
+
+    assert navigator.current is None
+    assert navigator.selected is root.menu_items[1]
+    assert "Main > Settings > Display (b: back, h: home)" in capsys.readouterr().out
+
+
+def test_exit_option_submenu_leaves_its_parent_when_left():
+    root, settings, display = _menus()
+    navigator = MenuNavigator(root)
+    navigator.enter(settings)
+    navigator.enter(display, exit_parent=True)
+    navigator._leave()  # pylint: disable=protected-access
+    assert navigator.breadcrumbs == ["Main"]
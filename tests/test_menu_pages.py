@@ -0,0 +1,55 @@
+"""
+Menus displayed one page at a time.
+"""
+from econsole.input_source import ScriptedInput, use_input_source
+from econsole.menu_builder import AbstractMenu, MenuItem, MenuNavigator
+
+
+class _Menu(AbstractMenu):
+    def initialise(self):
+        for index in range(25):
+            self.add_menu_item(MenuItem(index, f"Item {index}"))
+
+
+def test_page_count_rounds_up():
+    assert _Menu("Pages", page_size=10).page_count == 3
+    assert _Menu("Pages", page_size=25).page_count == 1
+    assert _Menu("Pages").page_count == 1
+
+
+def test_pages_show_their_items_and_a_footer():
+    text: str = _Menu("Pages", page_size=10).render_page(2)
+    assert "20. Item 20" in text and "24. Item 24" in text
+    assert "19. Item 19" not in text
+    assert "Page 3/3 (n: next, p: previous, g <page>: go to page)" in text
+
+
+def test_hidden_items_keep_their_position():
+    menu = _Menu("Pages", page_size=10)
+    menu.hide_menu_item(12)
+    text: str = menu.render_page(1)
+    assert "12. Item 12" not in text
+    assert "13. Item 13" in text
+
+
+def test_page_commands_stay_within_the_pages(capsys):
+    menu = _Menu("Pages", page_size=10)
+    assert menu._page_command("n", 0) == 1  # pylint: disable=protected-access
+    assert menu._page_command("N", 2) == 2  # pylint: disable=protected-access
+    assert menu._page_command("p", 0) == 0  # pylint: disable=protected-access
+    assert menu._page_command("g 3", 0) == 2  # pylint: disable=protected-access
+    assert menu._page_command("g4", 1) == 1  # pylint: disable=protected-access
+    assert "Invalid page. Page 4 doesn't exist." in capsys.readouterr().out
+    assert menu._page_command("12", 0) is None  # pylint: disable=protected-access
+
+
+def test_items_of_other_pages_can_be_selected(capsys):
+    menu = _Menu("Pages", page_size=10)
+    menu.menu_items[23].set_as_exit_option()
+    navigator = MenuNavigator(menu)
+    with use_input_source(ScriptedInput(["n", "n", "23"])):
+        navigator.run()
+
+    assert navigator.selected is menu.menu_items[23]
+    out: str = capsys.readouterr().out
+    assert "Page 1/3" in out and "Page 2/3" in out and "Page 3/3" in out
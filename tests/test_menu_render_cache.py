@@ -0,0 +1,76 @@
+"""
+Rendered menus reused until the menu changes.
+"""
+from econsole.menu_builder import AbstractMenu, MenuItem
+
+
+class _Menu(AbstractMenu):
+    renders: int = 0
+
+    def initialise(self):
+        self.add_menu_item(MenuItem(0, "Zero"))
+        self.add_menu_item(MenuItem(1, "One"))
+
+    def render(self) -> str:
+        self.renders += 1
+        return super().render()
+
+
+def _view(menu: _Menu) -> str:
+    return menu._render_view(0, "")  # pylint: disable=protected-access
+
+
+def test_unchanged_menus_are_not_rendered_again():
+    menu = _Menu("Cached")
+    first: str = _view(menu)
+    assert _view(menu) is first
+    assert menu.renders == 1
+
+
+def test_item_changes_render_again():
+    menu = _Menu("Cached")
+    _view(menu)
+    menu.menu_items[0].description = "Nothing"
+    assert "0. Nothing" in _view(menu)
+    menu.hide_menu_item(1)
+    assert "1. One" not in _view(menu)
+    menu.add_menu_item(MenuItem(2, "Two"))
+    assert "2. Two" in _view(menu)
+    assert menu.renders == 4
+
+
+def test_menu_changes_render_again():
+    menu = _Menu("Cached")
+    _view(menu)
+    menu.title = "Renamed"
+    assert "Renamed" in _view(menu)
+    menu.default = 1
+    assert "Default value is: 1" in _view(menu)
+    menu.menu_items = [MenuItem(5, "Five")]
+    assert "0. Five" in _view(menu)
+    assert menu.renders == 4
+
+
+def test_changing_an_item_shared_by_two_menus_renders_both_again():
+    shared = MenuItem(9, "Shared")
+    first, second = _Menu("First"), _Menu("Second")
+    first.add_menu_item(shared)
+    second.add_menu_item(shared)
+    _view(first)
+    _view(second)
+    shared.hide()
+    assert "9. Shared" not in _view(first)
+    assert "9. Shared" not in _view(second)
+
+
+def test_update_menu_items_returning_false_keeps_the_cache():
+    menu = _Menu("Cached")
+    _view(menu)
+    menu._update_menu_items()  # pylint: disable=protected-access
+    _view(menu)
+    assert menu.renders == 1
+
+    menu.update_menu_items = lambda: None
+    menu._update_menu_items()  # pylint: disable=protected-access
+    _view(menu)
+    assert menu.renders == 2
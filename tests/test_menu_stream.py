@@ -0,0 +1,130 @@
+"""
+Menu items read page by page from sync and async providers.
+"""
+import asyncio
+from threading import Event
+
+import pytest
+
+from econsole.input_source import ScriptedInput, use_input_source
+from econsole.menu_builder import MenuItem, MenuNavigator
+from econsole.menu_stream import MenuItemStream, StreamingMenu
+
+
+def _items(count: int) -> list[MenuItem]:
+    return [MenuItem(index, f"Item {index}") for index in range(count)]
+
+
+def _loop_bound_provider(loop: asyncio.AbstractEventLoop, count: int):
+    async def provider():
+        for item in _items(count):
+            # Awaiting a future of another loop raises RuntimeError: ... attached to a different loop
+            ready: asyncio.Future = loop.create_future()
+            loop.call_soon(ready.set_result, None)
+            await ready
+            yield item
+
+    return provider
+
+
+def test_pages_are_read_on_demand_and_cached():
+    read: list[int] = []
+
+    def provider():
+        for item in _items(25):
+            read.append(item.id)
+            yield item
+
+    stream = MenuItemStream(provider, page_size=10, cached_pages=2, prefetch=False)
+    assert [item.id for item in stream.page(1)] == list(range(10, 20))
+    assert stream.total is None
+    assert [item.id for item in stream.page(2)] == list(range(20, 25))
+    assert stream.total == 25
+    assert stream.page(3) == []
+    assert stream.item(21).id == 21
+
+    # Page 0 was never cached: the factory is called again
+    read.clear()
+    assert stream.page(0)[0].id == 0
+    assert read == list(range(10))
+    stream.close()
+
+
+def test_one_shot_iterators_cannot_go_back():
+    stream = MenuItemStream(iter(_items(30)), page_size=10, cached_pages=2, prefetch=False)
+    stream.page(0)
+    stream.page(1)
+    stream.page(2)
+    with pytest.raises(LookupError):
+        stream.page(0)
+    with pytest.raises(IndexError):
+        stream.item(0)
+    stream.close()
+
+
+def test_async_provider_without_event_loop():
+    async def provider():
+        for item in _items(15):
+            yield item
+
+    stream = MenuItemStream(provider, page_size=10)
+    assert [item.id for item in stream.page(1)] == list(range(10, 15))
+    stream.close()
+
+
+def test_loop_bound_async_provider_is_read_on_the_running_loop():
+    async def read() -> list[int]:
+        stream = MenuItemStream(_loop_bound_provider(asyncio.get_running_loop(), 35), page_size=10)
+        ids: list[int] = [item.id for number in range(4) for item in await stream.page_async(number)]
+        with pytest.raises(RuntimeError):
+            # Page 0 is no longer cached after reading 3 more: reading it needs the loop
+            MenuItemStream(_loop_bound_provider(asyncio.get_running_loop(), 5), page_size=10).page(0)
+        stream.close()
+        return ids
+
+    assert asyncio.run(read()) == list(range(35))
+
+
+def test_display_async_reads_a_loop_bound_provider(capsys):
+    async def display() -> MenuItem:
+        items = _loop_bound_provider(asyncio.get_running_loop(), 30)
+
+        async def exit_options():
+            async for item in items():
+                yield item.set_as_exit_option()
+
+        menu = StreamingMenu("Stream", exit_options, page_size=10)
+        navigator = MenuNavigator(menu)
+        with use_input_source(ScriptedInput(["n", "15"])):
+            await navigator.run_async()
+        menu.close()
+        return navigator.selected
+
+    assert asyncio.run(display()).id == 15
+    assert "10. Item 10" in capsys.readouterr().out
+
+
+def test_display_async_does_not_block_the_loop_while_reading_pages():
+    released = Event()
+
+    def slow_provider():
+        for item in _items(10):
+            # Only set by a task of the loop displaying the menu
+            assert released.wait(2)
+            yield item.set_as_exit_option()
+
+    async def release():
+        await asyncio.sleep(0.01)
+        released.set()
+
+    async def display() -> MenuItem:
+        menu = StreamingMenu("Stream", slow_provider, page_size=10)
+        navigator = MenuNavigator(menu)
+        releasing = asyncio.ensure_future(release())
+        with use_input_source(ScriptedInput(["3"])):
+            await navigator.run_async()
+        await releasing
+        menu.close()
+        return navigator.selected
+
+    assert asyncio.run(display()).id == 3
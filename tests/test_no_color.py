@@ -0,0 +1,66 @@
+"""
+No-color mode: plain output when colors are disabled, for stdout or for the stream written to.
+"""
+import io
+
+import pytest
+
+from econsole.styles import ConsoleCharacters, Print
+from econsole.terminal import ColorDepth, ColorMode, TerminalProfile, get_terminal_profile, set_color_mode, set_terminal_profile
+
+
+@pytest.fixture(name="color_mode")
+def _color_mode(monkeypatch):
+    for name in ("NO_COLOR", "FORCE_COLOR"):
+        monkeypatch.delenv(name, raising=False)
+    previous: TerminalProfile = get_terminal_profile()
+    set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=ColorDepth.TRUECOLOR))
+    yield set_color_mode
+    set_color_mode(ColorMode.AUTO)
+    set_terminal_profile(previous)
+
+
+def test_style_calls_are_a_shared_no_op(color_mode):
+    color_mode(ColorMode.NEVER)
+    line = Print()
+    assert line.bold().set_fore_red().set_foreground_24bits(1, 2, 3) is line
+    assert line.add("x").add_styled("ab", foregrounds=[(1, 2, 3)]).render() == "x ab"
+    assert Print().bold().add("x").render_html() == "x"
+    assert ConsoleCharacters.set_bold() == ""
+
+
+def test_templates_are_plain(color_mode):
+    color_mode(ColorMode.NEVER)
+    template = Print().bold().placeholder("level").reset().add("done").compile()
+    assert template.template == "{level} done"
+    assert template.render(level="INFO") == "INFO done"
+
+
+def test_keep_styles_keeps_them_for_html(color_mode):
+    color_mode(ColorMode.NEVER)
+    line = Print(keep_styles=True).bold().add("x")
+    assert line.render() == "x"
+    assert line.render_html() == '<span style="font-weight:bold">x </span>'
+
+
+def test_print_checks_the_stream_written_to(color_mode):
+    color_mode(ColorMode.AUTO)
+    line = Print().bold().add("x")
+    template = Print().bold().placeholder("value").compile()
+    assert line.render() == "\x1b[1mx"
+    assert template.template == "\x1b[1m{value}"
+
+    # A StringIO is not a terminal
+    stream = io.StringIO()
+    line.print(stream)
+    Print.print_many([line], stream)
+    template.print(stream, value="y")
+    template.print_many([{"value": "z"}], stream)
+    assert stream.getvalue() == "x\nx\ny\nz\n"
+
+
+def test_always_writes_colors_to_any_stream(color_mode):
+    color_mode(ColorMode.ALWAYS)
+    stream = io.StringIO()
+    Print().bold().add("x").print(stream)
+    assert stream.getvalue() == "\x1b[1mx\n"
@@ -0,0 +1,75 @@
+"""
+Output buffers: the LINE, SIZE and INTERVAL flush policies and binary streams.
+"""
+import io
+from time import monotonic, sleep
+
+from econsole.output import FlushPolicy, OutputBuffer
+
+
+def _wait_for(stream: io.StringIO, timeout: float = 2) -> str:
+    deadline: float = monotonic() + timeout
+    while not stream.getvalue() and monotonic() < deadline:
+        sleep(0.005)
+    return stream.getvalue()
+
+
+def test_line_policy_flushes_on_newlines():
+    stream = io.StringIO()
+    buffer = OutputBuffer(stream)
+    buffer.write("a")
+    buffer.write("b")
+    assert stream.getvalue() == ""
+    buffer.write("c\n")
+    assert stream.getvalue() == "abc\n"
+
+
+def test_size_policy_flushes_past_the_threshold():
+    stream = io.StringIO()
+    buffer = OutputBuffer(stream, flush_policy=FlushPolicy.SIZE, size_threshold=4)
+    buffer.write("ab\n")
+    assert stream.getvalue() == ""
+    buffer.write("cd")
+    assert stream.getvalue() == "ab\ncd"
+    buffer.write("e")
+    assert stream.getvalue() == "ab\ncd"
+
+
+def test_interval_policy_flushes_from_a_timer():
+    stream = io.StringIO()
+    buffer = OutputBuffer(stream, flush_policy=FlushPolicy.INTERVAL, interval_in_seconds=0.05)
+    buffer.write("a")
+    buffer.write("b")
+    assert stream.getvalue() == ""
+    assert _wait_for(stream) == "ab"
+
+
+def test_interval_policy_flushes_late_writes_at_once():
+    stream = io.StringIO()
+    buffer = OutputBuffer(stream, flush_policy=FlushPolicy.INTERVAL, interval_in_seconds=0.01)
+    sleep(0.02)
+    buffer.write("a")
+    assert stream.getvalue() == "a"
+
+
+def test_flush_cancels_the_timer():
+    stream = io.StringIO()
+    buffer = OutputBuffer(stream, flush_policy=FlushPolicy.INTERVAL, interval_in_seconds=60)
+    with buffer:
+        buffer.write("a")
+        assert buffer._timer is not None  # pylint: disable=protected-access
+    assert stream.getvalue() == "a"
+    assert buffer._timer is None  # pylint: disable=protected-access
+
+
+def test_binary_streams_receive_encoded_text():
+    stream = io.BytesIO()
+    buffer = OutputBuffer(stream, encoding="latin-1")
+    buffer.write("é\n")
+    assert stream.getvalue() == "é\n".encode("latin-1")
+
+
+def test_default_stream_is_stdout(capsys):
+    buffer = OutputBuffer()
+    buffer.write("a\n")
+    assert capsys.readouterr().out == "a\n"
@@ -0,0 +1,51 @@
+"""
+Print chains compiled into format templates, and their output.
+"""
+import io
+
+import pytest
+
+from econsole.output import FlushPolicy, OutputBuffer
+from econsole.styles import Print, PrintTemplate
+
+pytestmark = pytest.mark.usefixtures("truecolor")
+
+
+def _template() -> PrintTemplate:
+    return Print().bold().placeholder("level").reset().add("{static}").placeholder("count", "03d").compile()
+
+
+def test_template_renders_like_the_chain():
+    expected: str = Print().bold().add("INFO").reset().add("{static}").add("007").render()
+    assert _template().render(level="INFO", count=7) == expected
+
+
+def test_template_prints_one_line():
+    stream = io.StringIO()
+    _template().print(stream, level="INFO", count=7)
+    assert stream.getvalue() == "\x1b[1mINFO \x1b[0m{static} 007\n"
+
+
+def test_template_prints_many_lines_in_one_write():
+    buffer = OutputBuffer(io.StringIO(), flush_policy=FlushPolicy.SIZE, size_threshold=1 << 20)
+    _template().print_many([{"level": "A", "count": 1}, {"level": "B", "count": 2}], buffer)
+    assert buffer._parts == ["\x1b[1mA \x1b[0m{static} 001\n\x1b[1mB \x1b[0m{static} 002\n"]  # pylint: disable=protected-access
+
+
+def test_nothing_is_written_without_records():
+    stream = io.StringIO()
+    _template().print_many([], stream)
+    Print.print_many([], stream)
+    assert stream.getvalue() == ""
+
+
+def test_print_writes_to_binary_streams():
+    stream = io.BytesIO()
+    Print().add("héllo").print(stream)
+    assert stream.getvalue() == "héllo\n".encode()
+
+
+def test_print_defaults_to_stdout(capsys):
+    Print().add("a").print()
+    Print.print_many([Print().add("b"), Print().add("c")])
+    assert capsys.readouterr().out == "a\nb\nc\n"
@@ -0,0 +1,77 @@
+"""
+Cell-level diff rendering of the double-buffered screen.
+"""
+import pytest
+
+from econsole import screen
+from econsole.colors import Color4Bits
+from econsole.screen import ScreenBuffer
+from econsole.sequences import CLEAR_ALL, RESET, cursor_at
+from econsole.sgr import CellAttributes
+from econsole.terminal import ColorDepth, TerminalProfile, get_terminal_profile, set_terminal_profile
+
+
+@pytest.fixture(name="truecolor", autouse=True)
+def _truecolor():
+    previous: TerminalProfile = get_terminal_profile()
+    set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=ColorDepth.TRUECOLOR))
+    yield
+    set_terminal_profile(previous)
+
+
+def test_first_frame_is_a_full_repaint():
+    buffer = ScreenBuffer(10, 2)
+    buffer.write(1, 2, "hi")
+    assert buffer.render() == RESET + CLEAR_ALL + cursor_at(2, 3) + "hi"
+
+
+def test_unchanged_frame_renders_nothing():
+    buffer = ScreenBuffer(10, 2)
+    buffer.write(0, 0, "hello", foreground=Color4Bits.RED)
+    buffer.render()
+    buffer.write(0, 0, "hello", foreground=Color4Bits.RED)
+    assert buffer.render() == ""
+
+
+def test_only_changed_cells_are_rendered():
+    buffer = ScreenBuffer(10, 2)
+    buffer.write(0, 0, "hello")
+    buffer.render()
+    buffer.write(0, 4, "!", attributes=CellAttributes.BOLD)
+    assert buffer.render() == cursor_at(1, 5) + "\x1b[1m!" + RESET
+
+
+def test_short_gaps_are_rewritten_instead_of_moving_the_cursor():
+    buffer = ScreenBuffer(10, 1)
+    buffer.write(0, 0, "abcdef")
+    buffer.render()
+    buffer.write(0, 0, "x")
+    buffer.write(0, 3, "y")
+    assert buffer.render() == cursor_at(1, 1) + "xbcy"
+
+
+def test_text_is_clipped_to_the_screen():
+    buffer = ScreenBuffer(4, 1)
+    buffer.write(0, -1, "abcdef")
+    buffer.write(3, 0, "outside")
+    assert buffer.render().endswith(cursor_at(1, 1) + "bcde")
+
+
+def test_resize_repaints_everything():
+    buffer = ScreenBuffer(4, 1)
+    buffer.write(0, 0, "ab")
+    buffer.render()
+    buffer.resize(6, 2)
+    buffer.write(1, 0, "cd")
+    assert buffer.render() == RESET + CLEAR_ALL + cursor_at(2, 1) + "cd"
+
+
+def test_parameters_no_longer_on_screen_are_evicted():
+    buffer = ScreenBuffer(2, 1)
+    for value in range(70_000):
+        buffer.write(0, 0, "x", foreground=(value >> 16, (value >> 8) & 255, value & 255))
+        buffer.render()
+    assert len(buffer._parameters) <= screen._MAX_PARAMETERS + 1  # pylint: disable=protected-access
+
+    buffer.write(0, 1, "y", foreground=(1, 2, 3))
+    assert buffer.render() == cursor_at(1, 2) + "\x1b[38;2;1;2;3my" + RESET
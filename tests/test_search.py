@@ -0,0 +1,42 @@
+"""
+Type-to-filter search of menu item descriptions.
+"""
+from econsole.search import TrigramIndex
+
+DESCRIPTIONS: list[str] = ["Reload config", "Load file", "Upload", "Save settings", "Quit"]
+
+
+def test_word_starts_come_first_then_position_order():
+    assert TrigramIndex(DESCRIPTIONS).search("load") == [1, 0, 2]
+
+
+def test_search_is_case_insensitive():
+    assert TrigramIndex(DESCRIPTIONS).search("LOAD", limit=1) == [1]
+
+
+def test_accept_filters_positions():
+    assert TrigramIndex(DESCRIPTIONS).search("load", accept=lambda position: position != 1) == [0, 2]
+
+
+def test_typos_fall_back_to_similar_words():
+    assert TrigramIndex(DESCRIPTIONS).search("setings") == [3]
+
+
+def test_blank_and_unknown_queries_find_nothing():
+    index = TrigramIndex(DESCRIPTIONS)
+    assert index.search(" ") == []
+    assert index.search("zzz") == []
+
+
+def test_refined_query_sees_added_texts():
+    index = TrigramIndex(DESCRIPTIONS)
+    assert index.search("lo") == [1, 0, 2]
+    index.add("Log out")
+    assert index.search("log") == [5]
+
+
+def test_typos_do_not_drop_short_query_words():
+    index = TrigramIndex(f"item number {number}" for number in range(30))
+    assert index.search("number 2", limit=8) == [2, 20, 21, 22, 23, 24, 25, 26]
+    assert index.search("numbr 2") == [2, 12, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29]
+    assert index.search("number 2", limit=15)[-1] == 12
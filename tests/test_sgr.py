@@ -0,0 +1,69 @@
+"""
+Minimal SGR transitions between attribute states, and downsampling to the terminal's color depth.
+"""
+import pytest
+
+from econsole import sgr
+from econsole.sequences import RESET
+from econsole.terminal import ColorDepth, TerminalProfile, get_terminal_profile, set_terminal_profile
+
+
+def _state(**parameters: str) -> tuple[str | None, ...]:
+    slots: list[str | None] = list(sgr.DEFAULT_STATE)
+    for name, parameter in parameters.items():
+        slots[getattr(sgr, name.upper())] = parameter
+    return tuple(slots)
+
+
+@pytest.fixture(name="color_depth")
+def _color_depth():
+    previous: TerminalProfile = get_terminal_profile()
+
+    def set_color_depth(depth: ColorDepth):
+        set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=depth))
+
+    yield set_color_depth
+    set_terminal_profile(previous)
+
+
+def test_transition_to_same_state_is_empty():
+    state = _state(weight="1", foreground="91")
+    assert sgr.transition(state, state) == ""
+
+
+def test_transition_to_default_state_is_reset():
+    assert sgr.transition(_state(weight="1", foreground="91"), sgr.DEFAULT_STATE) == RESET
+
+
+def test_transition_merges_parameters_in_one_sequence():
+    assert sgr.transition(sgr.DEFAULT_STATE, _state(weight="1", foreground="91")) == "\x1b[1;91m"
+
+
+def test_transition_only_resets_changed_slots():
+    assert sgr.transition(_state(weight="1", foreground="91"), _state(foreground="91")) == "\x1b[22m"
+    assert sgr.transition(_state(foreground="91"), _state(foreground="38;5;208")) == "\x1b[38;5;208m"
+
+
+def test_transition_uses_full_reset_when_shorter():
+    current = _state(weight="1", italic="3", underline="4", swap="7", strike="9")
+    assert sgr.transition(current, _state(weight="1")) == "\x1b[0;1m"
+
+
+@pytest.mark.parametrize(
+    "depth, expected",
+    [
+        (ColorDepth.TRUECOLOR, "38;2;10;200;30"),
+        (ColorDepth.COLORS_256, "38;5;40"),
+        (ColorDepth.COLORS_16, "32"),
+    ],
+)
+def test_terminal_state_downsamples_colors(color_depth, depth, expected):
+    color_depth(depth)
+    state = _state(weight="1", foreground="38;2;10;200;30")
+    assert sgr.terminal_state(state) == _state(weight="1", foreground=expected)
+
+
+def test_terminal_state_keeps_4bits_colors(color_depth):
+    color_depth(ColorDepth.COLORS_16)
+    state = _state(foreground="91", background="44")
+    assert sgr.terminal_state(state) == state
@@ -0,0 +1,41 @@
+"""
+Print chains as spans, rendered to ANSI, plain text and HTML.
+"""
+import pytest
+
+from econsole.styles import Print
+from econsole.terminal import ColorDepth, TerminalProfile, set_terminal_profile
+
+pytestmark = pytest.mark.usefixtures("truecolor")
+
+
+def test_style_changes_are_merged_in_one_sequence():
+    line = Print().bold().set_fore_red().add("a").reset_bold().add("b").reset().add("c")
+    assert line.render() == "\x1b[1;91ma \x1b[22mb \x1b[0mc"
+
+
+def test_unused_style_changes_are_not_rendered():
+    assert Print().bold().reset().add("a").set_fore_red().set_fore_blue().add("b").reset().render() == "a \x1b[94mb \x1b[0m"
+
+
+def test_plain_rendering_drops_styles():
+    assert Print().bold().add("a").set_foreground_24bits(1, 2, 3).add("b").render_plain() == "a b"
+
+
+def test_html_rendering():
+    line = Print().add("<a>").bold().set_fore_red().add("b").reset().set_background_8bits(196).italic().add("c")
+    assert line.render_html() == (
+        '&lt;a&gt; <span style="color:#ff0000;font-weight:bold">b </span>' '<span style="background-color:#ff0000;font-style:italic">c </span>'
+    )
+
+
+def test_html_rendering_keeps_requested_colors():
+    set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=ColorDepth.COLORS_16))
+    line = Print().set_foreground_24bits(10, 200, 30).add("x")
+    assert line.render() == "\x1b[32mx"
+    assert line.render_html() == '<span style="color:#0ac81e">x </span>'
+
+
+def test_html_rendering_of_swapped_and_decorated_text():
+    line = Print().swap_colors().underline().strike_out().add("x")
+    assert line.render_html() == '<span style="color:white;background-color:black;text-decoration:underline line-through">x </span>'
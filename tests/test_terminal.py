@@ -0,0 +1,85 @@
+"""
+Terminal capability detection and the encoders selected from the terminal's color depth.
+"""
+import pytest
+
+from econsole import terminal
+from econsole.colors import Color4Bits
+from econsole.sgr import foreground_palette, foreground_rgb
+from econsole.styles import ConsoleCharacters
+from econsole.terminal import ColorDepth, ColorMode, TerminalProfile, get_terminal_profile, set_color_mode, set_terminal_profile
+
+
+@pytest.fixture(name="color_depth")
+def _color_depth():
+    previous: TerminalProfile = get_terminal_profile()
+
+    def set_color_depth(depth: ColorDepth):
+        set_terminal_profile(TerminalProfile(is_tty=True, is_interactive=True, color_depth=depth))
+
+    set_color_mode(ColorMode.ALWAYS)
+    yield set_color_depth
+    set_color_mode(ColorMode.AUTO)
+    set_terminal_profile(previous)
+
+
+@pytest.fixture(name="environment")
+def _environment(monkeypatch):
+    for name in ("NO_COLOR", "FORCE_COLOR", "COLORTERM", "WT_SESSION"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("TERM", "xterm-256color")
+    return monkeypatch
+
+
+def test_no_color_disables_colors(environment):
+    environment.setenv("NO_COLOR", "1")
+    assert terminal._detect_color_depth(True) is ColorDepth.NONE  # pylint: disable=protected-access
+
+
+def test_colors_need_a_tty(environment):
+    assert terminal._detect_color_depth(False) is ColorDepth.NONE  # pylint: disable=protected-access
+    assert terminal._detect_color_depth(True) is ColorDepth.COLORS_256  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("value", ["1", "true", "3"])
+def test_force_color_enables_colors_without_a_tty(environment, value):
+    environment.setenv("FORCE_COLOR", value)
+    assert terminal._detect_color_depth(False) is ColorDepth.COLORS_256  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("value", ["0", "false"])
+def test_force_color_0_disables_colors(environment, value):
+    environment.setenv("FORCE_COLOR", value)
+    assert terminal._detect_color_depth(True) is ColorDepth.NONE  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "depth, foreground, palette",
+    [
+        (ColorDepth.TRUECOLOR, "\x1b[38;2;10;200;30m", "\x1b[38;5;208m"),
+        (ColorDepth.COLORS_256, "\x1b[38;5;40m", "\x1b[38;5;208m"),
+        (ColorDepth.COLORS_16, "\x1b[32m", "\x1b[33m"),
+    ],
+)
+def test_console_characters_downsample_colors(color_depth, depth, foreground, palette):
+    color_depth(depth)
+    assert ConsoleCharacters.set_foreground_32bits(10, 200, 30) == foreground
+    assert ConsoleCharacters.set_foreground_8bits(208) == palette
+    assert ConsoleCharacters.set_foreground_4bits(Color4Bits.RED) == "\x1b[91m"
+
+
+def test_imported_encoders_follow_the_color_depth(color_depth):
+    # Names imported before a profile change keep encoding for the current color depth
+    color_depth(ColorDepth.TRUECOLOR)
+    assert foreground_rgb(10, 200, 30) == "38;2;10;200;30"
+    color_depth(ColorDepth.COLORS_16)
+    assert foreground_rgb(10, 200, 30) == "32"
+    assert foreground_palette(208) == "33"
+
+
+def test_downsampled_palette_entries_are_validated(color_depth):
+    color_depth(ColorDepth.COLORS_16)
+    with pytest.raises(ValueError):
+        ConsoleCharacters.set_foreground_8bits(256)
+    with pytest.raises(ValueError):
+        foreground_palette(-1)
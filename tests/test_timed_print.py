@@ -0,0 +1,79 @@
+"""
+Character by character printing, scheduled against a monotonic clock.
+"""
+import asyncio
+import io
+
+from econsole import styles
+from econsole.styles import timed_print, timed_print_async
+
+
+class _Writes(io.StringIO):
+    """
+    A StringIO recording every write.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return super().write(text)
+
+
+class _Clock:
+    """
+    Replaces the monotonic clock and sleep of the styles module: sleeping takes ``overhead`` more than asked.
+    """
+
+    def __init__(self, overhead: float = 0):
+        self.now: float = 0
+        self.overhead: float = overhead
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds + self.overhead
+
+
+def test_one_character_per_delay(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(styles, "monotonic", clock.monotonic)
+    monkeypatch.setattr(styles, "sleep", clock.sleep)
+    stream = _Writes()
+    timed_print("abc", 0.1, output=stream)
+    assert stream.writes == ["a", "b", "c", "\n"]
+    assert abs(clock.now - 0.2) < 1e-9
+
+
+def test_late_characters_are_written_together(monkeypatch):
+    clock = _Clock(overhead=0.25)
+    monkeypatch.setattr(styles, "monotonic", clock.monotonic)
+    monkeypatch.setattr(styles, "sleep", clock.sleep)
+    stream = _Writes()
+    timed_print("abcdefgh", 0.1, newline=False, output=stream)
+    assert "".join(stream.writes) == "abcdefgh"
+    assert stream.writes[:2] == ["a", "bcd"]
+    # Without catching up, 8 characters would take 7 * 0.35 seconds
+    assert clock.now < 1.5
+
+
+def test_no_delay_writes_at_once():
+    stream = _Writes()
+    timed_print("abc", 0, newline=False, output=stream)
+    assert stream.writes == ["abc"]
+
+
+def test_async_lines_are_animated_concurrently():
+    stream = _Writes()
+
+    async def animate():
+        await asyncio.gather(timed_print_async("abc", 0.02, False, stream), timed_print_async("xyz", 0.02, False, stream))
+
+    asyncio.run(animate())
+    # Interleaved: each line waits on the loop between its characters
+    assert sorted(stream.writes[:2]) == ["a", "x"]
+    assert sorted("".join(stream.writes)) == sorted("abcxyz")
+    assert "".join(stream.writes).index("c") > "".join(stream.writes).index("x")
@@ -0,0 +1,47 @@
+"""
+Display width of styled strings and padding.
+"""
+import pytest
+
+from econsole.width import pad, strip_ansi, visible_width, visible_widths
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("plain", "plain"),
+        ("\x1b[1;31mred\x1b[0m", "red"),
+        ("\x1b[38;2;1;2;3mrgb\x1b[39m", "rgb"),
+        ("\x1b[2Kline", "line"),
+        ("\x1bMup", "up"),
+    ],
+)
+def test_strip_ansi(text, expected):
+    assert strip_ansi(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", 0),
+        ("abc", 3),
+        ("\x1b[1mabc\x1b[0m", 3),
+        ("日本", 4),
+        ("é", 1),
+        ("é", 1),
+        ("a​b", 2),
+        ("\x1b[32m表\x1b[0mx", 3),
+    ],
+)
+def test_visible_width(text, expected):
+    assert visible_width(text) == expected
+
+
+def test_visible_widths():
+    assert visible_widths(["a", "\x1b[1mbc\x1b[0m", "日"]) == [1, 2, 2]
+
+
+def test_pad_counts_visible_columns():
+    assert pad("\x1b[1mab\x1b[0m", 4) == "\x1b[1mab\x1b[0m  "
+    assert pad("日", 3, align_right=True, fill_char=".") == ".日"
+    assert pad("abcdef", 3) == "abcdef"